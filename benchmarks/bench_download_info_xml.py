@@ -0,0 +1,49 @@
+import timeit
+import xml.dom.minidom as minidom
+
+from yandex_music.utils.download_info_xml import DIRECT_LINK_FIELDS, parse_download_info_xml
+
+NUMBER = 2000
+REPEAT = 5
+
+DOWNLOAD_INFO_XML = (
+    b'<?xml version="1.0" encoding="utf-8"?>\n'
+    b'<download-info><host>s123vla.storage.yandex.net</host>'
+    b'<path>/rmusic/U2FsdGVkX1_nGYZpb4zEzE9oQm0XWgq3hy2C4tkyMTMb6wqFJjmT2p_4a7VwmF2RAZJhhfn9O2Te7Bq0cTzQ/'
+    b'8b9f3a1fc1e0b5ec2f3a4d7e06f0d9d5b1e48d7e9a8c1e2f3a4b5c6d7e8f9a0b</path>'
+    b'<ts>0005f1a2b3c4d5e6</ts><region>-1</region>'
+    b'<s>2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9c0d1e2f3a</s>'
+    b'</download-info>'
+)
+
+
+def legacy_parse(xml):
+    def get_text_node_data(elements):
+        for element in elements:
+            for node in element.childNodes:
+                if node.nodeType == node.TEXT_NODE:
+                    return node.data
+
+        return None
+
+    doc = minidom.parseString(xml)  # noqa: S318
+    return {name: get_text_node_data(doc.getElementsByTagName(name)) for name in DIRECT_LINK_FIELDS}
+
+
+def measure(func):
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+class TestDownloadInfoXmlBenchmark:
+    def test_parse(self):
+        assert parse_download_info_xml(DOWNLOAD_INFO_XML) == legacy_parse(DOWNLOAD_INFO_XML)
+
+        legacy_time = measure(lambda: legacy_parse(DOWNLOAD_INFO_XML))
+        expat_time = measure(lambda: parse_download_info_xml(DOWNLOAD_INFO_XML))
+
+        print(
+            f'\nminidom: {legacy_time * 1e6:.1f} us; expat: {expat_time * 1e6:.1f} us; '
+            f'speedup: x{legacy_time / expat_time:.1f}'
+        )
+
+        assert expat_time < legacy_time
@@ -0,0 +1,57 @@
+import json
+import keyword
+import re
+import timeit
+
+from yandex_music.utils.request import Request
+
+COPIES = 10
+REPEAT = 5
+
+legacy_reserved_names = list(keyword.kwlist) + ['ClientType']
+
+
+def legacy_object_hook(obj):
+    if not isinstance(obj, dict):
+        return obj
+
+    cleaned_object = {}
+    for key, value in obj.items():
+        key = key.replace('-', '_')
+        key = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', key)
+        key = re.sub('([a-z0-9])([A-Z])', r'\1_\2', key).lower()
+
+        if key in legacy_reserved_names:
+            key += '_'
+
+        if len(key) and key[0].isdigit():
+            key = '_' + key
+
+        cleaned_object.update({key: value})
+
+    return cleaned_object
+
+
+def measure(payload, object_hook):
+    return min(timeit.repeat(lambda: json.loads(payload, object_hook=object_hook), number=1, repeat=REPEAT))
+
+
+class TestObjectHookBenchmark:
+    def test_parse(self, track, album, artist, playlist):
+        items = [track.to_dict(True), album.to_dict(True), artist.to_dict(True), playlist.to_dict(True)]
+        payload = json.dumps({'result': items * COPIES})
+
+        assert json.loads(payload, object_hook=Request._object_hook) == json.loads(
+            payload, object_hook=legacy_object_hook
+        )
+
+        legacy_time = measure(payload, legacy_object_hook)
+        cached_time = measure(payload, Request._object_hook)
+
+        print(
+            f'\npayload: {len(payload) / 1024:.0f} KiB; '
+            f'legacy: {legacy_time * 1000:.1f} ms; cached: {cached_time * 1000:.1f} ms; '
+            f'speedup: x{legacy_time / cached_time:.1f}'
+        )
+
+        assert cached_time < legacy_time
@@ -0,0 +1,55 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+COPIES = 20
+
+ROOT = Path(__file__).parent.parent
+
+MEASURE = """
+import json
+import sys
+import tracemalloc
+
+from yandex_music import Track
+
+data = json.load(sys.stdin)
+
+tracemalloc.start()
+tracks = Track.de_list(data, None)
+size, _ = tracemalloc.get_traced_memory()
+print(size)
+"""
+
+
+def measure(payload, slots):
+    env = {**os.environ, 'YANDEX_MUSIC_SLOTS': '1' if slots else ''}
+    command = [sys.executable, '-c', MEASURE]
+    result = subprocess.run(
+        command,  # noqa: S603
+        input=payload,
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=ROOT,
+        check=True,
+    )
+    return int(result.stdout)
+
+
+class TestSlotsBenchmark:
+    def test_memory(self, track):
+        payload = json.dumps([track.to_dict()] * COPIES)
+
+        dict_size = measure(payload, slots=False)
+        slots_size = measure(payload, slots=True)
+
+        print(
+            f'\ntracks: {COPIES}; '
+            f'__dict__: {dict_size / 1024:.0f} KiB; __slots__: {slots_size / 1024:.0f} KiB; '
+            f'saved: {(1 - slots_size / dict_size) * 100:.0f}%'
+        )
+
+        assert slots_size < dict_size
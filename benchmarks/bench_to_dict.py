@@ -0,0 +1,69 @@
+import json
+import timeit
+
+from yandex_music import Playlist, Queue
+from yandex_music.base import YandexMusicModel, reserved_names
+from yandex_music.utils.lazy import LazyValue
+
+COPIES = 20
+REPEAT = 5
+
+
+def legacy_to_dict(obj, for_request=False):
+    def parse(val):
+        if isinstance(val, LazyValue):
+            return parse(val.materialize())
+        if isinstance(val, YandexMusicModel):
+            return legacy_to_dict(val, for_request)
+        if isinstance(val, list):
+            return [parse(it) for it in val]
+        if isinstance(val, dict):
+            return {key: parse(value) for key, value in val.items()}
+        return val
+
+    data = obj._get_state()
+    data.pop('client', None)
+    data.pop('_id_attrs', None)
+
+    if for_request:
+        for k, v in data.copy().items():
+            camel_case = ''.join(word.title() for word in k.split('_'))
+            camel_case = camel_case[0].lower() + camel_case[1:]
+
+            data.pop(k)
+            data.update({camel_case: v})
+    else:
+        for k, v in data.copy().items():
+            if k.lower() in reserved_names:
+                data.pop(k)
+                data.update({f'{k}_': v})
+
+    return parse(data)
+
+
+def measure(func):
+    return min(timeit.repeat(func, number=1, repeat=REPEAT))
+
+
+class TestToDictBenchmark:
+    def test_to_dict(self, playlist, track_short, context, track_id):
+        big_playlist = Playlist.de_json({**playlist.to_dict(), 'tracks': [track_short.to_dict()] * COPIES * 10}, None)
+        big_queue = Queue(context, [track_id] * COPIES * 10, 0, 'modified', 'id', 'from')
+
+        for obj in (big_playlist, big_queue):
+            for for_request in (False, True):
+                expected = legacy_to_dict(obj, for_request)
+                assert obj.to_dict(for_request) == expected
+                assert json.dumps(obj.to_dict(for_request)) == json.dumps(expected)
+
+            legacy_time = measure(lambda: legacy_to_dict(obj, True))  # noqa: B023
+            fast_time = measure(lambda: obj.to_dict(True))  # noqa: B023
+            bytes_time = measure(lambda: obj.to_json_bytes(True))  # noqa: B023
+
+            print(
+                f'\n{type(obj).__name__}: legacy: {legacy_time * 1000:.1f} ms; '
+                f'to_dict: {fast_time * 1000:.1f} ms; to_json_bytes: {bytes_time * 1000:.1f} ms; '
+                f'speedup: x{legacy_time / fast_time:.1f}'
+            )
+
+            assert fast_time < legacy_time
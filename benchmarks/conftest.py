@@ -0,0 +1,7 @@
+"""Общие фикстуры для бенчмарков.
+
+Бенчмарки используют те же модели, что и тесты, поэтому фикстуры берутся из `tests/conftest.py`.
+
+Запуск: `python -m pytest benchmarks/bench_*.py -s`.
+"""
+from tests.conftest import *  # noqa: F403
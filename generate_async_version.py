@@ -1,11 +1,256 @@
 #!/usr/bin/env python3
 """Generate async version of client.py and request.py."""
+import re
 import subprocess
 
 DISCLAIMER = "# THIS IS AUTO GENERATED COPY OF client.py. DON'T EDIT IN BY HANDS #"
 DISCLAIMER = f'{"#" * len(DISCLAIMER)}\n{DISCLAIMER}\n{"#" * len(DISCLAIMER)}\n\n'
 
-REQUEST_METHODS = ('_request_wrapper', 'get', 'post', 'retrieve', 'download')
+REQUEST_METHODS = (
+    '_request_wrapper',
+    'get',
+    '_get_cached',
+    'post',
+    'retrieve',
+    'download',
+    'close',
+    '_probe_range',
+    '_download_segment',
+)
+
+ASYNC_SESSION_METHODS = '''    @property
+    def session(self) -> aiohttp.ClientSession:
+        """:obj:`aiohttp.ClientSession`: Сессия с пулом соединений, создаётся при первом обращении.
+
+        Note:
+            Сессия привязана к циклу событий, в котором была создана. При смене цикла прежняя сессия закрывается
+            и создаётся новая.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._close_stale_session()
+            self._session = self._create_session()
+            self._session_loop = loop
+
+        return self._session
+
+    def _close_stale_session(self) -> None:
+        """Закрытие сессии, созданной в другом цикле событий.
+
+        Note:
+            Если цикл сессии ещё работает в другом потоке, сессия закрывается в нём. Иначе дождаться закрытия
+            соединений нельзя: сессия отсоединяется от пула, а пул закрывается сразу. Соединения пула закрытого
+            цикла только отбрасываются.
+        """
+        session, loop = self._session, self._session_loop
+        self._session = self._session_loop = None
+        if session is None or session.closed or loop is None:
+            return
+
+        if loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+
+        connector = session.connector
+        session.detach()
+        if connector is not None:
+            # публичный close() возвращает объект для ожидания, а в чужом цикле его не дождаться
+            connector._close()
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Создание сессии с пулом соединений согласно настройкам.
+
+        Note:
+            Cookie между запросами не сохраняются, как и при выполнении каждого запроса в отдельной сессии.
+
+        Returns:
+            :obj:`aiohttp.ClientSession`: Новая сессия.
+        """
+        keepalive: Dict[str, Any] = {'force_close': True}
+        if self.keepalive_timeout:
+            keepalive = {'keepalive_timeout': self.keepalive_timeout}
+
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_limit,
+            limit_per_host=self.pool_limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            **keepalive,
+        )
+
+        return aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+
+'''
+
+ASYNC_STREAM_WRAPPER = '''    async def _stream_wrapper(
+        self,
+        *args: Any,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        on_response: Optional[ResponseCallback] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[bytes]:
+        """Обёртка над запросом библиотеки `aiohttp` с чтением тела ответа по частям.
+
+        Note:
+            Заголовки, таймаут и исключения такие же, как в :func:`_request_wrapper`. Таймаут ограничивает ожидание
+            каждой части ответа, а не всего ответа.
+
+        Args:
+            *args: Произвольные аргументы для `aiohttp.request`.
+            chunk_size (:obj:`int`, optional): Размер читаемой за раз части тела ответа в байтах.
+            on_response (:obj:`Callable`, optional): Функция, вызываемая со статус кодом и заголовками успешного
+                ответа до чтения его тела.
+            **kwargs: Произвольные ключевые аргументы для `aiohttp.request`.
+
+        Yields:
+            :obj:`bytes`: Очередная часть тела ответа.
+
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        if 'headers' not in kwargs:
+            kwargs['headers'] = {}
+
+        kwargs['headers']['User-Agent'] = USER_AGENT
+
+        if kwargs['timeout'] is default_timeout:
+            kwargs['timeout'] = self._timeout
+
+        kwargs['timeout'] = aiohttp.ClientTimeout(sock_connect=kwargs['timeout'], sock_read=kwargs['timeout'])
+
+        try:
+            async with self.session.request(*args, **kwargs) as resp:
+                if not 200 <= resp.status <= 299:
+                    raise self._status_error(resp.status, await resp.content.read())
+
+                if on_response is not None:
+                    on_response(resp.status, resp.headers)
+
+                async for chunk in resp.content.iter_chunked(chunk_size):
+                    yield chunk
+        except asyncio.TimeoutError as e:
+            raise TimedOutError from e
+        except aiohttp.ClientError as e:
+            raise NetworkError(e) from e
+
+'''
+
+ASYNC_DOWNLOAD_SEGMENTS = '''    async def _download_segments(
+        self,
+        url: str,
+        filename: str,
+        offset: int,
+        size: int,
+        segments: int,
+        timeout: 'TimeoutType' = default_timeout,
+        **kwargs: Any,
+    ) -> None:
+        """Параллельная загрузка частей содержимого в отдельных задачах.
+
+        Note:
+            Файл заранее расширяется до полного размера, а каждая часть записывается на своё место. Ошибка одной части
+            не прерывает загрузку остальных. После их завершения файл обрезается до начала первой незагруженной части,
+            чтобы загрузку можно было продолжить. При отмене загрузки незавершённые части отменяются.
+
+        Args:
+            url (:obj:`str`): Адрес для запроса.
+            filename (:obj:`str`): Путь и(или) название файла вместе с расширением.
+            offset (:obj:`int`): Размер уже загруженного начала файла.
+            size (:obj:`int`): Полный размер содержимого.
+            segments (:obj:`int`): Количество частей.
+            timeout (:obj:`int` | :obj:`float`): Используется как время ожидания каждой части ответа от сервера
+                вместо указанного при создании пула.
+            **kwargs: Произвольные ключевые аргументы для `aiohttp.request`.
+
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        if offset > size:
+            offset = 0
+
+        async with aiofiles.open(filename, 'r+b' if offset else 'wb') as f:
+            await f.truncate(size)
+
+        bounds = self._split_range(offset, size, segments)
+        tasks = [
+            asyncio.ensure_future(self._download_segment(url, filename, start, end, timeout=timeout, **kwargs))
+            for start, end in bounds
+        ]
+
+        try:
+            # как и в синхронной версии, ошибка одной части не прерывает загрузку остальных
+            await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            # незавершённые части остаются, только если загрузку отменили снаружи
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            failed = [(start, task) for (start, _), task in zip(bounds, tasks) if task.cancelled() or task.exception()]
+            if failed:
+                # в файле остаётся только непрерывно загруженное начало
+                async with aiofiles.open(filename, 'r+b') as f:
+                    await f.truncate(failed[0][0])
+
+        if failed:
+            # у отменённой части exception() сам вызывает asyncio.CancelledError
+            exception = failed[0][1].exception()
+            raise exception
+
+'''
+
+
+ASYNC_POST_IDS = '''    async def _post_ids(
+        self, url: str, params: 'JSONType', object_type: str, ids: IdsType, *args: Any, **kwargs: Any
+    ) -> 'JSONType':
+        """Получение списка объектов по идентификаторам, при необходимости частями.
+
+        Note:
+            Список длиннее `list_chunk_size` делится на части, которые запрашиваются параллельно в отдельных задачах
+            не более чем по `list_concurrency` одновременно. Результаты объединяются в порядке частей. При ошибке
+            одной из частей остальные задачи отменяются. Ответ в виде байтов всегда запрашивается одним запросом.
+
+        Args:
+            url (:obj:`str`): Адрес для запроса.
+            params (:obj:`dict`): Остальные параметры запроса.
+            object_type (:obj:`str`): Тип объекта.
+            ids (:obj:`str` | :obj:`int` | :obj:`list` из :obj:`str` | :obj:`list` из :obj:`int`): Уникальный
+                идентификатор объекта или объектов.
+            *args: Произвольные аргументы (будут переданы в запрос).
+            **kwargs: Произвольные именованные аргументы (будут переданы в запрос).
+
+        Returns:
+            :obj:`list`: Объекты из ответов API.
+
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        chunk_size = self.list_chunk_size
+        if not isinstance(ids, list) or len(ids) <= chunk_size or current_response_format.get() == BYTES_FORMAT:
+            return await self._request.post(url, {**params, f'{object_type}-ids': ids}, *args, **kwargs)
+
+        chunks = [ids[position : position + chunk_size] for position in range(0, len(ids), chunk_size)]
+        semaphore = asyncio.Semaphore(self.list_concurrency)
+
+        async def post(chunk: List[Union[str, int]]) -> 'JSONType':
+            # каждая задача работает в копии контекста, формат ответа меняется только для неё
+            current_response_format.set(MODEL_FORMAT)
+            async with semaphore:
+                return await self._request.post(url, {**params, f'{object_type}-ids': chunk}, *args, **kwargs)
+
+        tasks = [asyncio.ensure_future(post(chunk)) for chunk in chunks]
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            # после ошибки одной из частей остальные уже не нужны; у завершённых задач отмена ничего не делает
+            for task in tasks:
+                task.cancel()
+
+        result = [item for chunk_result in results if isinstance(chunk_result, list) for item in chunk_result]
+        raise_if_raw(JSON_FORMAT, result)
+
+        return result
+
+'''
 
 
 def gen_request(output_request_filename: str) -> None:
@@ -14,12 +259,27 @@ def gen_request(output_request_filename: str) -> None:
         code = f.read()
 
     code = code.replace('import requests', 'import asyncio\nimport aiohttp\nimport aiofiles')
+    code = code.replace('from http.cookiejar import DefaultCookiePolicy\n', '')
+    code = code.replace('from requests.adapters import HTTPAdapter\n', '')
+    code = code.replace('from concurrent.futures import ThreadPoolExecutor\n', '')
+
+    # connection pool
+    code = re.sub(
+        r'    @property\n    def session\(self\).*?\n(?=    def close)', ASYNC_SESSION_METHODS, code, flags=re.DOTALL
+    )
+    code = code.replace('requests.Session', 'aiohttp.ClientSession')
+    code = code.replace(
+        'self._session: Optional[aiohttp.ClientSession] = None',
+        'self._session: Optional[aiohttp.ClientSession] = None\n'
+        f'{" " * 8}self._session_loop: Optional[asyncio.AbstractEventLoop] = None',
+    )
+    code = code.replace('self._session.close()', 'await self._session.close()')
 
     # order make sense
     code = code.replace('resp.content', 'content')
     code = code.replace(
-        'resp = requests.request(*args, **kwargs)',
-        f'async with aiohttp.request(*args, **kwargs) as _resp:\n{" " * 16}resp = _resp\n{" " * 16}content = await resp.content.read()',  # noqa: E501
+        'resp = self.session.request(*args, **kwargs)',
+        f'async with self.session.request(*args, **kwargs) as _resp:\n{" " * 16}resp = _resp\n{" " * 16}content = await resp.content.read()',  # noqa: E501
     )
 
     code = code.replace('except requests.Timeout', 'except asyncio.TimeoutError')
@@ -36,9 +296,26 @@ def gen_request(output_request_filename: str) -> None:
         f"kwargs['timeout'] = aiohttp.ClientTimeout(total=self._timeout)\n{' ' * 8}else:\n{' ' * 12}kwargs['timeout'] = aiohttp.ClientTimeout(total=kwargs['timeout'])",  # noqa: E501
     )
 
+    # streaming
+    code = code.replace('Iterator', 'AsyncIterator')
+    code = code.replace('def stream(', 'async def stream(')
+    code = re.sub(r'for (\w+) in chunks:', r'async for \1 in chunks:', code)
+    code = code.replace('chunks.close()', 'await chunks.aclose()')
+    code = re.sub(
+        r'    def _stream_wrapper\(.*?\n(?=    def _status_error)', ASYNC_STREAM_WRAPPER, code, flags=re.DOTALL
+    )
+
     # download method
     code = code.replace('with open', 'async with aiofiles.open')
     code = code.replace('f.write', 'await f.write')
+    code = code.replace('f.seek', 'await f.seek')
+    code = code.replace('self._download_segments(', 'await self._download_segments(')
+    code = re.sub(
+        r'    async def _download_segments\(.*?\n(?=    async def download)',
+        ASYNC_DOWNLOAD_SEGMENTS,
+        code,
+        flags=re.DOTALL,
+    )
 
     # docs
     code = code.replace('`requests`', '`aiohttp`')
@@ -49,6 +326,35 @@ def gen_request(output_request_filename: str) -> None:
         f.write(code)
 
 
+# загрузчик треков нужен только асинхронному клиенту
+ASYNC_CLIENT_TRACK_LOADER = (
+    (
+        'from yandex_music.utils.sign_request import get_sign_request\n',
+        'from yandex_music.utils.track_loader import TrackLoader\n',
+    ),
+    (
+        '        list_concurrency (:obj:`int`): Максимальное количество одновременно выполняемых запросов частей'
+        ' списка.\n',
+        '        track_loader (:obj:`yandex_music.utils.track_loader.TrackLoader`): Загрузчик, объединяющий'
+        ' одновременные\n'
+        '            запросы отдельных треков, или :obj:`None`, если он выключен.\n',
+    ),
+    (
+        '            списка объектов.\n',
+        '        track_loader (:obj:`yandex_music.utils.track_loader.TrackLoader`, optional): Загрузчик треков.\n'
+        '            Одновременные вызовы `fetch_track_async` у треков объединяются в один запрос.\n',
+    ),
+    (
+        '        list_concurrency: int = LIST_CONCURRENCY,\n',
+        '        track_loader: Optional[TrackLoader] = None,\n',
+    ),
+    (
+        '        self.list_concurrency = list_concurrency\n',
+        '        self.track_loader = track_loader\n',
+    ),
+)
+
+
 def gen_client(output_client_filename: str) -> None:
     """Generate async version of client.py."""
     with open('yandex_music/client.py', 'r', encoding='UTF-8') as f:
@@ -58,22 +364,39 @@ def gen_client(output_client_filename: str) -> None:
     code = code.replace(
         'from yandex_music.utils.request import Request', 'from yandex_music.utils.request_async import Request'
     )
+    code = code.replace('import contextvars\n', 'import asyncio\n')
+    code = code.replace('from concurrent.futures import ThreadPoolExecutor\n', '')
 
     code = code.replace('def wrapper', 'async def wrapper')
     code = code.replace('result = method(', 'result = await method(')
     code = code.replace('@log\n    def', '@log\n    async def')
     code = code.replace('self.account_status', 'await self.account_status')
 
+    # context manager
+    code = code.replace('def __enter__', 'async def __aenter__')
+    code = code.replace('def __exit__', 'async def __aexit__')
+    code = code.replace('def close', 'async def close')
+    code = code.replace('self.close()', 'await self.close()')
+
     for method in REQUEST_METHODS:
         code = code.replace(f'self._request.{method}', f'await self._request.{method}')
-    for method in ('_like_action', '_dislike_action', '_get_list', '_get_likes'):
+    for method in ('_like_action', '_dislike_action', '_get_list', '_get_likes', '_post_ids'):
         code = code.replace(f'def {method}', f'async def {method}')
         code = code.replace(f'self.{method}(', f'await self.{method}(')
+    code = re.sub(r'    async def _post_ids\(.*?\n(?=    async def _get_list)', ASYNC_POST_IDS, code, flags=re.DOTALL)
+
+    # streaming
+    code = code.replace('Iterator', 'AsyncIterator')
+    code = re.sub(r'def (\w+_stream)\(', r'async def \1(', code)
+    code = code.replace('for item in self._request.stream(', 'async for item in self._request.stream(')
 
     # specific cases
     code = code.replace('self.users_playlists_change(', 'await self.users_playlists_change(')
     code = code.replace('self.rotor_station_feedback(', 'await self.rotor_station_feedback(')
-    code = code.replace('return DownloadInfo.de_list', 'return await DownloadInfo.de_list_async')
+    code = code.replace('= DownloadInfo.de_list(', '= await DownloadInfo.de_list_async(')
+    code = code.replace('DownloadInfo.get_direct_links(', 'await DownloadInfo.get_direct_links_async(')
+    for anchor, addition in ASYNC_CLIENT_TRACK_LOADER:
+        code = code.replace(anchor, anchor + addition, 1)
 
     code = DISCLAIMER + code
     with open(output_client_filename, 'w', encoding='UTF-8') as f:
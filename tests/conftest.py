@@ -1,3 +1,6 @@
+import asyncio
+import threading
+
 import pytest
 
 from yandex_music import (
@@ -105,6 +108,8 @@ from yandex_music import (
     VideoSupplement,
     Vinyl,
 )
+from yandex_music.utils.request import Request
+from yandex_music.utils.request_async import Request as RequestAsync
 
 from . import (
     TestAccount,
@@ -1369,3 +1374,69 @@ def history_tab_item(history_tab_context, history_track):
 @pytest.fixture(scope='session')
 def history_tab(history_tab_item):
     return HistoryTab('2026-01-23', [history_tab_item])
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    class FakeClock:
+        def __init__(self):
+            self.now = 1000.0
+
+        def monotonic(self):
+            return self.now
+
+        def time(self):
+            return self.now
+
+    clock = FakeClock()
+
+    def patch(module):
+        monkeypatch.setattr(module, 'time', clock)
+        return clock
+
+    return patch
+
+
+@pytest.fixture
+def fake_post(monkeypatch):
+    class FakePost:
+        def __init__(self):
+            self.requests = []
+            self.error = None
+            self.handler = self.entities
+            self._lock = threading.Lock()
+
+        @property
+        def ids(self):
+            return [ids for _, ids in self.requests]
+
+        @staticmethod
+        def entities(object_type, ids):
+            # API не возвращает несуществующие объекты
+            return [{'id': str(i).split(':')[0], 'title': f'title {i}'} for i in ids if not str(i).startswith('404')]
+
+        def __call__(self, data):
+            object_type, ids = next((key[: -len('-ids')], value) for key, value in data.items() if key.endswith('-ids'))
+            with self._lock:
+                self.requests.append((object_type, ids))
+
+            if self.error is not None:
+                raise self.error
+
+            return self.handler(object_type, ids if isinstance(ids, list) else str(ids).split(','))
+
+    fake = FakePost()
+
+    def post(_, url, data=None, *args, **kwargs):
+        return fake(data)
+
+    async def post_async(_, url, data=None, *args, **kwargs):
+        result = fake(data)
+        # как и настоящий запрос, отдаёт управление циклу событий
+        await asyncio.sleep(0)
+        return result
+
+    monkeypatch.setattr(Request, 'post', post)
+    monkeypatch.setattr(RequestAsync, 'post', post_async)
+
+    return fake
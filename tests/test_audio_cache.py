@@ -0,0 +1,152 @@
+import asyncio
+import os
+
+import pytest
+
+from yandex_music import Client, ClientAsync, Track
+from yandex_music.utils.audio_cache import PART_SUFFIX, AudioCache
+from yandex_music.utils.request import Request
+from yandex_music.utils.request_async import Request as RequestAsync
+
+DOWNLOAD_INFO_XML = (
+    b'<download-info><host>s1.storage.yandex.net</host><path>/rmusic/track</path>'
+    b'<ts>0005c7d8</ts><s>6bc8b6c3</s></download-info>'
+)
+
+
+class TestAudioCache:
+    body = bytes(range(256)) * 40
+    download_info_data = [
+        {
+            'codec': 'mp3',
+            'bitrate_in_kbps': 192,
+            'gain': False,
+            'preview': False,
+            'download_info_url': 'https://storage.mds.yandex.net/info',
+            'direct': False,
+        }
+    ]
+
+    @pytest.fixture(autouse=True)
+    def fake_api(self, monkeypatch):
+        self.requests = []
+
+        def get(_, url, *args, **kwargs):
+            self.requests.append(url)
+            return self.download_info_data
+
+        def retrieve(_, url, *args, **kwargs):
+            self.requests.append(url)
+            return DOWNLOAD_INFO_XML if url.startswith('https://storage.mds') else self.body
+
+        def retrieve_stream(_, url, chunk_size, *args, **kwargs):
+            self.requests.append(url)
+            for position in range(0, len(self.body), chunk_size):
+                yield self.body[position : position + chunk_size]
+
+        def download(_, url, filename, *args, **kwargs):
+            self.requests.append(url)
+            with open(filename, 'wb') as f:
+                f.write(self.body)
+
+        async def get_async(*args, **kwargs):
+            return get(*args, **kwargs)
+
+        async def retrieve_async(*args, **kwargs):
+            return retrieve(*args, **kwargs)
+
+        async def retrieve_stream_async(*args, **kwargs):
+            for chunk in retrieve_stream(*args, **kwargs):
+                yield chunk
+
+        monkeypatch.setattr(Request, 'get', get)
+        monkeypatch.setattr(Request, 'retrieve', retrieve)
+        monkeypatch.setattr(Request, 'retrieve_stream', retrieve_stream)
+        monkeypatch.setattr(Request, 'download', download)
+        monkeypatch.setattr(RequestAsync, 'get', get_async)
+        monkeypatch.setattr(RequestAsync, 'retrieve', retrieve_async)
+        monkeypatch.setattr(RequestAsync, 'retrieve_stream', retrieve_stream_async)
+
+    def test_put_and_read(self, tmp_path):
+        cache = AudioCache(str(tmp_path))
+        assert cache.read(1, 'mp3', 192) is None
+
+        cache.put(1, 'mp3', 192, self.body)
+
+        # идентификатор альбома не учитывается
+        assert cache.read('1:2', 'mp3', 192) == self.body
+        assert cache.read(1, 'mp3', 192)[100:200] == self.body[100:200]
+        assert b''.join(cache.iter_chunks(1, 'mp3', 192, chunk_size=1000)) == self.body
+        assert cache.read(1, 'mp3', 320) is None
+        assert cache.size == len(self.body)
+
+        cache.put(2, 'mp3', 192, b'')
+        assert cache.read(2, 'mp3', 192) == b''
+
+    def test_eviction(self, tmp_path):
+        cache = AudioCache(str(tmp_path), max_size=len(self.body) * 2)
+        for track_id in (1, 2):
+            cache.put(track_id, 'mp3', 192, self.body)
+
+        cache.get(1, 'mp3', 192)
+        cache.put(3, 'mp3', 192, self.body)
+
+        assert cache.get(1, 'mp3', 192) is not None
+        assert cache.get(2, 'mp3', 192) is None
+        assert cache.size == len(self.body) * 2
+
+        # после перезапуска учитываются файлы в папке
+        assert AudioCache(str(tmp_path)).size == len(self.body) * 2
+
+    def test_failed_write_not_cached(self, tmp_path):
+        cache = AudioCache(str(tmp_path))
+
+        with pytest.raises(ValueError), cache.writer(1, 'mp3', 192) as f:
+            f.write(self.body[:100])
+            raise ValueError
+
+        assert cache.get(1, 'mp3', 192) is None
+        assert not [name for _, _, names in os.walk(tmp_path) for name in names if name.endswith(PART_SUFFIX)]
+
+    def test_track_download(self, tmp_path):
+        client = Client(audio_cache=AudioCache(str(tmp_path / 'cache')))
+
+        Track(1, client=client).download(str(tmp_path / 'first.mp3'))
+        assert len(self.requests) == 3
+
+        Track(1, client=client).download(str(tmp_path / 'second.mp3'))
+        assert (tmp_path / 'second.mp3').read_bytes() == self.body
+        assert len(self.requests) == 3
+
+    def test_track_download_bytes_and_stream(self, tmp_path):
+        client = Client(audio_cache=AudioCache(str(tmp_path)))
+
+        assert Track(1, client=client).download_bytes() == self.body
+        assert len(self.requests) == 3
+
+        assert b''.join(Track(1, client=client).stream(chunk_size=1000)) == self.body
+        assert Track(1, client=client).download_bytes() == self.body
+        assert len(self.requests) == 3
+
+    def test_unfinished_stream_not_cached(self, tmp_path):
+        client = Client(audio_cache=AudioCache(str(tmp_path)))
+
+        chunks = Track(1, client=client).stream(chunk_size=1000)
+        next(chunks)
+        chunks.close()
+        assert client.audio_cache.size == 0
+
+        assert b''.join(Track(1, client=client).stream(chunk_size=1000)) == self.body
+        assert client.audio_cache.size == len(self.body)
+
+    def test_async(self, tmp_path):
+        client = ClientAsync(audio_cache=AudioCache(str(tmp_path)))
+
+        async def stream_and_read():
+            chunks = [chunk async for chunk in Track(1, client=client).stream_async(chunk_size=1000)]
+            return b''.join(chunks), await Track(1, client=client).download_bytes_async()
+
+        streamed, data = asyncio.run(stream_and_read())
+
+        assert streamed == data == self.body
+        assert len(self.requests) == 3
@@ -0,0 +1,42 @@
+import json
+
+from yandex_music import Client, Cover, Experiments, Track
+
+
+class TestYandexMusicModel:
+    data = {'type': 'pic', 'uri': 'avatars.yandex.net/%%', 'unknown_field': True}
+
+    def test_cleanup_data(self, client):
+        data = self.data.copy()
+
+        assert Cover.cleanup_data(data, client) == {'type': 'pic', 'uri': 'avatars.yandex.net/%%'}
+        assert data == self.data
+
+    def test_field_names_per_class(self):
+        assert 'uri' in Cover._get_field_names()
+        assert Cover._get_field_names() is Cover._get_field_names()
+        assert 'uri' not in Track._get_field_names()
+
+    def test_report_unknown_fields(self, monkeypatch):
+        reported = []
+        monkeypatch.setattr(Cover, 'report_unknown_fields_callback', lambda klass, data: reported.append(data))
+
+        Cover.cleanup_data(self.data, Client(report_unknown_fields=True))
+        Cover.cleanup_data(self.data, Client())
+
+        assert reported == [{'unknown_field': True}]
+
+    def test_to_dict_keys(self):
+        track = Track(id=1, title='title', real_id='1')
+        experiments = Experiments(first='1', **{'from': '2'}, last='3')
+
+        assert list(experiments.to_dict()) == ['first', 'last', 'from_']
+        assert track.to_dict(for_request=True)['realId'] == '1'
+        assert 'client' not in track.to_dict() and '_id_attrs' not in track.to_dict(for_request=True)
+        assert Track._get_key_map(True) is Track._get_key_map(True)
+        # атрибуты экземпляров не попадают в общее для класса соответствие
+        assert 'first' not in Experiments._get_key_map(False)
+
+    def test_to_json_bytes(self, track):
+        assert json.loads(track.to_json_bytes()) == track.to_dict()
+        assert json.loads(track.to_json_bytes(for_request=True)) == json.loads(track.to_json(for_request=True))
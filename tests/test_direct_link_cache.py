@@ -0,0 +1,169 @@
+import asyncio
+
+import pytest
+
+from yandex_music import Client, ClientAsync
+from yandex_music.exceptions import NetworkError
+from yandex_music.utils import direct_link_cache
+from yandex_music.utils.direct_link_cache import DirectLinkCache
+from yandex_music.utils.request import Request
+from yandex_music.utils.request_async import Request as RequestAsync
+
+DOWNLOAD_INFO_XML = (
+    b'<download-info><host>s1.storage.yandex.net</host><path>/rmusic/track</path>'
+    b'<ts>0005c7d8</ts><s>6bc8b6c3</s></download-info>'
+)
+
+
+class TestDirectLinkCache:
+    download_info_data = [
+        {
+            'codec': 'mp3',
+            'bitrate_in_kbps': bitrate,
+            'gain': False,
+            'preview': False,
+            'download_info_url': f'https://storage.mds.yandex.net/info/{bitrate}',
+            'direct': False,
+        }
+        for bitrate in (192, 320)
+    ]
+
+    @pytest.fixture(autouse=True)
+    def fake_api(self, monkeypatch, fake_clock):
+        self.clock = fake_clock(direct_link_cache)
+        self.requests = []
+
+        def get(_, url, *args, **kwargs):
+            self.requests.append(url)
+            return self.download_info_data
+
+        def retrieve(_, url, *args, **kwargs):
+            self.requests.append(url)
+            return DOWNLOAD_INFO_XML
+
+        async def get_async(*args, **kwargs):
+            return get(*args, **kwargs)
+
+        async def retrieve_async(*args, **kwargs):
+            return retrieve(*args, **kwargs)
+
+        monkeypatch.setattr(Request, 'get', get)
+        monkeypatch.setattr(Request, 'retrieve', retrieve)
+        monkeypatch.setattr(RequestAsync, 'get', get_async)
+        monkeypatch.setattr(RequestAsync, 'retrieve', retrieve_async)
+
+    def test_expiry(self):
+        cache = DirectLinkCache(download_info_ttl=60, direct_link_ttl=300, refresh_margin=10)
+        cache.set_download_info(1, [])
+        expires_at = cache.set_direct_link(1, 'mp3', 320, 'link')
+
+        assert expires_at == 1300
+        assert cache.get_download_info('1') == []
+        assert cache.get_direct_link('1', 'mp3', 320) == ('link', 1300)
+        assert cache.get_direct_link('1', 'mp3', 192) is None
+
+        # запись устаревает заранее, за refresh_margin секунд до истечения срока
+        self.clock.now = 1050
+        assert cache.get_download_info(1) is None
+        assert cache.get_direct_link(1, 'mp3', 320) is not None
+
+        self.clock.now = 1290
+        assert cache.get_direct_link(1, 'mp3', 320) is None
+        assert len(cache) == 0
+
+    def test_max_size(self):
+        cache = DirectLinkCache(max_size=2)
+        for track_id in (1, 2):
+            cache.set_direct_link(track_id, 'mp3', 320, f'link/{track_id}')
+
+        cache.get_direct_link(1, 'mp3', 320)
+        cache.set_direct_link(3, 'mp3', 320, 'link/3')
+
+        assert cache.get_direct_link(1, 'mp3', 320) == ('link/1', self.clock.now + cache.direct_link_ttl)
+        assert cache.get_direct_link(2, 'mp3', 320) is None
+
+    def test_tracks_download_info(self):
+        client = Client(direct_link_cache=DirectLinkCache())
+
+        download_info = client.tracks_download_info(1, get_direct_links=True)
+        assert client.tracks_download_info('1', get_direct_links=True) == download_info
+        assert len(self.requests) == 3
+
+        # информация о загрузке устарела, а прямые ссылки ещё нет: повторно запрашивается только она
+        self.clock.now += 55
+        renewed = client.tracks_download_info(1, get_direct_links=True)
+
+        assert renewed is not download_info
+        assert [info.direct_link for info in renewed] == [info.direct_link for info in download_info]
+        assert len(self.requests) == 4
+
+        # прямые ссылки скоро истекут, поэтому получаются заново
+        self.clock.now += 250
+        client.tracks_download_info(1, get_direct_links=True)
+        assert len(self.requests) == 7
+
+    def test_direct_link_expires_on_object(self):
+        client = Client(direct_link_cache=DirectLinkCache())
+        download_info = client.tracks_download_info(1)[0]
+
+        download_info.get_direct_link()
+        download_info.get_direct_link()
+        assert self.requests.count(download_info.download_info_url) == 1
+
+        self.clock.now += 295
+        download_info.get_direct_link()
+        assert self.requests.count(download_info.download_info_url) == 2
+
+    def test_download_retry_invalidates_link(self, monkeypatch, tmp_path):
+        client = Client(direct_link_cache=DirectLinkCache())
+        download_info = client.tracks_download_info(1)[0]
+        failures = [NetworkError('Gone')]
+
+        def download(_, url, filename, resume=False, segments=1):
+            if failures:
+                error = failures.pop()
+                raise error
+
+        monkeypatch.setattr(Request, 'download', download)
+        download_info.download(str(tmp_path / 'track.mp3'))
+
+        assert self.requests.count(download_info.download_info_url) == 2
+
+    def test_shared_between_clients(self):
+        cache = DirectLinkCache()
+        first, second = Client(direct_link_cache=cache), Client(direct_link_cache=cache)
+
+        first.tracks_download_info(1, get_direct_links=True)
+        download_info = second.tracks_download_info(1, get_direct_links=True)
+
+        assert all(info.client is second for info in download_info)
+        assert len(self.requests) == 3
+
+    def test_to_dict_excludes_cache_attributes(self):
+        client = Client(direct_link_cache=DirectLinkCache())
+        download_info = client.tracks_download_info(1, get_direct_links=True)[0]
+
+        assert download_info.track_id == '1'
+        assert set(download_info.to_dict()) == {*self.download_info_data[0], 'direct_link'}
+
+    def test_async(self):
+        client = ClientAsync(direct_link_cache=DirectLinkCache())
+
+        async def get_twice():
+            first = await client.tracks_download_info(1, get_direct_links=True)
+            self.clock.now += 55
+            second = await client.tracks_download_info(1, get_direct_links=True)
+            return first, second
+
+        first, second = asyncio.run(get_twice())
+
+        assert [info.direct_link for info in first] == [info.direct_link for info in second]
+        assert len(self.requests) == 4
+
+    def test_without_cache(self):
+        client = Client()
+
+        client.tracks_download_info(1, get_direct_links=True)
+        client.tracks_download_info(1, get_direct_links=True)
+
+        assert len(self.requests) == 6
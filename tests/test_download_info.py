@@ -1,6 +1,20 @@
+import asyncio
+import threading
+from hashlib import md5
+
 import pytest
 
 from yandex_music import DownloadInfo
+from yandex_music.download_info import SIGN_SALT
+from yandex_music.exceptions import YandexMusicError
+from yandex_music.utils.download_info_xml import parse_download_info_xml
+from yandex_music.utils.request import Request
+
+DOWNLOAD_INFO_XML = (
+    b'<?xml version="1.0" encoding="utf-8"?>\n'
+    b'<download-info><host>s1.storage.yandex.net</host><path>/rmusic/U2FsdGVk/track</path>'
+    b'<ts>0005c7d8</ts><region>-1</region><s>6bc8b6c3</s></download-info>'
+)
 
 
 @pytest.fixture(scope='class')
@@ -86,3 +100,87 @@ class TestDownloadInfo:
         assert a is not b
 
         assert a == c
+
+    def test_de_list_direct_links_concurrently(self, client, monkeypatch):
+        data = [
+            {
+                'codec': self.codec,
+                'bitrate_in_kbps': bitrate,
+                'gain': self.gain,
+                'preview': self.preview,
+                'download_info_url': self.download_info_url,
+                'direct': self.direct,
+            }
+            for bitrate in (64, 128, 192, 320)
+        ]
+        # все варианты должны одновременно дождаться друг друга, иначе барьер сломается по таймауту
+        barrier = threading.Barrier(len(data), timeout=5)
+
+        def get_direct_link(info):
+            barrier.wait()
+            info.direct_link = f'link/{info.bitrate_in_kbps}'
+            return info.direct_link
+
+        monkeypatch.setattr(DownloadInfo, 'get_direct_link', get_direct_link)
+        download_infos = DownloadInfo.de_list(data, client, get_direct_links=True)
+
+        assert [info.direct_link for info in download_infos] == ['link/64', 'link/128', 'link/192', 'link/320']
+
+    def test_de_list_async_direct_links_concurrently(self, client, monkeypatch):
+        data = [
+            {
+                'codec': self.codec,
+                'bitrate_in_kbps': bitrate,
+                'gain': self.gain,
+                'preview': self.preview,
+                'download_info_url': self.download_info_url,
+                'direct': self.direct,
+            }
+            for bitrate in (64, 128, 192, 320)
+        ]
+        active = []
+        max_active = []
+
+        async def get_direct_link_async(info):
+            active.append(info)
+            max_active.append(len(active))
+            await asyncio.sleep(0)
+            active.remove(info)
+            info.direct_link = f'link/{info.bitrate_in_kbps}'
+            return info.direct_link
+
+        monkeypatch.setattr(DownloadInfo, 'get_direct_link_async', get_direct_link_async)
+        download_infos = asyncio.run(DownloadInfo.de_list_async(data, client, get_direct_links=True))
+
+        assert max(max_active) == len(data)
+        assert [info.direct_link for info in download_infos] == ['link/64', 'link/128', 'link/192', 'link/320']
+
+    def test_get_direct_link(self, client, monkeypatch):
+        monkeypatch.setattr(Request, 'retrieve', lambda *_: DOWNLOAD_INFO_XML)
+        download_info = DownloadInfo(
+            self.codec, self.bitrate_in_kbps, self.gain, self.preview, self.download_info_url, self.direct, client
+        )
+
+        sign = md5((SIGN_SALT + 'rmusic/U2FsdGVk/track' + '6bc8b6c3').encode('UTF-8')).hexdigest()  # noqa: S324
+        expected = f'https://s1.storage.yandex.net/get-mp3/{sign}/0005c7d8/rmusic/U2FsdGVk/track'
+
+        assert download_info.get_direct_link() == expected
+        assert download_info.direct_link == expected
+
+    def test_parse_download_info_xml(self):
+        xml = b'<download-info><host>a<b>c</b>d</host><path>/p</path><path>/q</path><ts>1</ts><s>2</s></download-info>'
+
+        assert parse_download_info_xml(xml) == {'host': 'a', 'path': '/p', 'ts': '1', 's': '2'}
+
+    @pytest.mark.parametrize(
+        'xml',
+        [
+            b'<download-info><host>h</host><path>/p</path><ts>1</ts></download-info>',
+            b'<download-info><host>h</host>',
+            b'<?xml version="1.0"?><!DOCTYPE d [<!ENTITY a "aaaaaaaaaa"><!ENTITY b "&a;&a;&a;&a;&a;">]>'
+            b'<download-info><host>&b;</host><path>/p</path><ts>1</ts><s>2</s></download-info>',
+        ],
+    )
+    def test_parse_download_info_xml_invalid(self, xml):
+        with pytest.raises(YandexMusicError):
+            parse_download_info_xml(xml)
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+
+import pytest
+
+from yandex_music import Client, ClientAsync, DownloadInfo, Track
+from yandex_music.exceptions import InvalidBitrateError, NetworkError
+from yandex_music.utils.download_manager import DownloadManager, DownloadStatus
+
+
+class TestDownloadManager:
+    qualities = {
+        '1': [('mp3', 128), ('mp3', 320)],
+        '2': [('mp3', 192)],
+        '3': [('aac', 64)],
+        '4': [('mp3', 320)],
+    }
+
+    @pytest.fixture(autouse=True)
+    def fake_api(self, monkeypatch):
+        self.lookups = []
+        self.failing_lookups = set()
+        self.links = []
+        self.in_flight = self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+        def download_info(track):
+            self.lookups.append(track.id)
+            if track.id in self.failing_lookups:
+                self.failing_lookups.remove(track.id)
+                raise NetworkError('Connection reset')
+
+            return [
+                DownloadInfo(codec, bitrate, False, False, f'{track.id}/{bitrate}', False, track.client)
+                for codec, bitrate in self.qualities.get(track.id, [('mp3', 128)])
+            ]
+
+        async def download_info_async(track):
+            return download_info(track)
+
+        def get_direct_link(info):
+            self.links.append(info.download_info_url)
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+            return info.download_info_url
+
+        async def get_direct_link_async(info):
+            return get_direct_link(info)
+
+        def download(info, filename, attempts, segments):
+            with self.lock:
+                self.in_flight -= 1
+
+            if info.download_info_url == '4/320':
+                raise ValueError('Unexpected error')
+
+            with open(filename, 'wb') as f:
+                f.write(info.download_info_url.encode())
+
+        async def download_async(info, filename, attempts, segments):
+            download(info, filename, attempts, segments)
+
+        monkeypatch.setattr(Track, 'get_download_info', download_info)
+        monkeypatch.setattr(Track, 'get_download_info_async', download_info_async)
+        monkeypatch.setattr(DownloadInfo, 'get_direct_link', get_direct_link)
+        monkeypatch.setattr(DownloadInfo, 'get_direct_link_async', get_direct_link_async)
+        monkeypatch.setattr(DownloadInfo, 'download', download)
+        monkeypatch.setattr(DownloadInfo, 'download_async', download_async)
+
+    def test_download(self, tmp_path):
+        client = Client()
+        (tmp_path / '2.mp3').write_bytes(b'old')
+        progress = []
+
+        def on_progress(result, summary):
+            progress.append((result.status, summary.processed))
+
+        manager = DownloadManager(str(tmp_path), concurrency=2, on_progress=on_progress)
+        summary = manager.download([Track(track_id, client=client) for track_id in ('1', '2', '3')])
+
+        assert (summary.downloaded, summary.skipped, summary.failed, summary.processed) == (1, 1, 1, 3)
+        assert summary.size == len(b'1/320')
+        assert isinstance(summary.failures[0].error, InvalidBitrateError)
+        assert {status for status, _ in progress} == set(DownloadStatus)
+        assert [processed for _, processed in progress] == [1, 2, 3]
+        assert (tmp_path / '1.mp3').read_bytes() == b'1/320'
+        assert (tmp_path / '2.mp3').read_bytes() == b'old'
+        assert sorted(path.name for path in tmp_path.iterdir()) == ['1.mp3', '2.mp3']
+        assert '1 downloaded, 1 skipped, 1 failed' in str(summary)
+
+    def test_quality_and_retries(self, tmp_path):
+        client = Client()
+        self.failing_lookups = {'2'}
+
+        manager = DownloadManager(str(tmp_path), quality=[('aac', 64), ('mp3', 192)], skip_existing=False)
+        summary = manager.download([Track(track_id, client=client) for track_id in ('2', '3')])
+
+        assert summary.downloaded == 2
+        assert self.lookups.count('2') == 2
+        assert (tmp_path / '2.mp3').read_bytes() == b'2/192'
+        assert (tmp_path / '3.aac').read_bytes() == b'3/64'
+
+    def test_download_async(self, tmp_path):
+        client = ClientAsync()
+        manager = DownloadManager(str(tmp_path), concurrency=2)
+
+        summary = asyncio.run(manager.download_async([Track(track_id, client=client) for track_id in ('1', '2', '3')]))
+
+        assert (summary.downloaded, summary.failed) == (2, 1)
+        assert sorted(path.name for path in tmp_path.iterdir()) == ['1.mp3', '2.mp3']
+
+    def test_any_error_is_recorded(self, tmp_path):
+        client = Client()
+        manager = DownloadManager(str(tmp_path), skip_existing=False)
+
+        summary = manager.download([Track(track_id, client=client) for track_id in ('4', '1')])
+
+        assert (summary.downloaded, summary.failed) == (1, 1)
+        assert isinstance(summary.failures[0].error, ValueError)
+
+    def test_links_resolved_ahead_with_bound(self, tmp_path):
+        client = Client()
+        manager = DownloadManager(str(tmp_path), concurrency=2, skip_existing=False)
+        tracks = (Track(str(track_id), client=client) for track_id in range(10, 30))
+
+        summary = manager.download(tracks)
+
+        assert summary.downloaded == 20
+        assert len(self.links) == 20
+        # ссылки получаются заранее, но не больше чем на два этапа по `concurrency` треков вперёд
+        assert self.max_in_flight <= 4
+
+    def test_links_resolved_ahead_with_bound_async(self, tmp_path):
+        client = ClientAsync()
+        manager = DownloadManager(str(tmp_path), concurrency=2, skip_existing=False)
+        tracks = (Track(str(track_id), client=client) for track_id in range(10, 30))
+
+        summary = asyncio.run(manager.download_async(tracks))
+
+        assert summary.downloaded == 20
+        assert 1 < self.max_in_flight <= 4
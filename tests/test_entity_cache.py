@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from yandex_music import Client, ClientAsync
+from yandex_music.utils import direct_link_cache
+from yandex_music.utils.entity_cache import EntityBatch, EntityCache
+
+
+class TestEntityCache:
+    @pytest.fixture(autouse=True)
+    def fake_api(self, fake_clock, fake_post):
+        self.clock = fake_clock(direct_link_cache)
+        self.api = fake_post
+        entities = fake_post.handler
+
+        def handler(object_type, ids):
+            if object_type == 'playlist':
+                owners_and_kinds = [map(int, playlist_id.split(':')) for playlist_id in ids]
+                return [{'owner': {'uid': uid, 'login': 'user'}, 'kind': kind} for uid, kind in owners_and_kinds]
+
+            return entities(object_type, ids)
+
+        fake_post.handler = handler
+
+    def test_partial_hit(self):
+        client = Client(entity_cache=EntityCache())
+
+        client.tracks([1, 2])
+        tracks = client.tracks([3, '2:10', 404, 1])
+
+        assert [track.id for track in tracks] == ['3', '2', '1']
+        assert self.api.requests == [('track', [1, 2]), ('track', [3, 404])]
+
+        # всё есть в кэше, запрос не выполняется
+        assert [track.id for track in client.tracks('1,3')] == ['1', '3']
+        assert len(self.api.requests) == 2
+
+    def test_types_and_params_are_separate(self):
+        client = Client(entity_cache=EntityCache())
+
+        client.tracks([1])
+        client.tracks([1], with_positions=False)
+        client.albums([1])
+        client.artists(1)
+        client.artists(1)
+
+        assert self.api.requests == [('track', [1]), ('track', [1]), ('album', [1]), ('artist', ['1'])]
+
+    def test_playlists(self):
+        client = Client(entity_cache=EntityCache())
+
+        client.playlists_list(['1:3'])
+        playlists = client.playlists_list(['1:2', '1:3'])
+
+        assert [playlist.playlist_id for playlist in playlists] == ['1:2', '1:3']
+        assert self.api.requests == [('playlist', ['1:3']), ('playlist', ['1:2'])]
+
+    def test_expiry_and_max_size(self):
+        client = Client(entity_cache=EntityCache(ttl=60, max_size=2))
+
+        client.tracks([1, 2, 3])
+        assert len(client.entity_cache) == 2
+
+        client.tracks([2, 3])
+        assert len(self.api.requests) == 1
+
+        self.clock.now += 60
+        client.tracks([2, 3])
+        assert self.api.requests[-1] == ('track', [2, 3])
+
+    def test_raw_format_not_cached(self):
+        client = Client(entity_cache=EntityCache())
+
+        client.tracks([1], response_format='json')
+        client.tracks([1])
+        client.tracks([1], response_format='json')
+
+        assert len(self.api.requests) == 3
+
+    def test_returns_copies(self):
+        cache = EntityCache()
+        track = {'id': '1', 'artists': [{'id': 2}]}
+        cache.set_many('track', {'1': track})
+
+        track['title'] = 'changed'
+        cache.get_many('track', ['1'])['1']['artists'].clear()
+
+        assert cache.get_many('track', ['1']) == {'1': {'id': '1', 'artists': [{'id': 2}]}}
+
+    def test_unknown_entities_kept(self):
+        batch = EntityBatch(EntityCache(), 'track', [1])
+        batch.add([{'id': 2}, {'id': 1}])
+
+        assert batch.result() == [{'id': 1}, {'id': 2}]
+
+    def test_async(self):
+        client = ClientAsync(entity_cache=EntityCache())
+
+        async def get_twice():
+            await client.albums([1, 2])
+            return await client.albums([2, 3])
+
+        albums = asyncio.run(get_twice())
+
+        assert [album.id for album in albums] == ['2', '3']
+        assert self.api.requests == [('album', [1, 2]), ('album', [3])]
@@ -0,0 +1,44 @@
+import pytest
+
+from yandex_music import Client, Track
+from yandex_music.utils.identity_map import current_identity_map
+from yandex_music.utils.request import Request
+
+
+class TestIdentityMap:
+    body = (
+        b'{"invocationInfo": {"hostname": "api", "reqId": "1"}, "result": ['
+        b'{"id": "1", "title": "One", "artists": [{"id": 10, "name": "Artist"}], '
+        b'"albums": [{"id": 20, "title": "Album", "labels": [{"id": 30, "name": "Label"}], '
+        b'"trackPosition": {"volume": 1, "index": 1}}]}, '
+        b'{"id": "2", "title": "Two", "artists": [{"id": 10, "name": "Artist"}], '
+        b'"albums": [{"id": 20, "title": "Album", "labels": [{"id": 30, "name": "Label"}], '
+        b'"trackPosition": {"volume": 1, "index": 2}}]}]}'
+    )
+
+    @pytest.fixture
+    def request_wrapper(self, monkeypatch):
+        monkeypatch.setattr(Request, '_request_wrapper', lambda *_, **__: self.body)
+
+    def test_shared_within_response(self, request_wrapper):
+        first, second = Client(identity_map=True).tracks(['1', '2'])
+
+        assert first.artists[0] is second.artists[0]
+        assert first.albums[0].labels[0] is second.albums[0].labels[0]
+        # разные позиции трека в альбоме, поэтому альбомы разные
+        assert first.albums[0] is not second.albums[0]
+        assert current_identity_map.get() is None
+
+    def test_not_shared_between_responses(self, request_wrapper):
+        client = Client(identity_map=True)
+
+        assert client.tracks(['1', '2'])[0].artists[0] is not client.tracks(['1', '2'])[0].artists[0]
+
+    def test_disabled_by_default(self, request_wrapper):
+        first, second = Client().tracks(['1', '2'])
+
+        assert first.artists[0] == second.artists[0]
+        assert first.artists[0] is not second.artists[0]
+
+    def test_de_json_outside_of_client_call(self, artist):
+        assert Track.de_json({'id': '1', 'artists': [artist.to_dict()]}, None).artists[0] == artist
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from yandex_music.utils.json_backend import BACKENDS, _import_loads, get_loads
+from yandex_music.utils.request import Request
+
+
+class TestJsonBackend:
+    response = (
+        '{"result": {"trackIds": [1, 2], "class": {"coverUri": "uri", "1st": null}, "ratio": 0.1, '
+        '"text": "\\u0442\\u0435\\u043a\\u0441\\u0442", "items": [{"isAvailable": true}]}}'
+    )
+
+    def test_stdlib(self):
+        assert get_loads('json') is None
+
+    def test_unknown(self):
+        with pytest.raises(ValueError, match='Unknown JSON backend'):
+            get_loads('yaml')
+
+    @pytest.mark.parametrize('backend', BACKENDS)
+    def test_same_result_as_stdlib(self, backend):
+        if _import_loads(backend) is None:
+            pytest.skip(f'{backend} is not installed')
+
+        request = Request(json_backend=backend)
+        expected = json.loads(self.response, object_hook=Request._object_hook)
+
+        assert request._json_loads is not None
+        assert request._loads(self.response) == expected
+
+    def test_fallback_to_stdlib(self):
+        response = '{"result": {"bigNumber": 18446744073709551616}}'
+
+        assert Request()._loads(response) == {'result': {'big_number': 18446744073709551616}}
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            Request()._loads('{"result": ')
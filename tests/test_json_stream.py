@@ -0,0 +1,115 @@
+import asyncio
+import json
+
+import pytest
+
+from yandex_music import Client, ClientAsync, HistoryTrack, TrackShort
+from yandex_music.exceptions import YandexMusicError
+from yandex_music.utils.json_stream import JSONArrayStream
+from yandex_music.utils.request import Request
+from yandex_music.utils.request_async import Request as RequestAsync
+
+
+def feed_by_chunks(stream, data, chunk_size):
+    items = []
+    for i in range(0, len(data), chunk_size):
+        items.extend(stream.feed(data[i : i + chunk_size]))
+
+    return items + stream.close()
+
+
+class TestJSONArrayStream:
+    document = {
+        'invocationInfo': {'reqId': 'a"b\\', 'tracks': [{'id': 'not this one'}]},
+        'result': {
+            'historyTabs': [
+                {'items': [{'context': {'tracks': [0]}, 'tracks': [{'id': 1, 'title': 'Щ"]}'}, {'id': 2}]}]},
+                {'items': [{'tracks': []}, {'tracks': [{'id': 3, 'nested': [[1], {'tracks': [4]}]}]}]},
+            ],
+        },
+    }
+    path = ('result', 'historyTabs', 'items', 'tracks')
+    expected = [{'id': 1, 'title': 'Щ"]}'}, {'id': 2}, {'id': 3, 'nested': [[1], {'tracks': [4]}]}]
+
+    @pytest.mark.parametrize('chunk_size', [1, 2, 7, 64, 1024])
+    def test_chunks(self, chunk_size):
+        data = json.dumps(self.document, ensure_ascii=False).encode('UTF-8')
+
+        assert feed_by_chunks(JSONArrayStream(self.path), data, chunk_size) == self.expected
+
+    def test_object_hook(self):
+        data = json.dumps({'result': {'tracks': [{'albumId': 1}]}}).encode('UTF-8')
+        stream = JSONArrayStream(('result', 'tracks'), Request._object_hook)
+
+        assert feed_by_chunks(stream, data, 3) == [{'album_id': 1}]
+
+    def test_missing_path(self):
+        data = json.dumps(self.document).encode('UTF-8')
+
+        assert feed_by_chunks(JSONArrayStream(('result', 'tracks')), data, 16) == []
+
+    def test_truncated(self):
+        data = json.dumps(self.document).encode('UTF-8')
+        stream = JSONArrayStream(self.path)
+        stream.feed(data[:-10])
+
+        with pytest.raises(ValueError):
+            stream.close()
+
+
+class TestStreamingMethods:
+    body = json.dumps(
+        {
+            'invocationInfo': {'hostname': 'api', 'reqId': '1'},
+            'result': {
+                'library': {
+                    'uid': 1,
+                    'revision': 1,
+                    'tracks': [{'id': '1', 'timestamp': 't'}, {'id': '2', 'timestamp': 't'}],
+                },
+                'historyTabs': [{'date': 'd', 'items': [{'tracks': [{'type': 'track', 'data': {}}]}]}],
+            },
+        }
+    ).encode('UTF-8')
+
+    def chunks(self, *_, chunk_size, **__):
+        for i in range(0, len(self.body), 5):
+            yield self.body[i : i + 5]
+
+    @pytest.fixture
+    def sync_client(self, monkeypatch):
+        monkeypatch.setattr(Request, '_stream_wrapper', self.chunks)
+        return Client()
+
+    @pytest.fixture
+    def async_client(self, monkeypatch):
+        async def chunks(*args, **kwargs):
+            for chunk in self.chunks(*args, **kwargs):
+                yield chunk
+
+        monkeypatch.setattr(RequestAsync, '_stream_wrapper', chunks)
+        return ClientAsync()
+
+    def test_users_likes_tracks_stream(self, sync_client):
+        tracks = list(sync_client.users_likes_tracks_stream())
+
+        assert all(isinstance(track, TrackShort) for track in tracks)
+        assert [track.id for track in tracks] == ['1', '2']
+
+    def test_music_history_stream(self, sync_client):
+        history_tracks = list(sync_client.music_history_stream())
+
+        assert len(history_tracks) == 1
+        assert isinstance(history_tracks[0], HistoryTrack)
+
+    def test_invalid_response(self, sync_client):
+        self.body = self.body[:-20]
+
+        with pytest.raises(YandexMusicError):
+            list(sync_client.users_likes_tracks_stream())
+
+    def test_async(self, async_client):
+        async def collect():
+            return [track async for track in async_client.users_likes_tracks_stream()]
+
+        assert [track.id for track in asyncio.run(collect())] == ['1', '2']
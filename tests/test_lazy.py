@@ -0,0 +1,49 @@
+from inspect import getattr_static
+
+import pytest
+
+from yandex_music import Album, Client, Playlist, Track
+from yandex_music.utils.lazy import LazyValue
+
+
+@pytest.fixture(scope='module')
+def lazy_client():
+    return Client(lazy_models=True)
+
+
+def raw(obj, name):
+    return getattr_static(type(obj), name).get_raw(obj)
+
+
+class TestLazyModels:
+    def test_track(self, track, client, lazy_client):
+        data = track.to_dict()
+        eager_track = Track.de_json(data, client)
+        lazy_track = Track.de_json(data, lazy_client)
+
+        assert isinstance(raw(lazy_track, 'albums'), LazyValue)
+        assert lazy_track.title == eager_track.title
+        assert lazy_track.albums == eager_track.albums
+        assert not isinstance(raw(lazy_track, 'albums'), LazyValue)
+        assert lazy_track['artists'] == eager_track.artists
+        assert lazy_track.to_dict() == eager_track.to_dict()
+
+    def test_album(self, album, client, lazy_client):
+        data = album.to_dict()
+        lazy_album = Album.de_json(data, lazy_client)
+
+        assert isinstance(raw(lazy_album, 'volumes'), LazyValue)
+        assert lazy_album.to_dict() == Album.de_json(data, client).to_dict()
+        assert lazy_album.volumes == Album.de_json(data, client).volumes
+
+    def test_playlist(self, playlist, client, lazy_client):
+        data = playlist.to_dict()
+        lazy_playlist = Playlist.de_json(data, lazy_client)
+
+        assert isinstance(raw(lazy_playlist, 'tracks'), LazyValue)
+        assert lazy_playlist == Playlist.de_json(data, client)
+        assert lazy_playlist.owner == playlist.owner
+
+    def test_class_defaults(self):
+        assert Track.major is None
+        assert Track.__dataclass_fields__['albums'].default_factory is list
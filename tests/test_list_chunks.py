@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from yandex_music import Client, ClientAsync
+from yandex_music.exceptions import NetworkError
+from yandex_music.utils.entity_cache import EntityCache
+from yandex_music.utils.request_async import Request as RequestAsync
+from yandex_music.utils.response_format import JSON_FORMAT, MODEL_FORMAT, current_response_format
+
+
+class TestListChunks:
+    @pytest.fixture(autouse=True)
+    def fake_api(self, fake_post):
+        self.api = fake_post
+        self.formats = []
+        entities = fake_post.handler
+
+        def handler(object_type, ids):
+            self.formats.append(current_response_format.get())
+            return entities(object_type, ids)
+
+        fake_post.handler = handler
+
+    def test_chunks_keep_order(self):
+        client = Client(list_chunk_size=3, list_concurrency=2)
+        tracks = client.tracks(list(range(10)))
+
+        assert [track.id for track in tracks] == [str(i) for i in range(10)]
+        assert sorted(self.api.ids) == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+
+    def test_single_request(self):
+        client = Client(list_chunk_size=3)
+        client.tracks([1, 2, 3])
+        client.tracks('1,2,3,4')
+
+        assert self.api.ids == [[1, 2, 3], '1,2,3,4']
+
+    def test_json_format(self):
+        client = Client(list_chunk_size=2)
+        tracks = client.tracks([1, 2, 3], response_format='json')
+
+        assert [track['id'] for track in tracks] == ['1', '2', '3']
+        assert current_response_format.get() != JSON_FORMAT
+        assert self.formats == [MODEL_FORMAT, MODEL_FORMAT]
+
+    def test_with_entity_cache(self):
+        client = Client(entity_cache=EntityCache(), list_chunk_size=2)
+        client.tracks([1, 2])
+        tracks = client.tracks([1, 3, 2, 4, 5])
+
+        assert [track.id for track in tracks] == ['1', '3', '2', '4', '5']
+        assert sorted(self.api.ids) == [[1, 2], [3, 4], [5]]
+
+    def test_async(self):
+        client = ClientAsync(list_chunk_size=2, list_concurrency=2)
+        tracks = asyncio.run(client.tracks([5, 4, 3, 2, 1], response_format='json'))
+
+        assert [track['id'] for track in tracks] == ['5', '4', '3', '2', '1']
+        assert sorted(self.api.ids) == [[1], [3, 2], [5, 4]]
+
+    def test_async_failure_cancels_other_chunks(self, monkeypatch):
+        completed = []
+
+        async def post(_, url, data=None, *args, **kwargs):
+            ids = data['track-ids']
+            if ids == [1]:
+                raise NetworkError('Failed')
+
+            await asyncio.sleep(0.01)
+            completed.append(ids)
+            return self.api.entities('track', ids)
+
+        monkeypatch.setattr(RequestAsync, 'post', post)
+        client = ClientAsync(list_chunk_size=1, list_concurrency=2)
+
+        async def run():
+            with pytest.raises(NetworkError):
+                await client.tracks([1, 2, 3])
+            # неотменённые части успели бы завершиться за это время
+            await asyncio.sleep(0.05)
+
+        asyncio.run(run())
+
+        assert completed == []
@@ -0,0 +1,50 @@
+from yandex_music import Client
+from yandex_music.utils.request import Request
+
+
+class TestRequest:
+    pool_limit = 4
+    pool_limit_per_host = 2
+
+    def test_object_hook(self):
+        data = {'coverUri': 1, 'track-ids': 2, 'class': 3, '1st': 4, 'OAuthToken': 5}
+
+        assert Request._object_hook(data) == {
+            'cover_uri': 1,
+            'track_ids': 2,
+            'class_': 3,
+            '_1st': 4,
+            'o_auth_token': 5,
+        }
+        assert Request._object_hook(data) == Request._object_hook(data.copy())
+
+    def test_session_reused(self):
+        request = Request(pool_limit=self.pool_limit, pool_limit_per_host=self.pool_limit_per_host)
+
+        session = request.session
+        adapter = session.get_adapter('https://api.music.yandex.net')
+
+        assert request.session is session
+        assert adapter._pool_connections == self.pool_limit
+        assert adapter._pool_maxsize == self.pool_limit_per_host
+
+    def test_keepalive_disabled(self):
+        request = Request(keepalive_timeout=None)
+
+        assert request.session.headers['Connection'] == 'close'
+
+    def test_close(self):
+        request = Request()
+        session = request.session
+
+        request.close()
+
+        assert request._session is None
+        assert request.session is not session
+
+    def test_client_context_manager(self):
+        with Client() as client:
+            session = client.request.session
+
+        assert client.request._session is None
+        assert client.request.session is not session
@@ -0,0 +1,103 @@
+import asyncio
+import gc
+import threading
+import warnings
+
+from yandex_music import ClientAsync
+from yandex_music.utils.request_async import Request
+
+
+class TestRequestAsync:
+    pool_limit = 4
+    pool_limit_per_host = 2
+    keepalive_timeout = 30
+
+    def test_session_reused(self):
+        request = Request(
+            pool_limit=self.pool_limit,
+            pool_limit_per_host=self.pool_limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+
+        async def check():
+            session = request.session
+
+            assert request.session is session
+            assert session.connector.limit == self.pool_limit
+            assert session.connector.limit_per_host == self.pool_limit_per_host
+            assert not session.connector.force_close
+
+            await request.close()
+
+        asyncio.run(check())
+
+    def test_keepalive_disabled(self):
+        request = Request(keepalive_timeout=None)
+
+        async def check():
+            assert request.session.connector.force_close
+            await request.close()
+
+        asyncio.run(check())
+
+    def test_session_recreated_in_new_loop(self):
+        request = Request()
+
+        async def get_session():
+            return request.session
+
+        first_session = asyncio.run(get_session())
+        second_session = asyncio.run(get_session())
+        asyncio.run(request.close())
+
+        assert first_session is not second_session
+
+    def test_stale_session_closed_in_new_loop(self):
+        client = ClientAsync()
+
+        async def get_session():
+            return client.request.session
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            first_session = asyncio.run(get_session())
+            second_session = asyncio.run(get_session())
+
+            assert first_session.closed
+            assert not second_session.closed
+
+            asyncio.run(client.request.close())
+            del first_session, second_session
+            gc.collect()
+
+        assert not [warning for warning in caught if 'Unclosed' in str(warning.message)]
+
+    def test_stale_session_closed_in_running_loop(self):
+        request = Request()
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever)
+        thread.start()
+
+        async def get_session():
+            return request.session
+
+        try:
+            first_session = asyncio.run_coroutine_threadsafe(get_session(), loop).result()
+            asyncio.run(get_session())
+
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0), loop).result()
+            assert first_session.closed
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def test_client_context_manager(self):
+        async def check():
+            async with ClientAsync() as client:
+                session = client.request.session
+
+            assert session.closed
+            assert client.request._session is None
+
+        asyncio.run(check())
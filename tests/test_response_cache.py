@@ -0,0 +1,146 @@
+import asyncio
+import json
+
+import pytest
+
+from yandex_music import Client, ClientAsync
+from yandex_music.utils import response_cache
+from yandex_music.utils.request import Request
+from yandex_music.utils.request_async import Request as RequestAsync
+from yandex_music.utils.response_cache import ResponseCache
+
+
+def genres_body(genre_id, title):
+    genre = {'id': genre_id, 'title': title, 'weight': 1, 'composerTop': False, 'showInMenu': True}
+    return json.dumps({'result': [genre]}).encode('UTF-8')
+
+
+class TestResponseCache:
+    @pytest.fixture(autouse=True)
+    def fake_api(self, monkeypatch, fake_clock):
+        self.clock = fake_clock(response_cache)
+        self.requests = []
+        self.parsed = 0
+        self.etag = '"1"'
+        self.body = genres_body('rock', 'Рок')
+
+        def request_wrapper(_, method, url, on_response=None, **kwargs):
+            self.requests.append((url, kwargs['headers'].get('If-None-Match')))
+
+            status_code = 304 if self.etag and kwargs['headers'].get('If-None-Match') == self.etag else 200
+            headers = {'ETag': self.etag} if self.etag else {}
+            if on_response is not None:
+                on_response(status_code, headers)
+
+            return b'' if status_code == 304 else self.body
+
+        async def request_wrapper_async(*args, **kwargs):
+            return request_wrapper(*args, **kwargs)
+
+        parse = Request._parse
+
+        def counting_parse(request, json_data):
+            self.parsed += 1
+            return parse(request, json_data)
+
+        monkeypatch.setattr(Request, '_request_wrapper', request_wrapper)
+        monkeypatch.setattr(Request, '_parse', counting_parse)
+        monkeypatch.setattr(RequestAsync, '_request_wrapper', request_wrapper_async)
+
+    def test_ttl(self):
+        cache = ResponseCache({r'/genres': 60, r'/tags/[^/]+/playlist-ids': 10})
+
+        assert cache.get_ttl('https://api.music.yandex.net/genres') == 60
+        assert cache.get_ttl('https://api.music.yandex.net/tags/rock/playlist-ids') == 10
+        assert cache.get_ttl('https://api.music.yandex.net/genres/rock') is None
+        assert cache.get_ttl('https://api.music.yandex.net/account/status') is None
+
+    def test_hit_skips_request_and_parse(self):
+        client = Client(request=Request(response_cache=ResponseCache()))
+
+        first = client.genres()
+        second = client.genres()
+
+        assert [genre.title for genre in second] == [genre.title for genre in first] == ['Рок']
+        assert len(self.requests) == 1
+        assert self.parsed == 1
+
+    def test_hit_returns_copy(self):
+        client = Client(request=Request(response_cache=ResponseCache()))
+
+        client.genres(response_format='json')[0]['title'] = 'changed'
+        client.genres(response_format='json').append({'id': 'extra'})
+
+        assert [genre.title for genre in client.genres()] == ['Рок']
+        assert len(self.requests) == 1
+
+    def test_revalidation(self):
+        client = Client(request=Request(response_cache=ResponseCache({r'/genres': 60})))
+        client.genres()
+
+        self.clock.now += 60
+        assert client.genres()[0].title == 'Рок'
+        assert self.requests[-1][1] == '"1"'
+        assert self.parsed == 1
+
+        # ответ изменился
+        self.clock.now += 60
+        self.etag = '"2"'
+        self.body = genres_body('pop', 'Поп')
+        assert client.genres()[0].title == 'Поп'
+        assert self.parsed == 2
+
+        assert client.genres()[0].title == 'Поп'
+        assert len(self.requests) == 3
+
+    def test_expired_without_validators(self):
+        self.etag = None
+        client = Client(request=Request(response_cache=ResponseCache({r'/genres': 60})))
+
+        client.genres()
+        self.clock.now += 60
+        client.genres()
+
+        assert self.requests[-1][1] is None
+        assert self.parsed == 2
+
+    def test_key_includes_params_and_token(self):
+        client = Client(request=Request(response_cache=ResponseCache({r'/landing3': 60})))
+
+        client.landing('personalplaylists', response_format='json')
+        client.landing('personalplaylists', response_format='json')
+        client.landing('mixes', response_format='json')
+        client.request.set_authorization('token')
+        client.landing('mixes', response_format='json')
+
+        assert len(self.requests) == 3
+
+    def test_max_size(self):
+        cache = ResponseCache({r'/.*': 60}, max_size=len(self.body) * 2)
+        client = Client(request=Request(response_cache=cache))
+
+        for name in ('a', 'b', 'a', 'c', 'a', 'b'):
+            client.request.get(f'https://api.music.yandex.net/{name}')
+
+        assert [url[-1] for url, _ in self.requests] == ['a', 'b', 'c', 'b']
+        assert cache.size == len(self.body) * 2
+        assert len(cache) == 2
+
+    def test_raw_formats(self):
+        client = Client(request=Request(response_cache=ResponseCache()))
+
+        assert client.genres(response_format='json')[0]['title'] == 'Рок'
+        assert client.genres(response_format='bytes') == self.body
+        assert client.genres(response_format='json')[0]['title'] == 'Рок'
+
+        assert len(self.requests) == 2
+
+    def test_async(self):
+        client = ClientAsync(request=RequestAsync(response_cache=ResponseCache()))
+
+        async def get_twice():
+            await client.genres()
+            return await client.genres()
+
+        assert asyncio.run(get_twice())[0].title == 'Рок'
+        assert len(self.requests) == 1
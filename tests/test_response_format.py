@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from yandex_music import Client, ClientAsync, Track
+from yandex_music.utils.request import Request
+from yandex_music.utils.request_async import Request as RequestAsync
+from yandex_music.utils.response_format import current_response_format
+
+
+class TestResponseFormat:
+    body = (
+        b'{"invocationInfo": {"hostname": "api", "reqId": "1"}, '
+        b'"result": [{"id": "10994777", "title": "Sapphire", "durationMs": 1}]}'
+    )
+
+    @pytest.fixture
+    def sync_client(self, monkeypatch):
+        monkeypatch.setattr(Request, '_request_wrapper', lambda *_, **__: self.body)
+        return Client()
+
+    @pytest.fixture
+    def async_client(self, monkeypatch):
+        async def request_wrapper(*_, **__):
+            return self.body
+
+        monkeypatch.setattr(RequestAsync, '_request_wrapper', request_wrapper)
+        return ClientAsync()
+
+    def test_model(self, sync_client):
+        tracks = sync_client.tracks('10994777')
+
+        assert isinstance(tracks[0], Track)
+        assert tracks[0].duration_ms == 1
+
+    def test_json_per_call(self, sync_client):
+        tracks = sync_client.tracks('10994777', response_format='json')
+
+        assert tracks == [{'id': '10994777', 'title': 'Sapphire', 'duration_ms': 1}]
+        assert current_response_format.get() is None
+        assert isinstance(sync_client.tracks('10994777')[0], Track)
+
+    def test_bytes_per_client(self, sync_client):
+        sync_client.response_format = 'bytes'
+
+        assert sync_client.tracks('10994777') == self.body
+        assert isinstance(sync_client.tracks('10994777', response_format='model')[0], Track)
+
+    def test_async(self, async_client):
+        async def check():
+            assert await async_client.tracks('10994777', response_format='bytes') == self.body
+            assert isinstance((await async_client.tracks('10994777'))[0], Track)
+
+        asyncio.run(check())
@@ -0,0 +1,69 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from yandex_music import Album, Playlist, Track
+
+ROOT = Path(__file__).parent.parent
+
+CHECK_SLOTS = """
+import weakref
+
+from yandex_music import DownloadInfo, Experiments, Track
+from yandex_music.utils import SLOTS
+
+assert SLOTS
+track = Track(id=1, title='title')
+assert not hasattr(track, '__dict__')
+assert track['title'] == 'title'
+assert weakref.ref(track)() is track
+assert track == Track(id=1) and hash(track) == hash(Track(id=1))
+assert Track.major is None
+
+download_info = DownloadInfo('mp3', 320, False, False, 'url', False)
+download_info.direct_link = 'link'
+assert download_info.to_dict()['direct_link'] == 'link'
+
+experiments = Experiments(some_experiment='on')
+assert experiments.some_experiment == 'on'
+assert experiments.to_dict() == {'some_experiment': 'on'}
+"""
+
+TO_JSON = """
+import json
+import sys
+
+from yandex_music import Album, Playlist, Track
+
+data = json.load(sys.stdin)
+print(json.dumps([cls.de_json(data[cls.__name__], None).to_json() for cls in (Track, Album, Playlist)]))
+"""
+
+
+def run_slotted(code, stdin=None):
+    env = {**os.environ, 'YANDEX_MUSIC_SLOTS': '1'}
+    command = [sys.executable, '-c', code]
+    result = subprocess.run(
+        command,  # noqa: S603
+        input=stdin,
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=ROOT,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+class TestSlots:
+    def test_slotted_models(self):
+        run_slotted(CHECK_SLOTS)
+
+    def test_to_json_is_the_same(self, track, album, playlist):
+        data = {'Track': track.to_dict(), 'Album': album.to_dict(), 'Playlist': playlist.to_dict()}
+        expected = [cls.de_json(data[cls.__name__], None).to_json() for cls in (Track, Album, Playlist)]
+
+        assert json.loads(run_slotted(TO_JSON, json.dumps(data))) == expected
@@ -0,0 +1,85 @@
+import sqlite3
+
+import pytest
+
+from yandex_music import Client
+from yandex_music.exceptions import NetworkError
+from yandex_music.utils import sqlite_entity_cache
+from yandex_music.utils.sqlite_entity_cache import ALBUM_RELATION, ARTIST_RELATION, SQLiteEntityCache
+
+
+class TestSQLiteEntityCache:
+    @pytest.fixture(autouse=True)
+    def fake_api(self, fake_clock, fake_post):
+        self.clock = fake_clock(sqlite_entity_cache)
+        self.api = fake_post
+        fake_post.handler = lambda _, ids: [self.track_data(int(track_id)) for track_id in ids]
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        return str(tmp_path / 'entities.sqlite')
+
+    def test_offline_after_restart(self, path):
+        client = Client(entity_cache=SQLiteEntityCache(path))
+        client.tracks([1, 2])
+        client.entity_cache.close()
+
+        self.api.error = NetworkError('Offline')
+        client = Client(entity_cache=SQLiteEntityCache(path))
+        tracks = client.tracks([2, 1])
+
+        assert [(track.id, track.title, track.artists[0].name) for track in tracks] == [
+            ('2', 'Трек 2', 'Исполнитель'),
+            ('1', 'Трек 1', 'Исполнитель'),
+        ]
+        with pytest.raises(NetworkError):
+            client.tracks([1, 3])
+
+        # без сети запрашивается только трек, которого нет в кэше
+        assert self.api.ids == [[1, 2], [3]]
+
+    def test_wal_mode(self, path):
+        cache = SQLiteEntityCache(path)
+        cache.set_many('track', {'1': {'id': '1'}})
+
+        # другой процесс видит записанные объекты
+        assert SQLiteEntityCache(path).get_many('track', ['1', '2']) == {'1': {'id': '1'}}
+        assert sqlite3.connect(path).execute('PRAGMA journal_mode').fetchone() == ('wal',)
+
+    def test_ttl(self, path):
+        cache = SQLiteEntityCache(path, ttl=60)
+        cache.set_many('track', {'1': {'id': '1'}})
+
+        self.clock.now += 59
+        assert cache.get_many('track', ['1']) == {'1': {'id': '1'}}
+
+        self.clock.now += 1
+        assert cache.get_many('track', ['1']) == {}
+
+    def test_related(self, path):
+        client = Client(entity_cache=SQLiteEntityCache(path))
+        client.tracks([1, 2])
+        client.tracks([1], with_positions=False)
+
+        assert [track['id'] for track in client.entity_cache.get_related('track', ARTIST_RELATION, '7')] == ['1', '2']
+        assert client.entity_cache.get_related('track', ALBUM_RELATION, '12') == [self.track_data(2)]
+        assert client.entity_cache.get_related('album', ARTIST_RELATION, '7') == []
+
+    def test_many_keys_and_clear(self, path):
+        cache = SQLiteEntityCache(path)
+        entities = {str(i): {'id': str(i), 'revision': i} for i in range(1200)}
+        cache.set_many('playlist', entities)
+
+        assert cache.get_many('playlist', list(entities)) == entities
+
+        cache.clear()
+        assert cache.get_many('playlist', list(entities)) == {}
+
+    @staticmethod
+    def track_data(track_id):
+        return {
+            'id': str(track_id),
+            'title': f'Трек {track_id}',
+            'artists': [{'id': 7, 'name': 'Исполнитель'}],
+            'albums': [{'id': 10 + track_id}],
+        }
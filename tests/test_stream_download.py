@@ -0,0 +1,190 @@
+import asyncio
+
+import pytest
+
+from yandex_music import Client, ClientAsync, DownloadInfo, Track
+from yandex_music.exceptions import IncompleteDownloadError, InvalidBitrateError, NetworkError
+from yandex_music.utils.request import Request
+from yandex_music.utils.request_async import Request as RequestAsync
+
+DIRECT_LINK = 'https://s.yandex.net/get-mp3/sign/ts/path'
+
+
+class TestStreamDownload:
+    body = bytes(range(256)) * 10
+
+    def chunks(self, method, url, *, on_response, chunk_size=1024, headers=None, **kwargs):
+        content_range = (headers or {}).get('Range')
+        self.calls.append((method, url, chunk_size, content_range))
+
+        start, stop = 0, len(self.body)
+        if content_range and self.support_range:
+            first, last = content_range[len('bytes=') :].split('-')
+            start, stop = int(first), int(last) + 1 if last else len(self.body)
+            on_response(206, {'Content-Range': f'bytes {start}-{stop - 1}/{len(self.body)}'})
+        else:
+            on_response(200, {'Content-Length': str(len(self.body))})
+
+        if content_range in self.fail_ranges:
+            raise NetworkError('Connection reset')
+
+        end = stop if not self.break_at else self.break_at.pop(0)
+        for i in range(start, end, chunk_size):
+            yield self.body[i : min(i + chunk_size, end)]
+
+        if end < stop and self.fail_on_break:
+            raise NetworkError('Connection reset')
+
+    @pytest.fixture(autouse=True)
+    def reset_calls(self):
+        self.calls = []
+        self.break_at = []
+        self.fail_on_break = True
+        self.support_range = True
+        self.fail_ranges = set()
+
+    @pytest.fixture
+    def sync_client(self, monkeypatch):
+        monkeypatch.setattr(Request, '_stream_wrapper', self.chunks)
+        return Client()
+
+    @pytest.fixture
+    def async_client(self, monkeypatch):
+        async def chunks(_, *args, **kwargs):
+            for chunk in self.chunks(*args, **kwargs):
+                yield chunk
+
+        monkeypatch.setattr(RequestAsync, '_stream_wrapper', chunks)
+        return ClientAsync()
+
+    @staticmethod
+    def download_info(client):
+        download_info = DownloadInfo('mp3', 192, False, False, 'https://storage.mds.yandex.net/info', True, client)
+        download_info.direct_link = DIRECT_LINK
+
+        return download_info
+
+    def test_download_info_stream(self, sync_client):
+        chunks = list(self.download_info(sync_client).stream(1000))
+
+        assert [len(chunk) for chunk in chunks] == [1000, 1000, 560]
+        assert b''.join(chunks) == self.body
+        assert self.calls == [('GET', DIRECT_LINK, 1000, None)]
+
+    def test_download_writes_chunks(self, sync_client, tmp_path):
+        filename = tmp_path / 'track.mp3'
+        self.download_info(sync_client).download(str(filename))
+
+        assert filename.read_bytes() == self.body
+
+    @pytest.mark.parametrize('support_range', [True, False])
+    def test_download_resumes(self, sync_client, monkeypatch, tmp_path, support_range):
+        links = iter(['https://s.yandex.net/new-1', 'https://s.yandex.net/new-2'])
+        # как и настоящий метод, сначала возвращает ещё не сброшенную ссылку объекта
+        monkeypatch.setattr(DownloadInfo, 'get_direct_link', lambda info: info.direct_link or next(links))
+        self.break_at = [1000, 1700]
+        self.support_range = support_range
+
+        filename = tmp_path / 'track.mp3'
+        self.download_info(sync_client).download(str(filename))
+
+        assert filename.read_bytes() == self.body
+        assert [call[1] for call in self.calls] == [
+            DIRECT_LINK,
+            'https://s.yandex.net/new-1',
+            'https://s.yandex.net/new-2',
+        ]
+        assert [call[3] for call in self.calls] == [None, 'bytes=1000-', 'bytes=1700-']
+
+    def test_download_attempts_exhausted(self, sync_client, monkeypatch, tmp_path):
+        monkeypatch.setattr(DownloadInfo, 'get_direct_link', lambda _: DIRECT_LINK)
+        self.break_at = [100, 200]
+
+        filename = tmp_path / 'track.mp3'
+        with pytest.raises(NetworkError):
+            self.download_info(sync_client).download(str(filename), attempts=2)
+
+        assert filename.read_bytes() == self.body[:200]
+
+    def test_incomplete_download(self, sync_client):
+        self.break_at = [100]
+        self.fail_on_break = False
+
+        with pytest.raises(IncompleteDownloadError):
+            list(sync_client.request.retrieve_stream(DIRECT_LINK))
+
+    def test_segmented_download(self, sync_client, tmp_path):
+        filename = tmp_path / 'track.mp3'
+        sync_client.request.download(DIRECT_LINK, str(filename), segments=4)
+
+        assert filename.read_bytes() == self.body
+        assert sorted(call[3] for call in self.calls) == [
+            'bytes=0-0',
+            'bytes=0-639',
+            'bytes=1280-1919',
+            'bytes=1920-2559',
+            'bytes=640-1279',
+        ]
+
+    def test_segmented_download_fallback(self, sync_client, tmp_path):
+        self.support_range = False
+
+        filename = tmp_path / 'track.mp3'
+        sync_client.request.download(DIRECT_LINK, str(filename), segments=4)
+
+        assert filename.read_bytes() == self.body
+        assert [call[3] for call in self.calls] == ['bytes=0-0', None]
+
+    def test_segmented_download_resumes(self, sync_client, tmp_path):
+        self.fail_ranges = {'bytes=1280-1919'}
+
+        filename = tmp_path / 'track.mp3'
+        with pytest.raises(NetworkError):
+            sync_client.request.download(DIRECT_LINK, str(filename), segments=4)
+
+        assert filename.read_bytes() == self.body[:1280]
+
+        self.fail_ranges = set()
+        sync_client.request.download(DIRECT_LINK, str(filename), resume=True, segments=2)
+
+        assert filename.read_bytes() == self.body
+        assert sorted(call[3] for call in self.calls[-2:]) == ['bytes=1280-1919', 'bytes=1920-2559']
+
+    def test_track_stream_invalid_bitrate(self, sync_client, monkeypatch):
+        monkeypatch.setattr(Track, 'get_specific_download_info', lambda *_: None)
+
+        with pytest.raises(InvalidBitrateError):
+            next(Track('1', client=sync_client).stream())
+
+    def test_async(self, async_client, monkeypatch, tmp_path):
+        filename = tmp_path / 'track.mp3'
+        download_info = self.download_info(async_client)
+
+        async def get_direct_link_async(_):
+            return DIRECT_LINK
+
+        monkeypatch.setattr(DownloadInfo, 'get_direct_link_async', get_direct_link_async)
+        self.break_at = [len(self.body), 1000]
+
+        async def collect():
+            chunks = [chunk async for chunk in download_info.stream_async(1000)]
+            await download_info.download_async(str(filename))
+            return chunks
+
+        assert b''.join(asyncio.run(collect())) == self.body
+        assert filename.read_bytes() == self.body
+        assert self.calls[-1][3] == 'bytes=1000-'
+
+    def test_async_segmented(self, async_client, tmp_path):
+        self.fail_ranges = {'bytes=640-1279'}
+        filename = tmp_path / 'track.mp3'
+
+        with pytest.raises(NetworkError):
+            asyncio.run(async_client.request.download(DIRECT_LINK, str(filename), segments=4))
+
+        assert filename.read_bytes() == self.body[:640]
+
+        self.fail_ranges = set()
+        asyncio.run(async_client.request.download(DIRECT_LINK, str(filename), resume=True, segments=4))
+
+        assert filename.read_bytes() == self.body
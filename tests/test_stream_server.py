@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from yandex_music import ClientAsync, DownloadInfo
+from yandex_music.utils.audio_cache import AudioCache
+from yandex_music.utils.stream_server import TrackStreamServer
+
+
+class TestTrackStreamServer:
+    body = bytes(range(256)) * 40
+
+    @pytest.fixture(autouse=True)
+    def fake_api(self, monkeypatch):
+        self.upstream_requests = []
+        self.support_range = True
+
+        async def tracks_download_info(client, track_id, *args, **kwargs):
+            if track_id == '404':
+                return []
+
+            download_info = DownloadInfo('mp3', 320, False, False, 'https://storage.mds.yandex.net/info', True, client)
+            download_info.direct_link = self.direct_link
+            return [download_info]
+
+        monkeypatch.setattr(ClientAsync, 'tracks_download_info', tracks_download_info)
+
+    async def upstream(self, request):
+        self.upstream_requests.append(request.headers.get('Range'))
+        if not self.support_range or request.http_range.start is None:
+            return web.Response(body=self.body)
+
+        start, stop = request.http_range.start, request.http_range.stop or len(self.body)
+        return web.Response(
+            status=206,
+            body=self.body[start:stop],
+            headers={'Content-Range': f'bytes {start}-{stop - 1}/{len(self.body)}'},
+        )
+
+    def run(self, check, audio_cache=None):
+        async def run():
+            upstream = web.Application()
+            upstream.router.add_get('/audio', self.upstream)
+
+            async with TestServer(upstream) as upstream_server:
+                self.direct_link = str(upstream_server.make_url('/audio'))
+                client = ClientAsync(audio_cache=audio_cache)
+                server = TrackStreamServer(client, chunk_size=1000)
+
+                async with TestClient(TestServer(server.app)) as http:
+                    await check(http)
+
+                await client.request.close()
+
+        asyncio.run(run())
+
+    def test_full_track_cached(self, tmp_path):
+        async def check(http):
+            resp = await http.get('/track/1')
+            assert resp.status == 200
+            assert resp.headers['Content-Type'] == 'audio/mpeg'
+            assert resp.headers['Accept-Ranges'] == 'bytes'
+            assert await resp.read() == self.body
+
+            resp = await http.get('/track/1', headers={'Range': 'bytes=100-199'})
+            assert resp.status == 206
+            assert await resp.read() == self.body[100:200]
+
+        audio_cache = AudioCache(str(tmp_path))
+        self.run(check, audio_cache)
+
+        assert self.upstream_requests == [None]
+        with open(audio_cache.get(1, 'mp3', 320), 'rb') as f:
+            assert f.read() == self.body
+        assert audio_cache.size == len(self.body)
+
+    @pytest.mark.parametrize('support_range', [True, False])
+    def test_range(self, tmp_path, support_range):
+        self.support_range = support_range
+
+        async def check(http):
+            resp = await http.get('/track/1', headers={'Range': 'bytes=1000-2999'})
+            assert resp.status == 206
+            assert resp.headers['Content-Range'] == f'bytes 1000-2999/{len(self.body)}'
+            assert await resp.read() == self.body[1000:3000]
+
+            resp = await http.get('/track/1', headers={'Range': 'bytes=9000-'})
+            assert resp.status == 206
+            assert await resp.read() == self.body[9000:]
+
+        audio_cache = AudioCache(str(tmp_path))
+        self.run(check, audio_cache)
+
+        assert self.upstream_requests == ['bytes=1000-2999', 'bytes=9000-']
+        assert audio_cache.size == 0
+        assert list(tmp_path.rglob('*.part')) == []
+
+    def test_connection_reset_before_response(self, monkeypatch, tmp_path):
+        async def prepare_response(*args, **kwargs):
+            raise ConnectionResetError
+
+        monkeypatch.setattr(TrackStreamServer, '_prepare_response', prepare_response)
+
+        async def check(http):
+            assert (await http.get('/track/1')).status == 499
+
+        audio_cache = AudioCache(str(tmp_path))
+        self.run(check, audio_cache)
+
+        assert audio_cache.size == 0
+        assert list(tmp_path.rglob('*.part')) == []
+
+    def test_errors(self):
+        async def check(http):
+            assert (await http.get('/track/404')).status == 404
+            assert (await http.get('/track/1', headers={'Range': 'bytes=20-10'})).status == 416
+
+        self.run(check)
+
+        assert self.upstream_requests == []
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from yandex_music import Client, ClientAsync, TrackId, TrackShort, TracksList
+from yandex_music.exceptions import NetworkError
+from yandex_music.utils.track_loader import TrackLoader
+
+
+class TestTrackLoader:
+    @pytest.fixture(autouse=True)
+    def fake_api(self, fake_post):
+        self.api = fake_post
+
+    @staticmethod
+    def tracks_short(client, ids):
+        return [TrackShort(track_id, '', album_id='10', client=client) for track_id in ids]
+
+    def test_batching(self):
+        client = ClientAsync(track_loader=TrackLoader())
+        tracks = self.tracks_short(client, [1, 2, 1]) + [TrackId(id=3, album_id=10, client=client)]
+
+        async def fetch_all():
+            return await asyncio.gather(*(track.fetch_track_async() for track in tracks))
+
+        assert [track.id for track in asyncio.run(fetch_all())] == ['1', '2', '1', '3']
+        assert self.api.ids == [['1:10', '2:10', '3:10']]
+
+    def test_max_batch_size_and_delay(self):
+        client = ClientAsync(track_loader=TrackLoader(delay=0.01, max_batch_size=2))
+        tracks = self.tracks_short(client, [1, 2, 3])
+
+        async def fetch_one_by_one():
+            first = asyncio.gather(*(track.fetch_track_async() for track in tracks))
+            await asyncio.sleep(0)
+            return await asyncio.gather(first, tracks[0].fetch_track_async())
+
+        asyncio.run(fetch_one_by_one())
+        assert self.api.ids == [['1:10', '2:10'], ['3:10', '1:10']]
+
+    def test_errors(self):
+        client = ClientAsync(track_loader=TrackLoader())
+        found, missing = self.tracks_short(client, [1, 404])
+
+        async def fetch_both():
+            return await asyncio.gather(found.fetch_track_async(), missing.fetch_track_async(), return_exceptions=True)
+
+        track, error = asyncio.run(fetch_both())
+        assert track.id == '1'
+        assert isinstance(error, IndexError)
+
+        self.api.error = NetworkError('Offline')
+        results = asyncio.run(fetch_both())
+        assert [type(result) for result in results] == [NetworkError, NetworkError]
+        assert len(self.api.ids) == 2
+
+    def test_json_format_not_batched(self):
+        client = ClientAsync(response_format='json', track_loader=TrackLoader())
+        tracks = self.tracks_short(client, [1, 2])
+
+        async def fetch_all():
+            return await asyncio.gather(*(track.fetch_track_async() for track in tracks))
+
+        assert [track['id'] for track in asyncio.run(fetch_all())] == ['1', '2']
+        assert self.api.ids == ['1:10', '2:10']
+
+    def test_sync_client_has_no_loader(self):
+        with pytest.raises(TypeError):
+            Client(track_loader=TrackLoader())
+
+    def test_hydrate_tracks(self):
+        client = Client()
+        tracks_list = TracksList(1, 1, self.tracks_short(client, [1, 2, 404]), client=client)
+        hydrated = tracks_list.hydrate_tracks()
+        assert [track.track.id for track in hydrated[:2]] == ['1', '2']
+        assert hydrated[2].track is None
+
+        # запрашиваются только треки без полной версии
+        tracks_list.hydrate_tracks()
+        assert self.api.ids == [['1:10', '2:10', '404:10'], ['404:10']]
+
+    def test_hydrate_tracks_json_client(self):
+        client = Client(response_format='json')
+        tracks_list = TracksList(1, 1, self.tracks_short(client, [1]), client=client)
+
+        assert tracks_list.hydrate_tracks()[0].track.title == 'title 1:10'
+
+    def test_hydrate_tracks_async(self):
+        client = ClientAsync()
+        tracks_list = TracksList(1, 1, self.tracks_short(client, [1, 2]), client=client)
+
+        hydrated = asyncio.run(tracks_list.hydrate_tracks_async())
+
+        assert [track.track.title for track in hydrated] == ['title 1:10', 'title 2:10']
+        assert self.api.ids == [['1:10', '2:10']]
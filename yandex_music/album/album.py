@@ -1,5 +1,5 @@
 from dataclasses import field
-from typing import TYPE_CHECKING, Any, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, ClassVar, List, Optional, Tuple, Union, cast
 
 from yandex_music import YandexMusicModel
 from yandex_music.utils import model
@@ -121,6 +121,16 @@ class Album(YandexMusicModel):
     available_for_options: Optional[List[str]] = None
     client: Optional['ClientType'] = None
 
+    _identity_fields: ClassVar[Tuple[str, ...]] = ('id',)
+    _lazy_fields: ClassVar[Tuple[str, ...]] = (
+        'artists',
+        'track_position',
+        'duplicates',
+        'albums',
+        'deprecation',
+        'volumes',
+    )
+
     def __post_init__(self) -> None:
         self._id_attrs = (self.id,)
 
@@ -323,7 +333,7 @@ class Album(YandexMusicModel):
         cls_data = cls.cleanup_data(data, client)
         from yandex_music import Artist, Deprecation, Label, Track, TrackPosition
 
-        cls_data['artists'] = Artist.de_list(data.get('artists'), client)
+        cls_data['artists'] = cls.de_json_nested(Artist.de_list, data.get('artists'), client)
 
         # В зависимости от запроса содержимое лейблов может быть списком объектом или списком строк.
         labels = data.get('labels')
@@ -335,14 +345,16 @@ class Album(YandexMusicModel):
             # Поддержка формата. Все листы [] по умолчанию вместо None даже если данных нет.
             cls_data['labels'] = []
 
-        cls_data['track_position'] = TrackPosition.de_json(data.get('track_position'), client)
-        cls_data['duplicates'] = Album.de_list(data.get('duplicates'), client)
-        cls_data['albums'] = Album.de_list(data.get('albums'), client)
-        cls_data['deprecation'] = Deprecation.de_json(data.get('deprecation'), client)
+        cls_data['track_position'] = cls.de_json_nested(TrackPosition.de_json, data.get('track_position'), client)
+        cls_data['duplicates'] = cls.de_json_nested(Album.de_list, data.get('duplicates'), client)
+        cls_data['albums'] = cls.de_json_nested(Album.de_list, data.get('albums'), client)
+        cls_data['deprecation'] = cls.de_json_nested(Deprecation.de_json, data.get('deprecation'), client)
 
         volumes = data.get('volumes')
         if isinstance(volumes, list):
-            cls_data['volumes'] = [Track.de_list(volume, client) for volume in volumes]
+            cls_data['volumes'] = cls.de_json_nested(
+                lambda volumes, client: [Track.de_list(volume, client) for volume in volumes], volumes, client
+            )
 
         return cls(client=client, **cls_data)  # type: ignore
 
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, List, Optional, Union, cast
+from typing import TYPE_CHECKING, ClassVar, List, Optional, Tuple, Union, cast
 
 from yandex_music import YandexMusicModel
 from yandex_music.utils import model
@@ -21,6 +21,8 @@ class Label(YandexMusicModel):
     name: str
     client: Optional['ClientType'] = None
 
+    _identity_fields: ClassVar[Tuple[str, ...]] = ('id',)
+
     def __post_init__(self) -> None:
         self._id_attrs = (self.id, self.name)
 
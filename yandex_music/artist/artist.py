@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, ClassVar, List, Optional, Tuple, Union
 
 from yandex_music import YandexMusicModel
 from yandex_music.exceptions import IdMissingError
@@ -90,6 +90,8 @@ class Artist(YandexMusicModel):
     ya_money_id: Optional[str] = None
     client: Optional['ClientType'] = None
 
+    _identity_fields: ClassVar[Tuple[str, ...]] = ('id',)
+
     def __post_init__(self) -> None:
         self._id_attrs = (self.id, self.name, self.cover)
 
@@ -1,11 +1,13 @@
+import contextlib
 import dataclasses
 import keyword
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union, cast
 
 from typing_extensions import Self, TypeGuard
 
 from yandex_music.utils import model
+from yandex_music.utils.lazy import LazyValue
 
 if TYPE_CHECKING:
     from yandex_music import Client, ClientAsync
@@ -18,6 +20,12 @@ try:
 except ImportError:
     import json
 
+orjson_dumps: Optional[Callable[[Any], bytes]]
+try:
+    from orjson import dumps as orjson_dumps
+except ImportError:
+    orjson_dumps = None
+
 reserved_names = keyword.kwlist
 
 logger = logging.getLogger(__name__)
@@ -33,14 +41,32 @@ ModelFieldMap = Dict[str, 'ModelFieldType']
 MapTypeToDeJson = Dict[str, Callable[['JSONType', 'ClientType'], Optional['YandexMusicModel']]]
 
 
+_scalar_types = frozenset((str, int, float, bool, type(None)))
+
+
 class YandexMusicObject:
     """Базовый класс для всех классов библиотеки."""
 
+    __slots__ = ()
+
 
 @model
 class YandexMusicModel(YandexMusicObject):
     """Базовый класс для всех моделей библиотеки."""
 
+    _field_names: ClassVar[FrozenSet[str]]
+    _key_map: ClassVar[Dict[str, Optional[str]]]
+    _request_key_map: ClassVar[Dict[str, Optional[str]]]
+    _slot_names: ClassVar[Tuple[str, ...]]
+    #: Атрибуты, не являющиеся полями, для которых нужны слоты при создании моделей со `__slots__`.
+    _extra_slots: ClassVar[Tuple[str, ...]] = ('_id_attrs', '__weakref__')
+    #: Вложенные поля, которые могут быть десериализованы при первом обращении.
+    _lazy_fields: ClassVar[Tuple[str, ...]] = ()
+    #: Поля сырых данных, по которым одинаковые объекты одного ответа могут быть общими.
+    _identity_fields: ClassVar[Tuple[str, ...]] = ()
+    #: Служебные атрибуты экземпляров, которые не сериализуются.
+    _transient_attrs: ClassVar[Tuple[str, ...]] = ()
+
     def __str__(self) -> str:
         return str(self.to_dict())
 
@@ -48,7 +74,17 @@ class YandexMusicModel(YandexMusicObject):
         return str(self)
 
     def __getitem__(self, item: str) -> Any:
-        return self.__dict__[item]
+        if item in self._get_slot_names():
+            try:
+                return getattr(self, item)
+            except AttributeError:
+                raise KeyError(item) from None
+
+        value = getattr(self, '__dict__', {})[item]
+        if isinstance(value, LazyValue):
+            return getattr(self, item)
+
+        return value
 
     @staticmethod
     def report_unknown_fields_callback(klass: type, unknown_fields: JSONType) -> None:
@@ -111,6 +147,148 @@ class YandexMusicModel(YandexMusicObject):
         """
         return bool(data) and isinstance(data, list) and all(isinstance(item, dict) for item in data)
 
+    @classmethod
+    def _get_field_names(cls) -> FrozenSet[str]:
+        """Получение названий полей модели.
+
+        Note:
+            Вычисляется один раз для каждого класса и хранится в самом классе.
+
+        Returns:
+            :obj:`frozenset` из :obj:`str`: Названия полей модели.
+        """
+        field_names = cls.__dict__.get('_field_names')
+        if field_names is None:
+            field_names = frozenset(f.name for f in dataclasses.fields(cls))
+            cls._field_names = field_names
+
+        return field_names
+
+    @classmethod
+    def _get_slot_names(cls) -> Tuple[str, ...]:
+        """Получение названий слотов модели, включая унаследованные.
+
+        Note:
+            Вычисляется один раз для каждого класса и хранится в самом классе. Если модели созданы без `__slots__`,
+            то список пуст.
+
+        Returns:
+            :obj:`tuple` из :obj:`str`: Названия слотов в порядке объявления.
+        """
+        slot_names = cls.__dict__.get('_slot_names')
+        if slot_names is None:
+            names = (name for klass in reversed(cls.__mro__) for name in klass.__dict__.get('__slots__', ()))
+            slot_names = tuple(name for name in names if name not in ('__dict__', '__weakref__'))
+            cls._slot_names = slot_names
+
+        return slot_names
+
+    @staticmethod
+    def _serialized_key(name: str, for_request: bool) -> str:
+        """Получение ключа атрибута в сериализованном объекте.
+
+        Args:
+            name (:obj:`str`): Название атрибута.
+            for_request (:obj:`bool`): Перевести ли название в camelCase.
+
+        Returns:
+            :obj:`str`: Ключ в сериализованном объекте.
+        """
+        if for_request:
+            camel_case = ''.join(word.title() for word in name.split('_'))
+            return camel_case[0].lower() + camel_case[1:]
+
+        if name.lower() in reserved_names:
+            return f'{name}_'
+
+        return name
+
+    @classmethod
+    def _get_key_map(cls, for_request: bool) -> Dict[str, Optional[str]]:
+        """Получение соответствия названий атрибутов ключам сериализованного объекта.
+
+        Note:
+            Для полей модели вычисляется один раз для каждого класса и хранится в самом классе. Соответствие общее
+            для всех экземпляров и не изменяется, ключи остальных атрибутов экземпляров вычисляются при каждой
+            сериализации. Атрибуты с ключом :obj:`None` не сериализуются.
+
+        Args:
+            for_request (:obj:`bool`): Для сериализации в camelCase.
+
+        Returns:
+            :obj:`dict`: Ключи сериализованного объекта по названиям атрибутов.
+        """
+        attr = '_request_key_map' if for_request else '_key_map'
+        key_map = cls.__dict__.get(attr)
+        if key_map is None:
+            key_map = {'client': None, '_id_attrs': None, **dict.fromkeys(cls._transient_attrs)}
+            for name in cls._get_field_names():
+                key_map.setdefault(name, cls._serialized_key(name, for_request))
+            setattr(cls, attr, key_map)
+
+        return key_map
+
+    @staticmethod
+    def _serialize(value: Any, for_request: bool) -> Any:  # noqa: ANN401
+        """Рекурсивная сериализация значения атрибута.
+
+        Args:
+            value (:obj:`Any`): Значение атрибута.
+            for_request (:obj:`bool`): Сериализовать ли вложенные объекты для отправки в теле запроса.
+
+        Returns:
+            :obj:`JSONType`: Сериализованное значение.
+        """
+        if type(value) in _scalar_types:
+            return value
+
+        serialize = YandexMusicModel._serialize
+        if isinstance(value, YandexMusicModel):
+            return value.to_dict(for_request)
+        if isinstance(value, list):
+            return [serialize(item, for_request) for item in value]
+        if isinstance(value, dict):
+            return {key: serialize(item, for_request) for key, item in value.items()}
+        if isinstance(value, LazyValue):
+            return serialize(value.materialize(), for_request)
+
+        return value
+
+    def _get_state(self) -> Dict[str, Any]:
+        """Получение всех атрибутов экземпляра.
+
+        Note:
+            Работает одинаково для моделей с `__dict__` и со `__slots__`. Ленивые поля моделей со `__slots__` при
+            этом десериализуются.
+
+        Returns:
+            :obj:`dict`: Атрибуты экземпляра и их значения.
+        """
+        state = {}
+        for name in self._get_slot_names():
+            with contextlib.suppress(AttributeError):
+                state[name] = getattr(self, name)
+
+        state.update(getattr(self, '__dict__', {}))
+        return state
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        """Замена всех атрибутов экземпляра.
+
+        Args:
+            state (:obj:`dict`): Атрибуты и их значения, полученные из :func:`_get_state`.
+        """
+        slot_names = self._get_slot_names()
+        for name in slot_names:
+            if name in state:
+                setattr(self, name, state[name])
+            elif hasattr(self, name):
+                delattr(self, name)
+
+        if hasattr(self, '__dict__'):
+            self.__dict__.clear()
+            self.__dict__.update({k: v for k, v in state.items() if k not in slot_names})
+
     @classmethod
     def cleanup_data(cls, data: JSONType, client: Optional['ClientType']) -> ModelFieldMap:
         """Удаляет незадекларированные поля для текущей модели из сырых данных.
@@ -118,6 +296,9 @@ class YandexMusicModel(YandexMusicObject):
         Note:
             Фильтрует только словарь поле:значение. Иначе вернёт пустой :obj:`dict`.
 
+            Исходный словарь не изменяется. Неизвестные поля собираются только при включённом
+            `report_unknown_fields` у клиента.
+
         Args:
             data (:obj:`JSONType`): Поля и значения десериализуемого объекта.
             client (:obj:`yandex_music.Client`, optional): Клиент Yandex Music.
@@ -128,23 +309,38 @@ class YandexMusicModel(YandexMusicObject):
         if not YandexMusicModel.is_dict_model_data(data):
             return {}
 
-        data = data.copy()
+        fields = cls._get_field_names()
 
-        fields = {f.name for f in dataclasses.fields(cls)}
+        if client and client.report_unknown_fields:
+            unknown_data = {k: v for k, v in data.items() if k not in fields}
+            if unknown_data:
+                cls.report_unknown_fields_callback(cls, unknown_data)
 
-        cleaned_data: Dict[str, JSONType] = {}
-        unknown_data: Dict[str, JSONType] = {}
+        return {k: v for k, v in data.items() if k in fields}
 
-        for k, v in data.items():
-            if k in fields:
-                cleaned_data[k] = v
-            else:
-                unknown_data[k] = v
+    @staticmethod
+    def de_json_nested(
+        de_json: Callable[['JSONType', 'ClientType'], Any], data: 'JSONType', client: 'ClientType'
+    ) -> Any:  # noqa: ANN401
+        """Десериализация вложенного поля с учётом ленивого режима клиента.
 
-        if client and client.report_unknown_fields and unknown_data:
-            cls.report_unknown_fields_callback(cls, unknown_data)
+        Note:
+            Если у клиента включён `lazy_models`, то вместо десериализации возвращается :class:`LazyValue` с сырыми
+            данными. Десериализация произойдёт при первом обращении к полю, если оно перечислено в `_lazy_fields`
+            модели.
+
+        Args:
+            de_json (:obj:`Callable`): Функция десериализации (`de_json` или `de_list` вложенной модели).
+            data (:obj:`JSONType`): Сырые данные поля.
+            client (:obj:`yandex_music.Client`, optional): Клиент Yandex Music.
 
-        return cleaned_data
+        Returns:
+            :obj:`Any`: Значение поля или :class:`LazyValue`.
+        """
+        if data and client and client.lazy_models:
+            return LazyValue(de_json, data, client)
+
+        return de_json(data, client)
 
     @classmethod
     def de_json(cls, data: 'JSONType', client: 'ClientType') -> Optional[Self]:
@@ -198,6 +394,29 @@ class YandexMusicModel(YandexMusicObject):
         """
         return json.dumps(self.to_dict(for_request), ensure_ascii=not ujson)
 
+    def to_json_bytes(self, for_request: bool = False) -> bytes:
+        """Сериализация объекта в байты.
+
+        Note:
+            Если установлен `orjson`, то JSON формируется им сразу в байтах. Разметка (пробелы, экранирование) может
+            отличаться от :func:`to_json`, но разобранный результат совпадает.
+
+        Args:
+            for_request (:obj:`bool`): Подготовить ли объект для отправки в теле запроса.
+
+        Returns:
+            :obj:`bytes`: Сериализованный в JSON объект в кодировке UTF-8.
+        """
+        if orjson_dumps is not None:
+            data = self.to_dict(for_request)
+            try:
+                return orjson_dumps(data)
+            except TypeError:
+                # например, целые числа больше 64 бит
+                return json.dumps(data, ensure_ascii=not ujson).encode('UTF-8')
+
+        return self.to_json(for_request).encode('UTF-8')
+
     def to_dict(self, for_request: bool = False) -> JSONType:
         """Рекурсивная сериализация объекта.
 
@@ -205,41 +424,37 @@ class YandexMusicModel(YandexMusicObject):
             for_request (:obj:`bool`): Перевести ли обратно все поля в camelCase и игнорировать зарезервированные слова.
 
         Note:
-            Исключает из сериализации `client` и `_id_attrs` необходимые в `__eq__`.
+            Исключает из сериализации `client`, `_id_attrs` необходимые в `__eq__` и атрибуты из `_transient_attrs`.
 
-            К зарезервированным словам добавляет "_" в конец.
+            К зарезервированным словам добавляет "_" в конец, такие ключи идут после остальных.
+
+            Атрибуты экземпляра не копируются, а ключи берутся из вычисленного для класса соответствия
+            (см. :func:`_get_key_map`).
 
         Returns:
             :obj:`dict`: Сериализованный в dict объект.
         """
+        key_map = self._get_key_map(for_request)
+        serialize = YandexMusicModel._serialize
+        state = self._get_state() if self._get_slot_names() else self.__dict__
 
-        def parse(val: Union['YandexMusicModel', JSONType]) -> Any:  # noqa: ANN401
-            if isinstance(val, YandexMusicModel):
-                return val.to_dict(for_request)
-            if isinstance(val, list):
-                return [parse(it) for it in val]
-            if isinstance(val, dict):
-                return {key: parse(value) for key, value in val.items()}
-            return val
+        data = {}
+        renamed = []
+        for name, value in state.items():
+            key = key_map[name] if name in key_map else self._serialized_key(name, for_request)
 
-        data = self.__dict__.copy()
-        data.pop('client', None)
-        data.pop('_id_attrs', None)
+            if key is None:
+                continue
 
-        if for_request:
-            for k, v in data.copy().items():
-                camel_case = ''.join(word.title() for word in k.split('_'))
-                camel_case = camel_case[0].lower() + camel_case[1:]
-
-                data.pop(k)
-                data.update({camel_case: v})
-        else:
-            for k, v in data.copy().items():
-                if k.lower() in reserved_names:
-                    data.pop(k)
-                    data.update({f'{k}_': v})
-
-        return parse(data)
+            if for_request or key == name:
+                data[key] = serialize(value, for_request)
+            else:
+                renamed.append((key, value))
+
+        for key, value in renamed:
+            data[key] = serialize(value, for_request)
+
+        return data
 
     def _get_id_attrs(self) -> Tuple[str]:
         """Получение ключевых атрибутов объекта.
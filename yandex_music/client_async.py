@@ -2,10 +2,11 @@
 # THIS IS AUTO GENERATED COPY OF client.py. DON'T EDIT IN BY HANDS #
 ####################################################################
 
+import asyncio
 import functools
 import logging
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, List, Optional, TypeVar, Union, cast
 
 from yandex_music import (
     Album,
@@ -20,6 +21,7 @@ from yandex_music import (
     Feed,
     Genre,
     HistoryTab,
+    HistoryTrack,
     Landing,
     LandingList,
     Like,
@@ -41,6 +43,7 @@ from yandex_music import (
     TagResult,
     Track,
     TrackLyrics,
+    TrackShort,
     TracksList,
     UserSettings,
     YandexMusicObject,
@@ -52,9 +55,22 @@ from yandex_music import (
 if TYPE_CHECKING:
     from yandex_music.base import JSONType
 from yandex_music.exceptions import BadRequestError
+from yandex_music.utils.audio_cache import AudioCache
 from yandex_music.utils.difference import Difference
+from yandex_music.utils.direct_link_cache import DirectLinkCache
+from yandex_music.utils.entity_cache import EntityBatch, EntityCacheBackend, IdsType
+from yandex_music.utils.identity_map import identity_map_scope
 from yandex_music.utils.request_async import Request
+from yandex_music.utils.response_format import (
+    BYTES_FORMAT,
+    JSON_FORMAT,
+    MODEL_FORMAT,
+    RawResponse,
+    current_response_format,
+    raise_if_raw,
+)
 from yandex_music.utils.sign_request import get_sign_request
+from yandex_music.utils.track_loader import TrackLoader
 
 de_list = {
     'artist': Artist.de_list,
@@ -63,6 +79,11 @@ de_list = {
     'playlist': Playlist.de_list,
 }
 
+#: Максимальное количество идентификаторов в одном запросе списка объектов по умолчанию.
+LIST_CHUNK_SIZE = 500
+#: Максимальное количество одновременно выполняемых запросов частей списка объектов по умолчанию.
+LIST_CONCURRENCY = 4
+
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 F = TypeVar('F', bound=Callable[..., Any])
@@ -78,7 +99,20 @@ def log(method: F) -> F:
     async def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401:
         logger.debug(f'Entering: {method.__name__}')
 
-        result = await method(*args, **kwargs)
+        # формат ответа указанный при вызове, затем унаследованный от внешнего вызова, затем заданный клиенту
+        response_format = kwargs.pop('response_format', None) or current_response_format.get()
+        if response_format is None:
+            response_format = getattr(args[0], 'response_format', MODEL_FORMAT)
+
+        token = current_response_format.set(response_format)
+        try:
+            with identity_map_scope(getattr(args[0], 'identity_map', False)):
+                result = await method(*args, **kwargs)
+        except RawResponse as e:
+            result = e.data
+        finally:
+            current_response_format.reset(token)
+
         logger.debug(result)
 
         logger.debug(f'Exiting: {method.__name__}')
@@ -96,6 +130,11 @@ class ClientAsync(YandexMusicObject):
 
         Поле `device` используется только при работе с очередью прослушивания.
 
+        Возможные значения `response_format`: `model` - модели библиотеки, `json` - секция `result` ответа API с
+        нормализованными ключами, `bytes` - тело ответа без разбора. Форматы `json` и `bytes` не создают моделей
+        и полезны для проксирования ответов. Формат можно переопределить для отдельного вызова, передав методу
+        именованный аргумент `response_format`. Методы моделей (например, `fetch_track`) рассчитаны на формат `model`.
+
     Attributes:
         logger (:obj:`logging.Logger`): Объект логгера.
         token (:obj:`str`): Уникальный ключ для аутентификации.
@@ -104,6 +143,19 @@ class ClientAsync(YandexMusicObject):
         device (:obj:`str`): Строка, содержащая сведения об устройстве, с которого выполняются запросы.
         report_unknown_fields (:obj:`bool`): Включены ли предупреждения о неизвестных полях от API,
             которых нет в библиотеке.
+        response_format (:obj:`str`): Формат ответов методов клиента по умолчанию.
+        lazy_models (:obj:`bool`): Включена ли отложенная десериализация вложенных моделей.
+        identity_map (:obj:`bool`): Включено ли переиспользование одинаковых объектов в пределах ответа.
+        direct_link_cache (:obj:`yandex_music.utils.direct_link_cache.DirectLinkCache`): Кэш информации о загрузке
+            и прямых ссылок или :obj:`None`, если он выключен.
+        audio_cache (:obj:`yandex_music.utils.audio_cache.AudioCache`): Кэш аудиофайлов треков на диске или
+            :obj:`None`, если он выключен.
+        entity_cache (:obj:`yandex_music.utils.entity_cache.EntityCacheBackend`): Кэш исполнителей, альбомов,
+            треков и плейлистов или :obj:`None`, если он выключен.
+        list_chunk_size (:obj:`int`): Максимальное количество идентификаторов в одном запросе списка объектов.
+        list_concurrency (:obj:`int`): Максимальное количество одновременно выполняемых запросов частей списка.
+        track_loader (:obj:`yandex_music.utils.track_loader.TrackLoader`): Загрузчик, объединяющий одновременные
+            запросы отдельных треков, или :obj:`None`, если он выключен.
 
     Args:
         token (:obj:`str`, optional): Уникальный ключ для аутентификации.
@@ -113,6 +165,27 @@ class ClientAsync(YandexMusicObject):
         language (:obj:`str`, optional): Язык, на котором будут приходить ответы от API. По умолчанию русский.
         report_unknown_fields (:obj:`bool`, optional): Включить предупреждения о неизвестных полях от API,
             которых нет в библиотеке.
+        response_format (:obj:`str`, optional): Формат ответов методов клиента по умолчанию.
+        lazy_models (:obj:`bool`, optional): Десериализовать вложенные модели тяжёлых объектов (`Track`, `Album`,
+            `Playlist`) только при первом обращении к ним.
+        identity_map (:obj:`bool`, optional): Создавать один общий объект для одинаковых исполнителей, альбомов,
+            лейблов и обложек в пределах одного ответа. Общий объект виден во всех местах ответа, поэтому его
+            изменение затрагивает их все.
+        direct_link_cache (:obj:`yandex_music.utils.direct_link_cache.DirectLinkCache`, optional): Кэш информации
+            о загрузке и прямых ссылок с учётом срока их жизни. Повторная загрузка или воспроизведение трека не
+            запрашивают их заново, пока они не устарели. Один кэш можно передать нескольким клиентам.
+        audio_cache (:obj:`yandex_music.utils.audio_cache.AudioCache`, optional): Кэш аудиофайлов треков на диске.
+            Загрузка и воспроизведение трека, который уже есть в кэше, выполняются без запросов к API.
+        entity_cache (:obj:`yandex_music.utils.entity_cache.EntityCacheBackend`, optional): Кэш исполнителей,
+            альбомов, треков и плейлистов (например, :class:`yandex_music.utils.entity_cache.EntityCache` в памяти
+            или постоянный :class:`yandex_music.utils.sqlite_entity_cache.SQLiteEntityCache`). Методы получения
+            списка объектов по идентификаторам запрашивают у API только те объекты, которых нет в кэше.
+        list_chunk_size (:obj:`int`, optional): Максимальное количество идентификаторов в одном запросе списка
+            объектов. Более длинные списки запрашиваются частями.
+        list_concurrency (:obj:`int`, optional): Максимальное количество одновременно выполняемых запросов частей
+            списка объектов.
+        track_loader (:obj:`yandex_music.utils.track_loader.TrackLoader`, optional): Загрузчик треков.
+            Одновременные вызовы `fetch_track_async` у треков объединяются в один запрос.
     """
 
     __notice_displayed = True  # больше не используется
@@ -124,6 +197,15 @@ class ClientAsync(YandexMusicObject):
         request: Optional[Request] = None,
         language: str = 'ru',
         report_unknown_fields: bool = False,
+        response_format: str = MODEL_FORMAT,
+        lazy_models: bool = False,
+        identity_map: bool = False,
+        direct_link_cache: Optional[DirectLinkCache] = None,
+        audio_cache: Optional[AudioCache] = None,
+        entity_cache: Optional[EntityCacheBackend] = None,
+        list_chunk_size: int = LIST_CHUNK_SIZE,
+        list_concurrency: int = LIST_CONCURRENCY,
+        track_loader: Optional[TrackLoader] = None,
     ) -> None:
         if not ClientAsync.__notice_displayed:
             print(f'Yandex Music API v{__version__}, {__copyright__}')
@@ -139,6 +221,15 @@ class ClientAsync(YandexMusicObject):
         self.base_url = base_url
 
         self.report_unknown_fields = report_unknown_fields
+        self.response_format = response_format
+        self.lazy_models = lazy_models
+        self.identity_map = identity_map
+        self.direct_link_cache = direct_link_cache
+        self.audio_cache = audio_cache
+        self.entity_cache = entity_cache
+        self.list_chunk_size = list_chunk_size
+        self.list_concurrency = list_concurrency
+        self.track_loader = track_loader
 
         if request:
             self._request = request
@@ -162,10 +253,24 @@ class ClientAsync(YandexMusicObject):
         """:obj:`yandex_music.utils.request.Request`: Объект вспомогательного класса для отправки запросов."""
         return self._request
 
+    async def __aenter__(self) -> 'ClientAsync':
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Закрытие пула соединений, используемого для запросов.
+
+        Note:
+            Клиент можно использовать как контекстный менеджер, тогда метод будет вызван автоматически.
+        """
+        await self._request.close()
+
     @log
     async def init(self) -> 'ClientAsync':
         """Получение информацию об аккаунте использующихся в других запросах."""
-        self.me = await self.account_status()
+        self.me = await self.account_status(response_format=MODEL_FORMAT)
         if self.me and self.me.account:
             self.account_uid = self.me.account.uid
         return self
@@ -557,17 +662,34 @@ class ClientAsync(YandexMusicObject):
             *args: Произвольные аргументы (будут переданы в запрос).
             **kwargs: Произвольные именованные аргументы (будут переданы в запрос).
 
+        Note:
+            Если задан `direct_link_cache`, варианты загрузки и прямые ссылки берутся из кэша, пока они не устарели.
+            Каждый вызов возвращает новые объекты, привязанные к этому клиенту.
+
         Returns:
             :obj:`list` из :obj:`yandex_music.DownloadInfo` | :obj:`None`: Варианты загрузки трека или :obj:`None`.
 
         Raises:
             :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
         """
-        url = f'{self.base_url}/tracks/{track_id}/download-info'
+        # кэшируются только модели, в остальных форматах ответа запрос выполняется всегда
+        cache = self.direct_link_cache if current_response_format.get() == MODEL_FORMAT else None
+        result = cache.get_download_info(track_id) if cache is not None else None
 
-        result = await self._request.get(url, *args, **kwargs)
+        if result is None:
+            url = f'{self.base_url}/tracks/{track_id}/download-info'
+
+            result = await self._request.get(url, *args, **kwargs)
+            if cache is not None:
+                cache.set_download_info(track_id, result)
+
+        # объекты создаются заново, чтобы они были привязаны к этому клиенту, даже если кэш общий
+        download_info = await DownloadInfo.de_list_async(result, self, track_id=track_id)
 
-        return await DownloadInfo.de_list_async(result, self, get_direct_links)
+        if get_direct_links:
+            await DownloadInfo.get_direct_links_async(download_info)
+
+        return download_info
 
     @log
     async def track_supplement(self, track_id: Union[str, int], *args: Any, **kwargs: Any) -> Optional[Supplement]:
@@ -887,6 +1009,37 @@ class ClientAsync(YandexMusicObject):
         result = await self._request.get(url, *args, **kwargs)
         return Playlist.de_json(result, self)
 
+    async def users_playlists_tracks_stream(
+        self, kind: Union[str, int], user_id: UserIdType = None, *args: Any, **kwargs: Any
+    ) -> AsyncIterator[TrackShort]:
+        """Потоковое получение треков плейлиста.
+
+        Note:
+            В отличие от :func:`users_playlists`, ответ разбирается по мере получения, а треки возвращаются по одному.
+            Потребление памяти не зависит от количества треков в плейлисте. Остальные поля плейлиста пропускаются.
+
+        Args:
+            kind (:obj:`str` | :obj:`int`): Уникальный идентификатор плейлиста.
+            user_id (:obj:`str` | :obj:`int`, optional): Уникальный идентификатор пользователя владеющим плейлистом.
+            *args: Произвольные аргументы (будут переданы в запрос).
+            **kwargs: Произвольные именованные аргументы (будут переданы в запрос).
+
+        Yields:
+            :obj:`yandex_music.TrackShort`: Трек плейлиста.
+
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        if user_id is None and self.account_uid is not None:
+            user_id = self.account_uid
+
+        url = f'{self.base_url}/users/{user_id}/playlists/{kind}'
+
+        async for item in self._request.stream(url, ('result', 'tracks'), *args, **kwargs):
+            track = TrackShort.de_json(item, self)
+            if track is not None:
+                yield track
+
     @log
     async def users_playlists_recommendations(
         self, kind: Union[str, int], user_id: UserIdType = None, *args: Any, **kwargs: Any
@@ -1884,6 +2037,57 @@ class ClientAsync(YandexMusicObject):
         """
         return await self._like_action('album', album_ids, remove=True, user_id=user_id, **kwargs)
 
+    async def _post_ids(
+        self, url: str, params: 'JSONType', object_type: str, ids: IdsType, *args: Any, **kwargs: Any
+    ) -> 'JSONType':
+        """Получение списка объектов по идентификаторам, при необходимости частями.
+
+        Note:
+            Список длиннее `list_chunk_size` делится на части, которые запрашиваются параллельно в отдельных задачах
+            не более чем по `list_concurrency` одновременно. Результаты объединяются в порядке частей. При ошибке
+            одной из частей остальные задачи отменяются. Ответ в виде байтов всегда запрашивается одним запросом.
+
+        Args:
+            url (:obj:`str`): Адрес для запроса.
+            params (:obj:`dict`): Остальные параметры запроса.
+            object_type (:obj:`str`): Тип объекта.
+            ids (:obj:`str` | :obj:`int` | :obj:`list` из :obj:`str` | :obj:`list` из :obj:`int`): Уникальный
+                идентификатор объекта или объектов.
+            *args: Произвольные аргументы (будут переданы в запрос).
+            **kwargs: Произвольные именованные аргументы (будут переданы в запрос).
+
+        Returns:
+            :obj:`list`: Объекты из ответов API.
+
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        chunk_size = self.list_chunk_size
+        if not isinstance(ids, list) or len(ids) <= chunk_size or current_response_format.get() == BYTES_FORMAT:
+            return await self._request.post(url, {**params, f'{object_type}-ids': ids}, *args, **kwargs)
+
+        chunks = [ids[position : position + chunk_size] for position in range(0, len(ids), chunk_size)]
+        semaphore = asyncio.Semaphore(self.list_concurrency)
+
+        async def post(chunk: List[Union[str, int]]) -> 'JSONType':
+            # каждая задача работает в копии контекста, формат ответа меняется только для неё
+            current_response_format.set(MODEL_FORMAT)
+            async with semaphore:
+                return await self._request.post(url, {**params, f'{object_type}-ids': chunk}, *args, **kwargs)
+
+        tasks = [asyncio.ensure_future(post(chunk)) for chunk in chunks]
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            # после ошибки одной из частей остальные уже не нужны; у завершённых задач отмена ничего не делает
+            for task in tasks:
+                task.cancel()
+
+        result = [item for chunk_result in results if isinstance(chunk_result, list) for item in chunk_result]
+        raise_if_raw(JSON_FORMAT, result)
+
+        return result
+
     async def _get_list(
         self,
         object_type: str,
@@ -1902,6 +2106,10 @@ class ClientAsync(YandexMusicObject):
             *args: Произвольные аргументы (будут переданы в запрос).
             **kwargs: Произвольные именованные аргументы (будут переданы в запрос).
 
+        Note:
+            Если задан `entity_cache`, запрашиваются только объекты, которых нет в кэше, а результат возвращается
+            в порядке запроса. Длинные списки запрашиваются частями (см. :func:`_post_ids`).
+
         Returns:
             :obj:`list` из :obj:`yandex_music.Artist` | :obj:`list` из :obj:`yandex_music.Album` |
                 :obj:`list` из :obj:`yandex_music.Track` | :obj:`list` из :obj:`yandex_music.Playlist`: Запрошенный
@@ -1912,13 +2120,20 @@ class ClientAsync(YandexMusicObject):
         """
         if params is None:
             params = {}
-        params.update({f'{object_type}-ids': ids})
 
         url = f'{self.base_url}/{object_type}s' + ('/list' if object_type == 'playlist' else '')
 
-        result = await self._request.post(url, params, *args, **kwargs)
+        # кэшируются только модели, в остальных форматах ответа запрос выполняется всегда
+        if self.entity_cache is None or current_response_format.get() != MODEL_FORMAT:
+            result = await self._post_ids(url, params, object_type, ids, *args, **kwargs)
+
+            return de_list[object_type](result, self)
+
+        batch = EntityBatch(self.entity_cache, object_type, ids, params)
+        if batch.missing_ids:
+            batch.add(await self._post_ids(url, params, object_type, batch.missing_ids, *args, **kwargs))
 
-        return de_list[object_type](result, self)
+        return de_list[object_type](batch.result(), self)
 
     @log
     async def artists(
@@ -2131,6 +2346,39 @@ class ClientAsync(YandexMusicObject):
             'track', user_id, {'if-modified-since-revision': if_modified_since_revision}, *args, **kwargs
         )
 
+    async def users_likes_tracks_stream(
+        self, user_id: UserIdType = None, if_modified_since_revision: int = 0, *args: Any, **kwargs: Any
+    ) -> AsyncIterator[TrackShort]:
+        """Потоковое получение треков с отметкой "Мне нравится".
+
+        Note:
+            В отличие от :func:`users_likes_tracks`, ответ разбирается по мере получения, а треки возвращаются по
+            одному. Потребление памяти не зависит от размера библиотеки.
+
+        Args:
+            user_id (:obj:`str` | :obj:`int`, optional): Уникальный идентификатор пользователя. Если не указан
+                используется ID текущего пользователя.
+            if_modified_since_revision (:obj:`int`, optional): TODO.
+            *args: Произвольные аргументы (будут переданы в запрос).
+            **kwargs: Произвольные именованные аргументы (будут переданы в запрос).
+
+        Yields:
+            :obj:`yandex_music.TrackShort`: Трек с отметкой "Мне нравится".
+
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        if user_id is None and self.account_uid is not None:
+            user_id = self.account_uid
+
+        url = f'{self.base_url}/users/{user_id}/likes/tracks'
+        params = {'if-modified-since-revision': if_modified_since_revision}
+
+        async for item in self._request.stream(url, ('result', 'library', 'tracks'), params, *args, **kwargs):
+            track = TrackShort.de_json(item, self)
+            if track is not None:
+                yield track
+
     @log
     async def users_likes_albums(
         self, user_id: UserIdType = None, rich: bool = True, *args: Any, **kwargs: Any
@@ -2464,12 +2712,13 @@ class ClientAsync(YandexMusicObject):
 
     @log
     async def queue_create(
-        self, queue: Union[Queue, str], device: Optional[str] = None, *args: Any, **kwargs: Any
+        self, queue: Union[Queue, str, bytes], device: Optional[str] = None, *args: Any, **kwargs: Any
     ) -> Optional[str]:
         """Создание новой очереди треков.
 
         Args:
-            queue (:obj:`yandex_music.Queue` | :obj:`str`): Объект очереди или JSON строка с этим объектом.
+            queue (:obj:`yandex_music.Queue` | :obj:`str` | :obj:`bytes`): Объект очереди или JSON строка с этим
+                объектом.
             device (:obj:`str`, optional): Содержит информацию об устройстве с которого выполняется запрос.
             *args: Произвольные аргументы (будут переданы в запрос).
             **kwargs: Произвольные именованные аргументы (будут переданы в запрос).
@@ -2484,7 +2733,7 @@ class ClientAsync(YandexMusicObject):
             device = self.device
 
         if isinstance(queue, Queue):
-            queue = queue.to_json(True)
+            queue = queue.to_json_bytes(True)
 
         url = f'{self.base_url}/queues'
 
@@ -2519,6 +2768,39 @@ class ClientAsync(YandexMusicObject):
         history_tabs = HistoryTab.de_list(result.get('history_tabs'), self)
         return HistoryTab.extract_tracks(history_tabs)
 
+    async def music_history_stream(
+        self, full_models_count: int = 999999999, *args: Any, **kwargs: Any
+    ) -> AsyncIterator[HistoryTrack]:
+        """Потоковое получение истории прослушиваний.
+
+        Note:
+            В отличие от :func:`music_history`, ответ разбирается по мере получения, а элементы истории всех вкладок
+            возвращаются по одному. Потребление памяти не зависит от размера истории. Полная модель трека доступна
+            в `data.full_model` элемента.
+
+        Args:
+            full_models_count (:obj:`int`, optional): Количество полных моделей для получения.
+            *args: Произвольные аргументы (будут переданы в запрос).
+            **kwargs: Произвольные именованные аргументы (будут переданы в запрос).
+
+        Yields:
+            :obj:`yandex_music.HistoryTrack`: Трек из истории прослушиваний.
+
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        url = f'{self.base_url}/music-history'
+
+        params = {
+            'fullModelsCount': full_models_count,
+        }
+
+        path = ('result', 'historyTabs', 'items', 'tracks')
+        async for item in self._request.stream(url, path, *args, params=params, **kwargs):
+            history_track = HistoryTrack.de_json(item, self)
+            if history_track is not None:
+                yield history_track
+
     # camelCase псевдонимы
 
     #: Псевдоним для :attr:`account_status`
@@ -2557,6 +2839,8 @@ class ClientAsync(YandexMusicObject):
     usersSettings = users_settings
     #: Псевдоним для :attr:`users_playlists`
     usersPlaylists = users_playlists
+    #: Псевдоним для :attr:`users_playlists_tracks_stream`
+    usersPlaylistsTracksStream = users_playlists_tracks_stream
     #: Псевдоним для :attr:`users_playlists_recommendations`
     usersPlaylistsRecommendations = users_playlists_recommendations
     #: Псевдоним для :attr:`users_playlists_create`
@@ -2625,6 +2909,8 @@ class ClientAsync(YandexMusicObject):
     usersPlaylistsList = users_playlists_list
     #: Псевдоним для :attr:`users_likes_tracks`
     usersLikesTracks = users_likes_tracks
+    #: Псевдоним для :attr:`users_likes_tracks_stream`
+    usersLikesTracksStream = users_likes_tracks_stream
     #: Псевдоним для :attr:`users_likes_albums`
     usersLikesAlbums = users_likes_albums
     #: Псевдоним для :attr:`users_likes_artists`
@@ -2647,3 +2933,5 @@ class ClientAsync(YandexMusicObject):
     queueCreate = queue_create
     #: Псевдоним для :attr:`music_history`
     musicHistory = music_history
+    #: Псевдоним для :attr:`music_history_stream`
+    musicHistoryStream = music_history_stream
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, ClassVar, List, Optional, Tuple
 
 from yandex_music import YandexMusicModel
 from yandex_music.utils import model
@@ -39,6 +39,8 @@ class Cover(YandexMusicModel):
     error: Optional[str] = None
     client: Optional['ClientType'] = None
 
+    _identity_fields: ClassVar[Tuple[str, ...]] = ('prefix', 'uri')
+
     def __post_init__(self) -> None:
         self._id_attrs = (self.prefix, self.version, self.uri, self.items_uri)
 
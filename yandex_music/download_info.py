@@ -1,17 +1,49 @@
-import xml.dom.minidom as minidom
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import md5
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, ClassVar, Iterator, List, Optional, Tuple, Union
 
 from yandex_music import YandexMusicModel
+from yandex_music.exceptions import NetworkError, UnauthorizedError
 from yandex_music.utils import model
+from yandex_music.utils.direct_link_cache import DIRECT_LINK_TTL, REFRESH_MARGIN, DirectLinkCache, is_fresh
+from yandex_music.utils.download_info_xml import parse_download_info_xml
+from yandex_music.utils.json_stream import STREAM_CHUNK_SIZE
 
 if TYPE_CHECKING:
-    from xml.dom.minicompat import NodeList
-
     from yandex_music import ClientType, JSONType
+    from yandex_music.utils.audio_cache import AudioCache
 
 SIGN_SALT = 'XGRlBW9FXlekgbPrRHuSiA'
 
+#: Количество попыток загрузки трека по умолчанию.
+DOWNLOAD_ATTEMPTS = 3
+
+#: Максимальное количество одновременно получаемых прямых ссылок.
+DIRECT_LINK_CONCURRENCY = 8
+
+_direct_link_executor: Optional[ThreadPoolExecutor] = None
+_direct_link_executor_lock = threading.Lock()
+
+
+def _get_direct_link_executor() -> ThreadPoolExecutor:
+    """Общий для всех синхронных клиентов пул потоков для получения прямых ссылок.
+
+    Returns:
+        :obj:`concurrent.futures.ThreadPoolExecutor`: Пул потоков, создаётся при первом обращении.
+    """
+    global _direct_link_executor
+
+    with _direct_link_executor_lock:
+        if _direct_link_executor is None:
+            _direct_link_executor = ThreadPoolExecutor(
+                max_workers=DIRECT_LINK_CONCURRENCY, thread_name_prefix='yandex_music_direct_link'
+            )
+
+    return _direct_link_executor
+
 
 @model
 class DownloadInfo(YandexMusicModel):
@@ -25,6 +57,14 @@ class DownloadInfo(YandexMusicModel):
         download_info_url (:obj:`str`): Ссылка на XML документ содержащий данные для загрузки трека.
         direct (:obj:`bool`): Прямая ли ссылка.
         client (:obj:`yandex_music.Client`, optional): Клиент Yandex Music.
+
+    Note:
+        Полученная прямая ссылка хранится в `direct_link` вместе со сроком жизни и получается заново, когда он
+        подходит к концу. Если у клиента включён кэш прямых ссылок (`direct_link_cache`), а вариант загрузки получен
+        через клиент (известен `track_id`), ссылка сначала ищется в кэше.
+
+        Если у клиента включён кэш аудиофайлов (`audio_cache`) и известен `track_id`, загрузка и воспроизведение
+        сначала ищут трек в нём, а загруженный целиком трек сохраняется в кэш.
     """
 
     codec: str
@@ -35,86 +75,195 @@ class DownloadInfo(YandexMusicModel):
     direct: bool
     client: Optional['ClientType'] = None
 
+    _extra_slots: ClassVar[Tuple[str, ...]] = ('direct_link', 'track_id', '_direct_link_expires_at')
+    _transient_attrs: ClassVar[Tuple[str, ...]] = ('track_id', '_direct_link_expires_at')
+
     def __post_init__(self) -> None:
-        self.direct_link = None
+        self.direct_link: Optional[str] = None
+        self.track_id: Optional[str] = None
+        self._direct_link_expires_at: Optional[float] = None
         self._id_attrs = (self.codec, self.bitrate_in_kbps, self.gain, self.preview, self.download_info_url)
 
-    @staticmethod
-    def _get_text_node_data(elements: 'NodeList') -> Optional[str]:
-        """:obj:`str`: Получение текстовой информации из узлов XML элемента."""
-        for element in elements:
-            nodes = element.childNodes
-            for node in nodes:
-                if node.nodeType == node.TEXT_NODE:
-                    return node.data
+    def __build_direct_link(self, xml: bytes) -> str:
+        fields = parse_download_info_xml(xml)
+        path = fields['path']
+        sign = md5((SIGN_SALT + path[1::] + fields['s']).encode('UTF-8')).hexdigest()  # noqa: S324
 
-        return None
+        return f'https://{fields["host"]}/get-mp3/{sign}/{fields["ts"]}{path}'
 
-    def __build_direct_link(self, xml: bytes) -> str:
-        doc = minidom.parseString(xml)  # noqa: S318
-        host = self._get_text_node_data(doc.getElementsByTagName('host'))
-        path = self._get_text_node_data(doc.getElementsByTagName('path'))
-        ts = self._get_text_node_data(doc.getElementsByTagName('ts'))
-        s = self._get_text_node_data(doc.getElementsByTagName('s'))
-        sign = md5((SIGN_SALT + path[1::] + s).encode('UTF-8')).hexdigest()  # noqa: S324
+    def _get_direct_link_cache(self) -> Optional[DirectLinkCache]:
+        if self.track_id is None:
+            return None
+
+        return getattr(self.client, 'direct_link_cache', None)
+
+    def _get_audio_cache(self) -> Optional['AudioCache']:
+        if self.track_id is None:
+            return None
+
+        return getattr(self.client, 'audio_cache', None)
+
+    def _get_cached_direct_link(self) -> Optional[str]:
+        """Получение ещё не устаревшей прямой ссылки из объекта или из кэша клиента.
+
+        Note:
+            Ссылка, присвоенная `direct_link` вручную, не имеет срока жизни и считается действительной.
+
+        Returns:
+            :obj:`str` | :obj:`None`: Прямая ссылка или :obj:`None`, если её нужно получить заново.
+        """
+        cache = self._get_direct_link_cache()
+        refresh_margin = cache.refresh_margin if cache is not None else REFRESH_MARGIN
 
-        return f'https://{host}/get-mp3/{sign}/{ts}{path}'
+        expires_at = self._direct_link_expires_at
+        if self.direct_link is not None and (expires_at is None or is_fresh(expires_at, refresh_margin)):
+            return self.direct_link
+
+        cached = cache.get_direct_link(self.track_id, self.codec, self.bitrate_in_kbps) if cache is not None else None
+        if cached is None:
+            return None
+
+        self.direct_link, self._direct_link_expires_at = cached
+        return self.direct_link
+
+    def _set_direct_link(self, xml: bytes) -> str:
+        self.direct_link = self.__build_direct_link(xml)
+
+        cache = self._get_direct_link_cache()
+        if cache is not None:
+            self._direct_link_expires_at = cache.set_direct_link(
+                self.track_id, self.codec, self.bitrate_in_kbps, self.direct_link
+            )
+        else:
+            self._direct_link_expires_at = time.monotonic() + DIRECT_LINK_TTL
+
+        return self.direct_link
+
+    def _invalidate_direct_link(self) -> None:
+        """Сброс прямой ссылки в объекте и в кэше клиента, например, после ошибки загрузки по ней."""
+        self.direct_link = self._direct_link_expires_at = None
+
+        cache = self._get_direct_link_cache()
+        if cache is not None:
+            cache.invalidate_direct_link(self.track_id, self.codec, self.bitrate_in_kbps)
 
     def get_direct_link(self) -> str:
         """Получение прямой ссылки на загрузку из XML ответа.
 
         Метод доступен только одну минуту с момента получения информации о загрузке, иначе 410 ошибка!
 
+        Note:
+            Если ранее полученная ссылка ещё не устарела (в объекте или в кэше клиента), запрос не выполняется.
+
         Returns:
             :obj:`str`: Прямая ссылка на загрузку трека.
 
         """
+        direct_link = self._get_cached_direct_link()
+        if direct_link is not None:
+            return direct_link
+
         assert self.valid_client(self.client)
         result = self.client.request.retrieve(self.download_info_url)
 
-        self.direct_link = self.__build_direct_link(result)
-
-        return self.direct_link
+        return self._set_direct_link(result)
 
     async def get_direct_link_async(self) -> str:
         """Получение прямой ссылки на загрузку из XML ответа.
 
         Метод доступен только одну минуту с момента получения информации о загрузке, иначе 410 ошибка!
 
+        Note:
+            Если ранее полученная ссылка ещё не устарела (в объекте или в кэше клиента), запрос не выполняется.
+
         Returns:
             :obj:`str`: Прямая ссылка на загрузку трека.
 
         """
+        direct_link = self._get_cached_direct_link()
+        if direct_link is not None:
+            return direct_link
+
         assert self.valid_async_client(self.client)
         result = await self.client.request.retrieve(self.download_info_url)
 
-        self.direct_link = self.__build_direct_link(result)
+        return self._set_direct_link(result)
 
-        return self.direct_link
-
-    def download(self, filename: str) -> None:
+    def download(self, filename: str, attempts: int = DOWNLOAD_ATTEMPTS, segments: int = 1) -> None:
         """Загрузка трека.
 
+        Note:
+            При ошибке сети или устаревшей прямой ссылке ссылка получается заново, а загрузка продолжается с места
+            обрыва: в файл дописывается только недостающая часть.
+
+            С `segments` больше 1 трек делится на части, которые загружаются параллельно (см.
+            :func:`yandex_music.utils.request.Request.download`).
+
         Args:
             filename (:obj:`str`): Путь и(или) название файла вместе с расширением.
+            attempts (:obj:`int`, optional): Количество попыток загрузки.
+            segments (:obj:`int`, optional): Количество параллельно загружаемых частей.
+
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Если не удалось загрузить трек за все попытки.
         """
-        if self.direct_link is None:
-            self.direct_link = self.get_direct_link()
+        cache = self._get_audio_cache()
+        if cache is not None and cache.copy_to(self.track_id, self.codec, self.bitrate_in_kbps, filename):
+            return
 
-        assert self.valid_client(self.client)
-        self.client.request.download(self.direct_link, filename)
+        direct_link = self.get_direct_link()
 
-    async def download_async(self, filename: str) -> None:
+        assert self.valid_client(self.client)
+        for attempt in range(1, attempts + 1):
+            try:
+                self.client.request.download(direct_link, filename, resume=attempt > 1, segments=segments)
+                if cache is not None:
+                    cache.add_file(self.track_id, self.codec, self.bitrate_in_kbps, filename)
+                return
+            except (NetworkError, UnauthorizedError):
+                if attempt == attempts:
+                    raise
+
+            self._invalidate_direct_link()
+            direct_link = self.get_direct_link()
+
+    async def download_async(self, filename: str, attempts: int = DOWNLOAD_ATTEMPTS, segments: int = 1) -> None:
         """Загрузка трека.
 
+        Note:
+            При ошибке сети или устаревшей прямой ссылке ссылка получается заново, а загрузка продолжается с места
+            обрыва: в файл дописывается только недостающая часть.
+
+            С `segments` больше 1 трек делится на части, которые загружаются параллельно (см.
+            :func:`yandex_music.utils.request.Request.download`).
+
         Args:
             filename (:obj:`str`): Путь и(или) название файла вместе с расширением.
+            attempts (:obj:`int`, optional): Количество попыток загрузки.
+            segments (:obj:`int`, optional): Количество параллельно загружаемых частей.
+
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Если не удалось загрузить трек за все попытки.
         """
-        if self.direct_link is None:
-            self.direct_link = await self.get_direct_link_async()
+        cache = self._get_audio_cache()
+        if cache is not None and cache.copy_to(self.track_id, self.codec, self.bitrate_in_kbps, filename):
+            return
+
+        direct_link = await self.get_direct_link_async()
 
         assert self.valid_async_client(self.client)
-        await self.client.request.download(self.direct_link, filename)
+        for attempt in range(1, attempts + 1):
+            try:
+                await self.client.request.download(direct_link, filename, resume=attempt > 1, segments=segments)
+                if cache is not None:
+                    cache.add_file(self.track_id, self.codec, self.bitrate_in_kbps, filename)
+                return
+            except (NetworkError, UnauthorizedError):
+                if attempt == attempts:
+                    raise
+
+            self._invalidate_direct_link()
+            direct_link = await self.get_direct_link_async()
 
     def download_bytes(self) -> bytes:
         """Загрузка трека и возврат в виде байтов.
@@ -122,11 +271,19 @@ class DownloadInfo(YandexMusicModel):
         Returns:
             :obj:`bytes`: Трек в виде байтов.
         """
-        if self.direct_link is None:
-            self.direct_link = self.get_direct_link()
+        cache = self._get_audio_cache()
+        data = cache.read(self.track_id, self.codec, self.bitrate_in_kbps) if cache is not None else None
+        if data is not None:
+            return data.tobytes()
+
+        direct_link = self.get_direct_link()
 
         assert self.valid_client(self.client)
-        return self.client.request.retrieve(self.direct_link)
+        data = self.client.request.retrieve(direct_link)
+        if cache is not None:
+            cache.put(self.track_id, self.codec, self.bitrate_in_kbps, data)
+
+        return data
 
     async def download_bytes_async(self) -> bytes:
         """Загрузка трека и возврат в виде байтов.
@@ -134,20 +291,150 @@ class DownloadInfo(YandexMusicModel):
         Returns:
             :obj:`bytes`: Трек в виде байтов.
         """
-        if self.direct_link is None:
-            self.direct_link = await self.get_direct_link_async()
+        cache = self._get_audio_cache()
+        data = cache.read(self.track_id, self.codec, self.bitrate_in_kbps) if cache is not None else None
+        if data is not None:
+            return data.tobytes()
+
+        direct_link = await self.get_direct_link_async()
 
         assert self.valid_async_client(self.client)
-        return await self.client.request.retrieve(self.direct_link)
+        data = await self.client.request.retrieve(direct_link)
+        if cache is not None:
+            cache.put(self.track_id, self.codec, self.bitrate_in_kbps, data)
+
+        return data
+
+    def stream(self, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """Загрузка трека по частям.
+
+        Note:
+            В памяти одновременно находится только одна часть трека, а воспроизведение или запись можно начать
+            до окончания загрузки.
+
+        Args:
+            chunk_size (:obj:`int`, optional): Размер части трека в байтах.
+
+        Yields:
+            :obj:`bytes`: Очередная часть трека.
+        """
+        cache = self._get_audio_cache()
+        cached = None
+        if cache is not None:
+            cached = cache.iter_chunks(self.track_id, self.codec, self.bitrate_in_kbps, chunk_size)
+        if cached is not None:
+            yield from cached
+            return
+
+        direct_link = self.get_direct_link()
+
+        assert self.valid_client(self.client)
+        chunks = self.client.request.retrieve_stream(direct_link, chunk_size=chunk_size)
+        if cache is None:
+            yield from chunks
+            return
+
+        # трек попадает в кэш, только если его прочитали до конца
+        with cache.writer(self.track_id, self.codec, self.bitrate_in_kbps) as f:
+            for chunk in chunks:
+                f.write(chunk)
+                yield chunk
+
+    async def stream_async(self, chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Загрузка трека по частям.
+
+        Note:
+            В памяти одновременно находится только одна часть трека, а воспроизведение или запись можно начать
+            до окончания загрузки.
+
+        Args:
+            chunk_size (:obj:`int`, optional): Размер части трека в байтах.
+
+        Yields:
+            :obj:`bytes`: Очередная часть трека.
+        """
+        cache = self._get_audio_cache()
+        cached = None
+        if cache is not None:
+            cached = cache.iter_chunks(self.track_id, self.codec, self.bitrate_in_kbps, chunk_size)
+        if cached is not None:
+            for chunk in cached:
+                yield chunk
+            return
+
+        direct_link = await self.get_direct_link_async()
+
+        assert self.valid_async_client(self.client)
+        chunks = self.client.request.retrieve_stream(direct_link, chunk_size=chunk_size)
+        if cache is None:
+            async for chunk in chunks:
+                yield chunk
+            return
+
+        # трек попадает в кэш, только если его прочитали до конца
+        with cache.writer(self.track_id, self.codec, self.bitrate_in_kbps) as f:
+            async for chunk in chunks:
+                f.write(chunk)
+                yield chunk
+
+    @staticmethod
+    def get_direct_links(download_infos: List['DownloadInfo']) -> List[str]:
+        """Получение прямых ссылок на загрузку нескольких вариантов.
+
+        Note:
+            Прямые ссылки получаются параллельно в общем пуле потоков не более чем по `DIRECT_LINK_CONCURRENCY`
+            одновременно. Ещё не устаревшие ссылки повторно не запрашиваются (см. :func:`get_direct_link`).
+
+        Args:
+            download_infos (:obj:`list` из :obj:`yandex_music.DownloadInfo`): Варианты загрузки.
+
+        Returns:
+            :obj:`list` из :obj:`str`: Прямые ссылки в порядке вариантов загрузки.
+        """
+        return list(_get_direct_link_executor().map(DownloadInfo.get_direct_link, download_infos))
+
+    @staticmethod
+    async def get_direct_links_async(download_infos: List['DownloadInfo']) -> List[str]:
+        """Получение прямых ссылок на загрузку нескольких вариантов.
+
+        Note:
+            Прямые ссылки получаются параллельно не более чем по `DIRECT_LINK_CONCURRENCY` одновременно. Ещё не
+            устаревшие ссылки повторно не запрашиваются (см. :func:`get_direct_link_async`).
+
+        Args:
+            download_infos (:obj:`list` из :obj:`yandex_music.DownloadInfo`): Варианты загрузки.
+
+        Returns:
+            :obj:`list` из :obj:`str`: Прямые ссылки в порядке вариантов загрузки.
+        """
+        semaphore = asyncio.Semaphore(DIRECT_LINK_CONCURRENCY)
+
+        async def _resolve(info: DownloadInfo) -> str:
+            async with semaphore:
+                return await info.get_direct_link_async()
+
+        return await asyncio.gather(*(_resolve(info) for info in download_infos))
 
     @classmethod
-    def de_list(cls, data: 'JSONType', client: 'ClientType', get_direct_links: bool = False) -> List['DownloadInfo']:
+    def de_list(
+        cls,
+        data: 'JSONType',
+        client: 'ClientType',
+        get_direct_links: bool = False,
+        track_id: Optional[Union[str, int]] = None,
+    ) -> List['DownloadInfo']:
         """Десериализация списка объектов.
 
+        Note:
+            Прямые ссылки на все варианты получаются параллельно в общем пуле потоков не более чем по
+            `DIRECT_LINK_CONCURRENCY` одновременно.
+
         Args:
             data (:obj:`list`): Список словарей с полями и значениями десериализуемого объекта.
             get_direct_links (:obj:`bool`): Получать ли сразу прямые ссылки на загрузку.
             client (:obj:`yandex_music.Client`, optional): Клиент Yandex Music.
+            track_id (:obj:`str` | :obj:`int`, optional): Уникальный идентификатор трека, по которому прямые ссылки
+                хранятся в кэше клиента.
 
         Returns:
             :obj:`list` из :obj:`yandex_music.DownloadInfo`: Варианты загрузки треков.
@@ -159,24 +446,34 @@ class DownloadInfo(YandexMusicModel):
         for raw_download_info in data:
             download_info = cls.de_json(raw_download_info, client)
             if download_info:
+                download_info.track_id = None if track_id is None else str(track_id)
                 download_infos.append(download_info)
 
         if get_direct_links:
-            for info in download_infos:
-                info.get_direct_link()
+            cls.get_direct_links(download_infos)
 
         return download_infos
 
     @classmethod
     async def de_list_async(
-        cls, data: 'JSONType', client: 'ClientType', get_direct_links: bool = False
+        cls,
+        data: 'JSONType',
+        client: 'ClientType',
+        get_direct_links: bool = False,
+        track_id: Optional[Union[str, int]] = None,
     ) -> List['DownloadInfo']:
         """Десериализация списка объектов.
 
+        Note:
+            Прямые ссылки на все варианты получаются параллельно не более чем по `DIRECT_LINK_CONCURRENCY`
+            одновременно.
+
         Args:
             data (:obj:`list`): Список словарей с полями и значениями десериализуемого объекта.
             get_direct_links (:obj:`bool`): Получать ли сразу прямые ссылки на загрузку.
             client (:obj:`yandex_music.Client`, optional): Клиент Yandex Music.
+            track_id (:obj:`str` | :obj:`int`, optional): Уникальный идентификатор трека, по которому прямые ссылки
+                хранятся в кэше клиента.
 
         Returns:
             :obj:`list` из :obj:`yandex_music.DownloadInfo`: Варианты загрузки треков.
@@ -188,12 +485,11 @@ class DownloadInfo(YandexMusicModel):
         for raw_download_info in data:
             download_info = cls.de_json(raw_download_info, client)
             if download_info:
+                download_info.track_id = None if track_id is None else str(track_id)
                 download_infos.append(download_info)
 
         if get_direct_links:
-            for info in download_infos:
-                # FIXME (MarshalX): gather or something?
-                await info.get_direct_link_async()
+            await cls.get_direct_links_async(download_infos)
 
         return download_infos
 
@@ -209,3 +505,9 @@ class DownloadInfo(YandexMusicModel):
     downloadBytes = download_bytes
     #: Псевдоним для :attr:`download_bytes_async`
     downloadBytesAsync = download_bytes_async
+    #: Псевдоним для :attr:`stream_async`
+    streamAsync = stream_async
+    #: Псевдоним для :attr:`get_direct_links`
+    getDirectLinks = get_direct_links
+    #: Псевдоним для :attr:`get_direct_links_async`
+    getDirectLinksAsync = get_direct_links_async
@@ -28,6 +28,10 @@ class NotFoundError(NetworkError):
     """Класс исключения, вызываемый в случае ответа от сервера со статус кодом 404."""
 
 
+class IncompleteDownloadError(NetworkError):
+    """Класс исключения, вызываемого при несовпадении размера полученного содержимого с заявленным сервером."""
+
+
 # TimeoutError builtin. Пока не знаю хотим ли использовать его для синхронной и asyncio.TimeoutError для асинхронной
 class TimedOutError(NetworkError):
     """Класс исключения, вызываемого для случаев истечения времени ожидания."""
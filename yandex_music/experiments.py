@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Optional, Tuple
 
 from yandex_music import YandexMusicModel
 from yandex_music.utils import model
@@ -20,6 +20,9 @@ class Experiments(YandexMusicModel):
         **kwargs: Собственно тут и передаются все эти свистелки.
     """
 
+    # названия экспериментов заранее неизвестны, поэтому модель всегда хранит их в `__dict__`
+    _extra_slots: ClassVar[Tuple[str, ...]] = ('__dict__',)
+
     def __init__(self, client: Optional['ClientType'] = None, **kwargs: Any) -> None:
         self.__dict__.update(kwargs)
 
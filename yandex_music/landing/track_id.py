@@ -54,10 +54,17 @@ class TrackId(YandexMusicModel):
     async def fetch_track_async(self, *args: Any, **kwargs: Any) -> 'Track':
         """Получение полной версии трека.
 
+        Note:
+            Если у клиента задан `track_loader`, одновременные вызовы без дополнительных аргументов объединяются в
+            один запрос.
+
         Returns:
             :obj:`yandex_music.Track`: Полная версия.
         """
         assert self.valid_async_client(self.client)
+        if self.client.track_loader is not None and not args and not kwargs:
+            return await self.client.track_loader.load(self.client, self.track_full_id)
+
         return (await self.client.tracks(self.track_full_id, *args, **kwargs))[0]
 
     # camelCase псевдонимы
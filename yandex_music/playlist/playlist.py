@@ -1,8 +1,10 @@
 from dataclasses import field
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, List, Optional, Tuple
 
 from yandex_music import YandexMusicModel
 from yandex_music.utils import model
+from yandex_music.utils.response_format import MODEL_FORMAT
+from yandex_music.utils.track_loader import fill_tracks
 
 if TYPE_CHECKING:
     from yandex_music import (
@@ -162,6 +164,26 @@ class Playlist(YandexMusicModel):
     pager: Optional['Pager'] = None
     client: Optional['ClientType'] = None
 
+    _lazy_fields: ClassVar[Tuple[str, ...]] = (
+        'owner',
+        'cover',
+        'cover_without_text',
+        'made_for',
+        'tracks',
+        'recent_tracks',
+        'play_counter',
+        'top_artist',
+        'contest',
+        'og_data',
+        'dummy_cover',
+        'dummy_rollover_cover',
+        'branding',
+        'similar_playlists',
+        'last_owner_playlists',
+        'custom_wave',
+        'pager',
+    )
+
     def __post_init__(self) -> None:
         self._id_attrs = (self.uid, self.kind, self.title, self.playlist_absence)
 
@@ -328,8 +350,7 @@ class Playlist(YandexMusicModel):
         assert isinstance(self.kind, int)
         client, kind = self.client, self.kind
 
-        self.__dict__.clear()
-        self.__dict__.update(client.users_playlists_name(kind, name, *args, **kwargs).__dict__)
+        self._set_state(client.users_playlists_name(kind, name, *args, **kwargs)._get_state())
 
     async def rename_async(self, name: str, *args: Any, **kwargs: Any) -> None:
         """Сокращение для::
@@ -340,8 +361,7 @@ class Playlist(YandexMusicModel):
         assert isinstance(self.kind, int)
         client, kind = self.client, self.kind
 
-        self.__dict__.clear()
-        self.__dict__.update((await client.users_playlists_name(kind, name, *args, **kwargs)).__dict__)
+        self._set_state((await client.users_playlists_name(kind, name, *args, **kwargs))._get_state())
 
     def like(self, *args: Any, **kwargs: Any) -> bool:
         """Сокращение для::
@@ -403,6 +423,46 @@ class Playlist(YandexMusicModel):
         assert isinstance(playlist, Playlist)
         return playlist.tracks
 
+    def hydrate_tracks(self) -> List['TrackShort']:
+        """Загрузка полных версий всех треков плейлиста одним запросом.
+
+        Note:
+            Полные версии запрашиваются только для треков без поля `track` и записываются в это поле. Длинные
+            списки клиент запрашивает частями. Треки запрашиваются в формате `model`
+            независимо от формата ответов клиента. Треки должны быть уже получены (см. :func:`fetch_tracks`).
+
+        Returns:
+            :obj:`list` из :obj:`yandex_music.TrackShort`: Треки плейлиста с заполненным полем `track`.
+        """
+        assert self.valid_client(self.client)
+
+        missing = [track for track in self.tracks if track.track is None]
+        if missing:
+            tracks = self.client.tracks([track.track_id for track in missing], response_format=MODEL_FORMAT)
+            fill_tracks(missing, tracks)
+
+        return self.tracks
+
+    async def hydrate_tracks_async(self) -> List['TrackShort']:
+        """Загрузка полных версий всех треков плейлиста одним запросом.
+
+        Note:
+            Полные версии запрашиваются только для треков без поля `track` и записываются в это поле. Длинные
+            списки клиент запрашивает частями. Треки запрашиваются в формате `model`
+            независимо от формата ответов клиента. Треки должны быть уже получены (см. :func:`fetch_tracks`).
+
+        Returns:
+            :obj:`list` из :obj:`yandex_music.TrackShort`: Треки плейлиста с заполненным полем `track`.
+        """
+        assert self.valid_async_client(self.client)
+
+        missing = [track for track in self.tracks if track.track is None]
+        if missing:
+            tracks = await self.client.tracks([track.track_id for track in missing], response_format=MODEL_FORMAT)
+            fill_tracks(missing, tracks)
+
+        return self.tracks
+
     def insert_track(self, track_id: int, album_id: int, **kwargs: Any) -> Optional['Playlist']:
         """Сокращение для::
 
@@ -508,30 +568,32 @@ class Playlist(YandexMusicModel):
             User,
         )
 
-        cls_data['owner'] = User.de_json(data.get('owner'), client)
-        cls_data['cover'] = Cover.de_json(data.get('cover'), client)
-        cls_data['cover_without_text'] = Cover.de_json(data.get('cover_without_text'), client)
-        cls_data['made_for'] = MadeFor.de_json(data.get('made_for'), client)
-        cls_data['tracks'] = TrackShort.de_list(data.get('tracks'), client)
-        cls_data['recent_tracks'] = TrackId.de_list(data.get('recent_tracks'), client)
-        cls_data['play_counter'] = PlayCounter.de_json(data.get('play_counter'), client)
-        cls_data['top_artist'] = Artist.de_list(data.get('top_artist'), client)
-        cls_data['contest'] = Contest.de_json(data.get('contest'), client)
-        cls_data['og_data'] = OpenGraphData.de_json(data.get('og_data'), client)
-        cls_data['dummy_cover'] = Cover.de_json(data.get('dummy_cover'), client)
-        cls_data['dummy_rollover_cover'] = Cover.de_json(data.get('dummy_rollover_cover'), client)
-        cls_data['branding'] = Brand.de_json(data.get('branding'), client)
-
-        cls_data['similar_playlists'] = Playlist.de_list(data.get('similar_playlists'), client)
-        cls_data['last_owner_playlists'] = Playlist.de_list(data.get('last_owner_playlists'), client)
+        cls_data['owner'] = cls.de_json_nested(User.de_json, data.get('owner'), client)
+        cls_data['cover'] = cls.de_json_nested(Cover.de_json, data.get('cover'), client)
+        cls_data['cover_without_text'] = cls.de_json_nested(Cover.de_json, data.get('cover_without_text'), client)
+        cls_data['made_for'] = cls.de_json_nested(MadeFor.de_json, data.get('made_for'), client)
+        cls_data['tracks'] = cls.de_json_nested(TrackShort.de_list, data.get('tracks'), client)
+        cls_data['recent_tracks'] = cls.de_json_nested(TrackId.de_list, data.get('recent_tracks'), client)
+        cls_data['play_counter'] = cls.de_json_nested(PlayCounter.de_json, data.get('play_counter'), client)
+        cls_data['top_artist'] = cls.de_json_nested(Artist.de_list, data.get('top_artist'), client)
+        cls_data['contest'] = cls.de_json_nested(Contest.de_json, data.get('contest'), client)
+        cls_data['og_data'] = cls.de_json_nested(OpenGraphData.de_json, data.get('og_data'), client)
+        cls_data['dummy_cover'] = cls.de_json_nested(Cover.de_json, data.get('dummy_cover'), client)
+        cls_data['dummy_rollover_cover'] = cls.de_json_nested(Cover.de_json, data.get('dummy_rollover_cover'), client)
+        cls_data['branding'] = cls.de_json_nested(Brand.de_json, data.get('branding'), client)
+
+        cls_data['similar_playlists'] = cls.de_json_nested(Playlist.de_list, data.get('similar_playlists'), client)
+        cls_data['last_owner_playlists'] = cls.de_json_nested(
+            Playlist.de_list, data.get('last_owner_playlists'), client
+        )
 
         cls_data['playlist_absence'] = PlaylistAbsence.de_json(data.get('playlist_absence'), client)  # на случай фикса
         if data.get('playlist_absense'):  # очепятка яндуха
             cls_data['playlist_absence'] = PlaylistAbsence.de_json(data.get('playlist_absense'), client)
             cls_data.pop('playlist_absense')
 
-        cls_data['custom_wave'] = CustomWave.de_json(data.get('custom_wave'), client)
-        cls_data['pager'] = Pager.de_json(data.get('pager'), client)
+        cls_data['custom_wave'] = cls.de_json_nested(CustomWave.de_json, data.get('custom_wave'), client)
+        cls_data['pager'] = cls.de_json_nested(Pager.de_json, data.get('pager'), client)
 
         return cls(client=client, **cls_data)  # type: ignore
 
@@ -575,6 +637,10 @@ class Playlist(YandexMusicModel):
     fetchTracks = fetch_tracks
     #: Псевдоним для :attr:`fetch_tracks_async`
     fetchTracksAsync = fetch_tracks_async
+    #: Псевдоним для :attr:`hydrate_tracks`
+    hydrateTracks = hydrate_tracks
+    #: Псевдоним для :attr:`hydrate_tracks_async`
+    hydrateTracksAsync = hydrate_tracks_async
     #: Псевдоним для :attr:`insert_track`
     insertTrack = insert_track
     #: Псевдоним для :attr:`insert_track_async`
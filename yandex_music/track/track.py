@@ -1,9 +1,10 @@
 from dataclasses import field
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, ClassVar, Iterator, List, Optional, Tuple, Union
 
 from yandex_music import YandexMusicModel
 from yandex_music.exceptions import InvalidBitrateError
 from yandex_music.utils import model
+from yandex_music.utils.json_stream import STREAM_CHUNK_SIZE
 
 if TYPE_CHECKING:
     from yandex_music import (
@@ -22,6 +23,7 @@ if TYPE_CHECKING:
         TrackLyrics,
         User,
     )
+    from yandex_music.utils.audio_cache import AudioCache
 
 
 @model
@@ -140,6 +142,21 @@ class Track(YandexMusicModel):
     track_sharing_flag: Optional[str] = None
     client: Optional['ClientType'] = None
 
+    _extra_slots: ClassVar[Tuple[str, ...]] = ('download_info',)
+    _lazy_fields: ClassVar[Tuple[str, ...]] = (
+        'albums',
+        'artists',
+        'normalization',
+        'major',
+        'substituted',
+        'matched_track',
+        'user_info',
+        'meta_data',
+        'poetry_lover_matches',
+        'r128',
+        'lyrics_info',
+    )
+
     def __post_init__(self) -> None:
         self.download_info = None
         self._id_attrs = (self.id,)
@@ -350,7 +367,10 @@ class Track(YandexMusicModel):
                 return info
         return None
 
-    def download(self, filename: str, codec: str = 'mp3', bitrate_in_kbps: int = 192) -> None:
+    def _get_audio_cache(self) -> Optional['AudioCache']:
+        return getattr(self.client, 'audio_cache', None)
+
+    def download(self, filename: str, codec: str = 'mp3', bitrate_in_kbps: int = 192, segments: int = 1) -> None:
         """Загрузка трека.
 
         Note:
@@ -358,21 +378,30 @@ class Track(YandexMusicModel):
 
             Известные значения `bitrate_in_kbps`: `64`, `128`, `192`, `320`.
 
+            Если трек есть в кэше аудиофайлов клиента (`audio_cache`), запросы к API не выполняются.
+
         Args:
             filename (:obj:`str`): Путь для сохранения файла с названием и расширением.
             codec (:obj:`str`, optional): Кодек из доступных в `self.download_info`.
             bitrate_in_kbps (:obj:`int`, optional): Битрейт из доступных в `self.download_info` для данного кодека.
+            segments (:obj:`int`, optional): Количество параллельно загружаемых частей трека.
 
         Raises:
             :class:`yandex_music.exceptions.InvalidBitrateError`: Если в `self.download_info` не найден подходящий трек.
         """
+        cache = self._get_audio_cache()
+        if cache is not None and cache.copy_to(self.id, codec, bitrate_in_kbps, filename):
+            return
+
         info = self.get_specific_download_info(codec, bitrate_in_kbps)
         if info:
-            info.download(filename)
+            info.download(filename, segments=segments)
         else:
             raise InvalidBitrateError('Unavailable bitrate')
 
-    async def download_async(self, filename: str, codec: str = 'mp3', bitrate_in_kbps: int = 192) -> None:
+    async def download_async(
+        self, filename: str, codec: str = 'mp3', bitrate_in_kbps: int = 192, segments: int = 1
+    ) -> None:
         """Загрузка трека.
 
         Note:
@@ -380,17 +409,24 @@ class Track(YandexMusicModel):
 
             Известные значения `bitrate_in_kbps`: `64`, `128`, `192`, `320`.
 
+            Если трек есть в кэше аудиофайлов клиента (`audio_cache`), запросы к API не выполняются.
+
         Args:
             filename (:obj:`str`): Путь для сохранения файла с названием и расширением.
             codec (:obj:`str`, optional): Кодек из доступных в `self.download_info`.
             bitrate_in_kbps (:obj:`int`, optional): Битрейт из доступных в `self.download_info` для данного кодека.
+            segments (:obj:`int`, optional): Количество параллельно загружаемых частей трека.
 
         Raises:
             :class:`yandex_music.exceptions.InvalidBitrateError`: Если в `self.download_info` не найден подходящий трек.
         """
+        cache = self._get_audio_cache()
+        if cache is not None and cache.copy_to(self.id, codec, bitrate_in_kbps, filename):
+            return
+
         info = await self.get_specific_download_info_async(codec, bitrate_in_kbps)
         if info:
-            await info.download_async(filename)
+            await info.download_async(filename, segments=segments)
         else:
             raise InvalidBitrateError('Unavailable bitrate')
 
@@ -402,6 +438,8 @@ class Track(YandexMusicModel):
 
             Известные значения `bitrate_in_kbps`: `64`, `128`, `192`, `320`.
 
+            Если трек есть в кэше аудиофайлов клиента (`audio_cache`), запросы к API не выполняются.
+
         Args:
             codec (:obj:`str`, optional): Кодек из доступных в `self.download_info`.
             bitrate_in_kbps (:obj:`int`, optional): Битрейт из доступных в `self.download_info` для данного кодека.
@@ -412,6 +450,11 @@ class Track(YandexMusicModel):
         Returns:
             :obj:`bytes`: Трек в виде байтов.
         """
+        cache = self._get_audio_cache()
+        data = cache.read(self.id, codec, bitrate_in_kbps) if cache is not None else None
+        if data is not None:
+            return data.tobytes()
+
         info = self.get_specific_download_info(codec, bitrate_in_kbps)
         if info:
             return info.download_bytes()
@@ -426,6 +469,8 @@ class Track(YandexMusicModel):
 
             Известные значения `bitrate_in_kbps`: `64`, `128`, `192`, `320`.
 
+            Если трек есть в кэше аудиофайлов клиента (`audio_cache`), запросы к API не выполняются.
+
         Args:
             codec (:obj:`str`, optional): Кодек из доступных в `self.download_info`.
             bitrate_in_kbps (:obj:`int`, optional): Битрейт из доступных в `self.download_info` для данного кодека.
@@ -436,12 +481,93 @@ class Track(YandexMusicModel):
         Returns:
             :obj:`bytes`: Трек в виде байтов.
         """
+        cache = self._get_audio_cache()
+        data = cache.read(self.id, codec, bitrate_in_kbps) if cache is not None else None
+        if data is not None:
+            return data.tobytes()
+
         info = await self.get_specific_download_info_async(codec, bitrate_in_kbps)
         if info:
             return await info.download_bytes_async()
 
         raise InvalidBitrateError('Unavailable bitrate')
 
+    def stream(
+        self, codec: str = 'mp3', bitrate_in_kbps: int = 192, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Загрузка трека по частям.
+
+        Note:
+            Известные значения `codec`: `mp3`, `aac`.
+
+            Известные значения `bitrate_in_kbps`: `64`, `128`, `192`, `320`.
+
+            Если трек есть в кэше аудиофайлов клиента (`audio_cache`), запросы к API не выполняются.
+
+            Подходящий вариант загрузки выбирается при получении первой части.
+
+        Args:
+            codec (:obj:`str`, optional): Кодек из доступных в `self.download_info`.
+            bitrate_in_kbps (:obj:`int`, optional): Битрейт из доступных в `self.download_info` для данного кодека.
+            chunk_size (:obj:`int`, optional): Размер части трека в байтах.
+
+        Raises:
+            :class:`yandex_music.exceptions.InvalidBitrateError`: Если в `self.download_info` не найден подходящий трек.
+
+        Yields:
+            :obj:`bytes`: Очередная часть трека.
+        """
+        cache = self._get_audio_cache()
+        cached = cache.iter_chunks(self.id, codec, bitrate_in_kbps, chunk_size) if cache is not None else None
+        if cached is not None:
+            yield from cached
+            return
+
+        info = self.get_specific_download_info(codec, bitrate_in_kbps)
+        if not info:
+            raise InvalidBitrateError('Unavailable bitrate')
+
+        yield from info.stream(chunk_size)
+
+    async def stream_async(
+        self, codec: str = 'mp3', bitrate_in_kbps: int = 192, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Загрузка трека по частям.
+
+        Note:
+            Известные значения `codec`: `mp3`, `aac`.
+
+            Известные значения `bitrate_in_kbps`: `64`, `128`, `192`, `320`.
+
+            Если трек есть в кэше аудиофайлов клиента (`audio_cache`), запросы к API не выполняются.
+
+            Подходящий вариант загрузки выбирается при получении первой части.
+
+        Args:
+            codec (:obj:`str`, optional): Кодек из доступных в `self.download_info`.
+            bitrate_in_kbps (:obj:`int`, optional): Битрейт из доступных в `self.download_info` для данного кодека.
+            chunk_size (:obj:`int`, optional): Размер части трека в байтах.
+
+        Raises:
+            :class:`yandex_music.exceptions.InvalidBitrateError`: Если в `self.download_info` не найден подходящий трек.
+
+        Yields:
+            :obj:`bytes`: Очередная часть трека.
+        """
+        cache = self._get_audio_cache()
+        cached = cache.iter_chunks(self.id, codec, bitrate_in_kbps, chunk_size) if cache is not None else None
+        if cached is not None:
+            for chunk in cached:
+                yield chunk
+            return
+
+        info = await self.get_specific_download_info_async(codec, bitrate_in_kbps)
+        if not info:
+            raise InvalidBitrateError('Unavailable bitrate')
+
+        async for chunk in info.stream_async(chunk_size):
+            yield chunk
+
     def like(self, *args: Any, **kwargs: Any) -> bool:
         """Сокращение для::
 
@@ -506,17 +632,19 @@ class Track(YandexMusicModel):
         cls_data = cls.cleanup_data(data, client)
         from yandex_music import R128, Album, Artist, LyricsInfo, Major, MetaData, Normalization, PoetryLoverMatch, User
 
-        cls_data['albums'] = Album.de_list(data.get('albums'), client)
-        cls_data['artists'] = Artist.de_list(data.get('artists'), client)
-        cls_data['normalization'] = Normalization.de_json(data.get('normalization'), client)
-        cls_data['major'] = Major.de_json(data.get('major'), client)
-        cls_data['substituted'] = Track.de_json(data.get('substituted'), client)
-        cls_data['matched_track'] = Track.de_json(data.get('matched_track'), client)
-        cls_data['user_info'] = User.de_json(data.get('user_info'), client)
-        cls_data['meta_data'] = MetaData.de_json(data.get('meta_data'), client)
-        cls_data['poetry_lover_matches'] = PoetryLoverMatch.de_list(data.get('poetry_lover_matches'), client)
-        cls_data['r128'] = R128.de_json(data.get('r128'), client)
-        cls_data['lyrics_info'] = LyricsInfo.de_json(data.get('lyrics_info'), client)
+        cls_data['albums'] = cls.de_json_nested(Album.de_list, data.get('albums'), client)
+        cls_data['artists'] = cls.de_json_nested(Artist.de_list, data.get('artists'), client)
+        cls_data['normalization'] = cls.de_json_nested(Normalization.de_json, data.get('normalization'), client)
+        cls_data['major'] = cls.de_json_nested(Major.de_json, data.get('major'), client)
+        cls_data['substituted'] = cls.de_json_nested(Track.de_json, data.get('substituted'), client)
+        cls_data['matched_track'] = cls.de_json_nested(Track.de_json, data.get('matched_track'), client)
+        cls_data['user_info'] = cls.de_json_nested(User.de_json, data.get('user_info'), client)
+        cls_data['meta_data'] = cls.de_json_nested(MetaData.de_json, data.get('meta_data'), client)
+        cls_data['poetry_lover_matches'] = cls.de_json_nested(
+            PoetryLoverMatch.de_list, data.get('poetry_lover_matches'), client
+        )
+        cls_data['r128'] = cls.de_json_nested(R128.de_json, data.get('r128'), client)
+        cls_data['lyrics_info'] = cls.de_json_nested(LyricsInfo.de_json, data.get('lyrics_info'), client)
 
         return cls(client=client, **cls_data)  # type: ignore
 
@@ -564,6 +692,8 @@ class Track(YandexMusicModel):
     downloadBytes = download_bytes
     #: Псевдоним для :attr:`download_bytes_async`
     downloadBytesAsync = download_bytes_async
+    #: Псевдоним для :attr:`stream_async`
+    streamAsync = stream_async
     #: Псевдоним для :attr:`like_async`
     likeAsync = like_async
     #: Псевдоним для :attr:`dislike_async`
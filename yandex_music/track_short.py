@@ -51,10 +51,16 @@ class TrackShort(YandexMusicModel):
     async def fetch_track_async(self) -> 'Track':
         """Получение полной версии трека.
 
+        Note:
+            Если у клиента задан `track_loader`, одновременные вызовы объединяются в один запрос.
+
         Returns:
             :obj:`yandex_music.Track`: Полная версия трека.
         """
         assert self.valid_async_client(self.client)
+        if self.client.track_loader is not None:
+            return await self.client.track_loader.load(self.client, self.track_id)
+
         return (await self.client.tracks(self.track_id))[0]
 
     @property
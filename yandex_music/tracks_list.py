@@ -2,6 +2,8 @@ from typing import TYPE_CHECKING, Iterator, List, Optional
 
 from yandex_music import YandexMusicModel
 from yandex_music.utils import model
+from yandex_music.utils.response_format import MODEL_FORMAT
+from yandex_music.utils.track_loader import fill_tracks
 
 if TYPE_CHECKING:
     from yandex_music import ClientType, JSONType, Track, TrackShort
@@ -58,6 +60,46 @@ class TracksList(YandexMusicModel):
         assert self.valid_async_client(self.client)
         return await self.client.tracks(self.tracks_ids)
 
+    def hydrate_tracks(self) -> List['TrackShort']:
+        """Загрузка полных версий всех треков списка одним запросом.
+
+        Note:
+            Полные версии запрашиваются только для треков без поля `track` и записываются в это поле. Длинные
+            списки клиент запрашивает частями. Треки запрашиваются в формате `model`
+            независимо от формата ответов клиента.
+
+        Returns:
+            :obj:`list` из :obj:`yandex_music.TrackShort`: Треки списка с заполненным полем `track`.
+        """
+        assert self.valid_client(self.client)
+
+        missing = [track for track in self.tracks if track.track is None]
+        if missing:
+            tracks = self.client.tracks([track.track_id for track in missing], response_format=MODEL_FORMAT)
+            fill_tracks(missing, tracks)
+
+        return self.tracks
+
+    async def hydrate_tracks_async(self) -> List['TrackShort']:
+        """Загрузка полных версий всех треков списка одним запросом.
+
+        Note:
+            Полные версии запрашиваются только для треков без поля `track` и записываются в это поле. Длинные
+            списки клиент запрашивает частями. Треки запрашиваются в формате `model`
+            независимо от формата ответов клиента.
+
+        Returns:
+            :obj:`list` из :obj:`yandex_music.TrackShort`: Треки списка с заполненным полем `track`.
+        """
+        assert self.valid_async_client(self.client)
+
+        missing = [track for track in self.tracks if track.track is None]
+        if missing:
+            tracks = await self.client.tracks([track.track_id for track in missing], response_format=MODEL_FORMAT)
+            fill_tracks(missing, tracks)
+
+        return self.tracks
+
     @classmethod
     def de_json(cls, data: 'JSONType', client: 'ClientType') -> Optional['TracksList']:
         """Десериализация объекта.
@@ -87,3 +129,7 @@ class TracksList(YandexMusicModel):
     fetchTracks = fetch_tracks
     #: Псевдоним для :attr:`fetch_tracks_async`
     fetchTracksAsync = fetch_tracks_async
+    #: Псевдоним для :attr:`hydrate_tracks`
+    hydrateTracks = hydrate_tracks
+    #: Псевдоним для :attr:`hydrate_tracks_async`
+    hydrateTracksAsync = hydrate_tracks_async
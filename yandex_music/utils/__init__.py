@@ -1,13 +1,76 @@
 import dataclasses
-from typing import Type, TypeVar
+import os
+from typing import Any, Dict, Type, TypeVar
 
 from typing_extensions import dataclass_transform
 
+from yandex_music.utils.identity_map import share_instances
+from yandex_music.utils.lazy import LazyField
+
 _T = TypeVar('_T')
 
+#: Создавать ли модели со `__slots__` вместо `__dict__`. Включается переменной окружения `YANDEX_MUSIC_SLOTS=1`
+#: до импорта библиотеки. Экономит память при хранении большого количества моделей, но запрещает добавлять
+#: экземплярам атрибуты, не объявленные в модели.
+SLOTS = os.environ.get('YANDEX_MUSIC_SLOTS', '').lower() in ('1', 'true', 'yes')
+
+
+def _add_slots(cls: Type[_T]) -> Type[_T]:
+    """Пересоздание класса модели со `__slots__`.
+
+    Note:
+        Слоты создаются для собственных полей модели и для атрибутов из `_extra_slots`, которые модель
+        устанавливает сама (например, в `__post_init__`). Значения по умолчанию уже сохранены в `__init__`,
+        поэтому из словаря класса они удаляются.
+
+    Args:
+        cls (:obj:`type`): Класс модели после применения `dataclasses.dataclass`.
+
+    Returns:
+        :obj:`type`: Новый класс модели со `__slots__`.
+    """
+    inherited_slots = {name for base in cls.__mro__[1:] for name in base.__dict__.get('__slots__', ())}
+    names = (*(f.name for f in dataclasses.fields(cls)), *cls.__dict__.get('_extra_slots', ()))
+    slots = tuple(dict.fromkeys(name for name in names if name not in inherited_slots))
+
+    cls_dict: Dict[str, Any] = dict(cls.__dict__)
+    defaults = {name: cls_dict.pop(name) for name in slots if name in cls_dict}
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    cls_dict['__slots__'] = slots
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+
+    # `super()` без аргументов ссылается на исходный класс через ячейку `__class__`
+    for member in cls_dict.values():
+        func = getattr(member, '__func__', member)
+        for cell in getattr(func, '__closure__', None) or ():
+            if cell.cell_contents is cls:
+                cell.cell_contents = slotted_cls
+
+    # поля, которые могут быть десериализованы при первом обращении, хранятся в слотах
+    for name in cls.__dict__.get('_lazy_fields', ()):
+        setattr(slotted_cls, name, LazyField(name, defaults.get(name), slotted_cls.__dict__[name]))
+
+    return slotted_cls
+
 
 @dataclass_transform(
     field_specifiers=(dataclasses.Field, dataclasses.field),
 )
 def model(cls: Type[_T]) -> Type[_T]:
-    return dataclasses.dataclass(eq=False, repr=False)(cls)
+    cls = dataclasses.dataclass(eq=False, repr=False)(cls)
+
+    if SLOTS:
+        cls = _add_slots(cls)
+    else:
+        # поля, которые могут быть десериализованы при первом обращении (см. YandexMusicModel.de_json_nested)
+        for name in cls.__dict__.get('_lazy_fields', ()):
+            setattr(cls, name, LazyField(name, cls.__dict__.get(name)))
+
+    # одинаковые объекты в пределах ответа могут быть общими (см. yandex_music.utils.identity_map)
+    if cls.__dict__.get('_identity_fields'):
+        cls.de_json = classmethod(share_instances(cls.de_json.__func__))  # type: ignore[attr-defined]
+
+    return cls
@@ -0,0 +1,287 @@
+import contextlib
+import hashlib
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import BinaryIO, Iterator, Optional, Union
+
+from yandex_music.utils.json_stream import STREAM_CHUNK_SIZE
+
+#: Максимальный суммарный размер файлов кэша в байтах по умолчанию.
+AUDIO_CACHE_SIZE = 2 * 2**30
+
+#: Суффикс временного файла, в который идёт запись до её успешного завершения.
+PART_SUFFIX = '.part'
+
+
+class AudioCache:
+    """Класс, представляющий кэш аудиофайлов треков на диске.
+
+    Note:
+        Файл определяется идентификатором трека, кодеком и битрейтом. Идентификатор альбома в `track_id`
+        (`номер:альбом`) не учитывается. Имя файла - хэш этих значений, поэтому по нему можно найти файл без
+        запросов к API.
+
+        Файл сначала пишется во временный файл с суффиксом `.part` и появляется в кэше только после успешного
+        завершения записи, поэтому в кэше не бывает недописанных файлов.
+
+        При превышении `max_size` удаляются файлы, к которым дольше всего не обращались. Время последнего обращения
+        хранится во времени изменения файла, поэтому порядок вытеснения переживает перезапуск. Учитываются файлы,
+        найденные в папке при создании объекта и добавленные через него.
+
+        Чтение идёт через отображение файла в память (`mmap`) без промежуточного буфера на весь файл.
+
+        Операции с кэшем синхронные и в асинхронных методах выполняются в цикле событий.
+
+    Args:
+        directory (:obj:`str`): Папка кэша.
+        max_size (:obj:`int`, optional): Максимальный суммарный размер файлов в байтах.
+    """
+
+    def __init__(self, directory: str, max_size: int = AUDIO_CACHE_SIZE) -> None:
+        self.directory = directory
+        self.max_size = max_size
+
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def _load(self) -> None:
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if not name.endswith(PART_SUFFIX):
+                    stat = os.stat(os.path.join(root, name))
+                    files.append((stat.st_mtime, os.path.join(root, name), stat.st_size))
+
+        for _, path, size in sorted(files):
+            self._entries[path] = size
+            self._size += size
+
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._size > self.max_size and self._entries:
+            path, size = self._entries.popitem(last=False)
+            self._size -= size
+            with contextlib.suppress(OSError):
+                os.remove(path)
+
+    @property
+    def size(self) -> int:
+        """:obj:`int`: Суммарный размер файлов кэша в байтах."""
+        return self._size
+
+    def path(self, track_id: Union[str, int], codec: str, bitrate_in_kbps: int) -> str:
+        """Получение пути до файла трека в кэше.
+
+        Args:
+            track_id (:obj:`str` | :obj:`int`): Уникальный идентификатор трека.
+            codec (:obj:`str`): Кодек.
+            bitrate_in_kbps (:obj:`int`): Битрейт в кбит/с.
+
+        Returns:
+            :obj:`str`: Путь до файла, даже если его ещё нет.
+        """
+        key = f'{str(track_id).split(":")[0]}:{codec}:{bitrate_in_kbps}'
+        digest = hashlib.sha256(key.encode('UTF-8')).hexdigest()
+
+        return os.path.join(self.directory, digest[:2], f'{digest}.{codec}')
+
+    def get(self, track_id: Union[str, int], codec: str, bitrate_in_kbps: int) -> Optional[str]:
+        """Поиск файла трека в кэше.
+
+        Note:
+            Найденный файл отмечается как последний использованный.
+
+        Args:
+            track_id (:obj:`str` | :obj:`int`): Уникальный идентификатор трека.
+            codec (:obj:`str`): Кодек.
+            bitrate_in_kbps (:obj:`int`): Битрейт в кбит/с.
+
+        Returns:
+            :obj:`str` | :obj:`None`: Путь до файла или :obj:`None`, если его нет в кэше.
+        """
+        path = self.path(track_id, codec, bitrate_in_kbps)
+
+        with self._lock:
+            try:
+                # файл мог добавить другой процесс, а удалить - он же или пользователь
+                os.utime(path)
+                size = os.path.getsize(path)
+            except FileNotFoundError:
+                self._size -= self._entries.pop(path, 0)
+                return None
+
+            self._size += size - self._entries.pop(path, 0)
+            self._entries[path] = size
+
+        return path
+
+    def _open(self, track_id: Union[str, int], codec: str, bitrate_in_kbps: int) -> Optional[BinaryIO]:
+        path = self.get(track_id, codec, bitrate_in_kbps)
+        if path is None:
+            return None
+
+        try:
+            # файл закрывает вызывающий код
+            return open(path, 'rb')  # noqa: SIM115
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _iter_mapped(f: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+        with f:
+            # пустой файл нельзя отобразить в память
+            if not os.fstat(f.fileno()).st_size:
+                return
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for position in range(0, len(mapped), chunk_size):
+                    yield mapped[position : position + chunk_size]
+
+    def read(self, track_id: Union[str, int], codec: str, bitrate_in_kbps: int) -> Optional[memoryview]:
+        """Чтение файла трека из кэша.
+
+        Note:
+            Файл не копируется в память: возвращается представление отображённого в память файла. Отображение
+            освобождается вместе с представлением. Если нужны :obj:`bytes`, их можно получить через `tobytes()`.
+
+        Args:
+            track_id (:obj:`str` | :obj:`int`): Уникальный идентификатор трека.
+            codec (:obj:`str`): Кодек.
+            bitrate_in_kbps (:obj:`int`): Битрейт в кбит/с.
+
+        Returns:
+            :obj:`memoryview` | :obj:`None`: Трек или :obj:`None`, если его нет в кэше.
+        """
+        f = self._open(track_id, codec, bitrate_in_kbps)
+        if f is None:
+            return None
+
+        with f:
+            # пустой файл нельзя отобразить в память
+            if not os.fstat(f.fileno()).st_size:
+                return memoryview(b'')
+
+            # отображение остаётся доступным после закрытия файла
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def iter_chunks(
+        self, track_id: Union[str, int], codec: str, bitrate_in_kbps: int, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Optional[Iterator[bytes]]:
+        """Чтение файла трека из кэша по частям.
+
+        Note:
+            Файл открывается сразу, поэтому удаление его из кэша во время чтения не прерывает чтение.
+
+        Args:
+            track_id (:obj:`str` | :obj:`int`): Уникальный идентификатор трека.
+            codec (:obj:`str`): Кодек.
+            bitrate_in_kbps (:obj:`int`): Битрейт в кбит/с.
+            chunk_size (:obj:`int`, optional): Размер части трека в байтах.
+
+        Returns:
+            :obj:`Iterator` из :obj:`bytes` | :obj:`None`: Части трека или :obj:`None`, если его нет в кэше.
+        """
+        f = self._open(track_id, codec, bitrate_in_kbps)
+        if f is None:
+            return None
+
+        return self._iter_mapped(f, chunk_size)
+
+    def copy_to(self, track_id: Union[str, int], codec: str, bitrate_in_kbps: int, filename: str) -> bool:
+        """Копирование файла трека из кэша.
+
+        Args:
+            track_id (:obj:`str` | :obj:`int`): Уникальный идентификатор трека.
+            codec (:obj:`str`): Кодек.
+            bitrate_in_kbps (:obj:`int`): Битрейт в кбит/с.
+            filename (:obj:`str`): Путь для сохранения файла.
+
+        Returns:
+            :obj:`bool`: Был ли трек в кэше.
+        """
+        f = self._open(track_id, codec, bitrate_in_kbps)
+        if f is None:
+            return False
+
+        with f, open(filename, 'wb') as target:
+            shutil.copyfileobj(f, target)
+
+        return True
+
+    @contextlib.contextmanager
+    def writer(self, track_id: Union[str, int], codec: str, bitrate_in_kbps: int) -> Iterator[BinaryIO]:
+        """Запись файла трека в кэш.
+
+        Note:
+            Файл появляется в кэше только при выходе из контекста без исключения. При исключении, в том числе при
+            закрытии генератора, который пишет в файл, записанное удаляется.
+
+        Args:
+            track_id (:obj:`str` | :obj:`int`): Уникальный идентификатор трека.
+            codec (:obj:`str`): Кодек.
+            bitrate_in_kbps (:obj:`int`): Битрейт в кбит/с.
+
+        Yields:
+            :obj:`BinaryIO`: Файл для записи трека.
+        """
+        path = self.path(track_id, codec, bitrate_in_kbps)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        fd, part_path = tempfile.mkstemp(suffix=PART_SUFFIX, dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                yield f
+        except BaseException:
+            os.remove(part_path)
+            raise
+
+        os.replace(part_path, path)
+        size = os.path.getsize(path)
+
+        with self._lock:
+            self._size += size - self._entries.pop(path, 0)
+            self._entries[path] = size
+            self._evict()
+
+    def put(self, track_id: Union[str, int], codec: str, bitrate_in_kbps: int, data: bytes) -> None:
+        """Сохранение трека в кэш.
+
+        Args:
+            track_id (:obj:`str` | :obj:`int`): Уникальный идентификатор трека.
+            codec (:obj:`str`): Кодек.
+            bitrate_in_kbps (:obj:`int`): Битрейт в кбит/с.
+            data (:obj:`bytes`): Трек в виде байтов.
+        """
+        with self.writer(track_id, codec, bitrate_in_kbps) as f:
+            f.write(data)
+
+    def add_file(self, track_id: Union[str, int], codec: str, bitrate_in_kbps: int, filename: str) -> None:
+        """Сохранение копии загруженного файла трека в кэш.
+
+        Args:
+            track_id (:obj:`str` | :obj:`int`): Уникальный идентификатор трека.
+            codec (:obj:`str`): Кодек.
+            bitrate_in_kbps (:obj:`int`): Битрейт в кбит/с.
+            filename (:obj:`str`): Путь до файла трека.
+        """
+        with self.writer(track_id, codec, bitrate_in_kbps) as f, open(filename, 'rb') as source:
+            shutil.copyfileobj(source, f)
+
+    def clear(self) -> None:
+        """Удаление всех файлов кэша."""
+        with self._lock:
+            for path in self._entries:
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+
+            self._entries.clear()
+            self._size = 0
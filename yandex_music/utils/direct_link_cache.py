@@ -0,0 +1,191 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Generic, Hashable, Optional, Tuple, TypeVar, Union
+
+if TYPE_CHECKING:
+    from yandex_music.base import JSONType
+
+#: Время жизни информации о загрузке в секундах. Ссылка на XML документ действительна одну минуту.
+DOWNLOAD_INFO_TTL = 60
+
+#: Время жизни прямой ссылки на загрузку в секундах.
+DIRECT_LINK_TTL = 300
+
+#: За сколько секунд до истечения срока запись считается устаревшей и получается заново.
+REFRESH_MARGIN = 10
+
+#: Максимальное количество записей каждого вида в кэше по умолчанию.
+DIRECT_LINK_CACHE_SIZE = 1024
+
+_K = TypeVar('_K', bound=Hashable)
+_V = TypeVar('_V')
+
+
+def is_fresh(expires_at: float, refresh_margin: float = REFRESH_MARGIN) -> bool:
+    """Проверка, что срок жизни записи истечёт не раньше чем через `refresh_margin` секунд.
+
+    Args:
+        expires_at (:obj:`float`): Момент истечения срока по часам :func:`time.monotonic`.
+        refresh_margin (:obj:`float`, optional): Запас времени в секундах.
+
+    Returns:
+        :obj:`bool`: Можно ли ещё использовать запись.
+    """
+    return expires_at - refresh_margin > time.monotonic()
+
+
+class _ExpiringStore(Generic[_K, _V]):
+    __slots__ = ('_entries', 'max_size')
+
+    def __init__(self, max_size: int) -> None:
+        self._entries: OrderedDict[_K, Tuple[float, _V]] = OrderedDict()
+        self.max_size = max_size
+
+    def get(self, key: _K, refresh_margin: float) -> Optional[Tuple[_V, float]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if not is_fresh(expires_at, refresh_margin):
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value, expires_at
+
+    def set(self, key: _K, value: _V, ttl: float) -> float:
+        expires_at = time.monotonic() + ttl
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+        return expires_at
+
+    def pop(self, key: _K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DirectLinkCache:
+    """Кэш информации о загрузке и прямых ссылок на загрузку треков с учётом срока их жизни.
+
+    Note:
+        Список вариантов загрузки хранится по идентификатору трека, прямая ссылка - по идентификатору трека, кодеку
+        и битрейту. Поэтому прямая ссылка переживает информацию о загрузке: после повторного получения вариантов
+        загрузки ссылка на уже загружавшийся вариант берётся из кэша без запроса XML документа.
+
+        Запись считается устаревшей за `refresh_margin` секунд до истечения срока жизни, поэтому ссылки, срок
+        которых вот-вот истечёт, получаются заново заранее, а не после ошибки загрузки.
+
+        При превышении `max_size` вытесняются записи, к которым дольше всего не обращались. Кэш можно использовать
+        из нескольких потоков и разделять между клиентами: в нём хранятся только ответы API и ссылки, а не объекты,
+        привязанные к клиенту.
+
+    Args:
+        download_info_ttl (:obj:`float`, optional): Время жизни информации о загрузке в секундах.
+        direct_link_ttl (:obj:`float`, optional): Время жизни прямой ссылки в секундах.
+        refresh_margin (:obj:`float`, optional): За сколько секунд до истечения срока запись считается устаревшей.
+        max_size (:obj:`int`, optional): Максимальное количество записей каждого вида.
+    """
+
+    def __init__(
+        self,
+        download_info_ttl: float = DOWNLOAD_INFO_TTL,
+        direct_link_ttl: float = DIRECT_LINK_TTL,
+        refresh_margin: float = REFRESH_MARGIN,
+        max_size: int = DIRECT_LINK_CACHE_SIZE,
+    ) -> None:
+        self.download_info_ttl = download_info_ttl
+        self.direct_link_ttl = direct_link_ttl
+        self.refresh_margin = refresh_margin
+
+        self._download_info: _ExpiringStore[str, JSONType] = _ExpiringStore(max_size)
+        self._direct_links: _ExpiringStore[Tuple[str, str, int], str] = _ExpiringStore(max_size)
+        self._lock = threading.Lock()
+
+    def get_download_info(self, track_id: Union[str, int]) -> Optional['JSONType']:
+        """Получение ответа API с вариантами загрузки трека из кэша.
+
+        Args:
+            track_id (:obj:`str` | :obj:`int`): Уникальный идентификатор трека.
+
+        Returns:
+            :obj:`JSONType` | :obj:`None`: Варианты загрузки в том виде, в котором их вернул API, или :obj:`None`,
+            если их нет в кэше или они устарели.
+        """
+        with self._lock:
+            entry = self._download_info.get(str(track_id), self.refresh_margin)
+
+        return entry[0] if entry else None
+
+    def set_download_info(self, track_id: Union[str, int], download_info: 'JSONType') -> None:
+        """Сохранение ответа API с вариантами загрузки трека.
+
+        Args:
+            track_id (:obj:`str` | :obj:`int`): Уникальный идентификатор трека.
+            download_info (:obj:`JSONType`): Варианты загрузки в том виде, в котором их вернул API.
+        """
+        with self._lock:
+            self._download_info.set(str(track_id), download_info, self.download_info_ttl)
+
+    def get_direct_link(
+        self, track_id: Union[str, int], codec: str, bitrate_in_kbps: int
+    ) -> Optional[Tuple[str, float]]:
+        """Получение прямой ссылки на загрузку варианта трека из кэша.
+
+        Args:
+            track_id (:obj:`str` | :obj:`int`): Уникальный идентификатор трека.
+            codec (:obj:`str`): Кодек.
+            bitrate_in_kbps (:obj:`int`): Битрейт в кбит/с.
+
+        Returns:
+            :obj:`tuple` | :obj:`None`: Прямая ссылка и момент истечения её срока по часам :func:`time.monotonic` или
+            :obj:`None`, если ссылки нет в кэше или она устарела.
+        """
+        with self._lock:
+            return self._direct_links.get((str(track_id), codec, bitrate_in_kbps), self.refresh_margin)
+
+    def set_direct_link(self, track_id: Union[str, int], codec: str, bitrate_in_kbps: int, direct_link: str) -> float:
+        """Сохранение прямой ссылки на загрузку варианта трека.
+
+        Args:
+            track_id (:obj:`str` | :obj:`int`): Уникальный идентификатор трека.
+            codec (:obj:`str`): Кодек.
+            bitrate_in_kbps (:obj:`int`): Битрейт в кбит/с.
+            direct_link (:obj:`str`): Прямая ссылка.
+
+        Returns:
+            :obj:`float`: Момент истечения срока ссылки по часам :func:`time.monotonic`.
+        """
+        with self._lock:
+            return self._direct_links.set((str(track_id), codec, bitrate_in_kbps), direct_link, self.direct_link_ttl)
+
+    def invalidate_direct_link(self, track_id: Union[str, int], codec: str, bitrate_in_kbps: int) -> None:
+        """Удаление прямой ссылки, например, после ошибки загрузки по ней.
+
+        Args:
+            track_id (:obj:`str` | :obj:`int`): Уникальный идентификатор трека.
+            codec (:obj:`str`): Кодек.
+            bitrate_in_kbps (:obj:`int`): Битрейт в кбит/с.
+        """
+        with self._lock:
+            self._direct_links.pop((str(track_id), codec, bitrate_in_kbps))
+
+    def clear(self) -> None:
+        """Очистка кэша."""
+        with self._lock:
+            self._download_info.clear()
+            self._direct_links.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._download_info) + len(self._direct_links)
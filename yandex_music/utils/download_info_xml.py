@@ -0,0 +1,71 @@
+from typing import Dict, Optional
+from xml.parsers import expat
+
+from yandex_music.exceptions import YandexMusicError
+
+#: Элементы XML документа с информацией о загрузке, из которых строится прямая ссылка.
+DIRECT_LINK_FIELDS = ('host', 'path', 'ts', 's')
+
+
+def _forbid_entity_declaration(*_: object) -> None:
+    raise ValueError('Entity declarations are forbidden')
+
+
+class _DownloadInfoXmlParser:
+    """Обработчики событий `expat`, собирающие значения элементов из `DIRECT_LINK_FIELDS`."""
+
+    def __init__(self) -> None:
+        self.fields: Dict[str, str] = {}
+        self.current: Optional[str] = None
+
+    def start_element(self, name: str, _: Dict[str, str]) -> None:
+        self.current = None
+        if name in DIRECT_LINK_FIELDS and name not in self.fields:
+            self.fields[name] = ''
+            self.current = name
+
+    def end_element(self, _: str) -> None:
+        self.current = None
+
+    def character_data(self, data: str) -> None:
+        if self.current is not None:
+            self.fields[self.current] += data
+
+
+def parse_download_info_xml(xml: bytes) -> Dict[str, str]:
+    """Получение данных для построения прямой ссылки из XML документа с информацией о загрузке.
+
+    Note:
+        Документ разбирается потоково парсером `expat` без построения дерева. Для каждого элемента из
+        `DIRECT_LINK_FIELDS` берётся текст первого такого элемента до его первого дочернего элемента.
+
+        Объявления сущностей (DTD) запрещены, что защищает от атак с экспоненциальным раскрытием сущностей.
+
+    Args:
+        xml (:obj:`bytes`): XML документ.
+
+    Returns:
+        :obj:`dict`: Значения элементов из `DIRECT_LINK_FIELDS`.
+
+    Raises:
+        :class:`yandex_music.exceptions.YandexMusicError`: Если документ некорректен или в нём нет нужных элементов.
+    """
+    handlers = _DownloadInfoXmlParser()
+
+    parser = expat.ParserCreate()
+    parser.StartElementHandler = handlers.start_element
+    parser.EndElementHandler = handlers.end_element
+    parser.CharacterDataHandler = handlers.character_data
+    parser.EntityDeclHandler = _forbid_entity_declaration
+    parser.UnparsedEntityDeclHandler = _forbid_entity_declaration
+
+    try:
+        parser.Parse(xml, True)
+    except (expat.ExpatError, ValueError) as e:
+        raise YandexMusicError(f'Invalid download info: {e}') from e
+
+    missing = [name for name in DIRECT_LINK_FIELDS if name not in handlers.fields]
+    if missing:
+        raise YandexMusicError(f'Invalid download info: missing {", ".join(missing)}')
+
+    return handlers.fields
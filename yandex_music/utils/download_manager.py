@@ -0,0 +1,404 @@
+import asyncio
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from yandex_music.download_info import DOWNLOAD_ATTEMPTS
+from yandex_music.exceptions import InvalidBitrateError, NetworkError, UnauthorizedError
+
+if TYPE_CHECKING:
+    from yandex_music import DownloadInfo, Track
+
+#: Предпочтительные пары кодека и битрейта по умолчанию, по убыванию приоритета.
+DEFAULT_QUALITY = (('mp3', 320), ('mp3', 192), ('mp3', 128))
+
+#: Количество одновременно обрабатываемых треков по умолчанию.
+DEFAULT_CONCURRENCY = 8
+
+#: Суффикс файла, в который идёт загрузка до её успешного завершения.
+PART_SUFFIX = '.part'
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# трек с выбранным вариантом загрузки или уже готовым результатом, если загружать нечего
+PreparedTrack = Tuple['Track', Union['DownloadInfo', 'DownloadResult']]
+
+
+class DownloadStatus(Enum):
+    """Класс перечисления результатов обработки трека менеджером загрузок."""
+
+    DOWNLOADED = 'downloaded'
+    SKIPPED = 'skipped'
+    FAILED = 'failed'
+
+
+@dataclass
+class DownloadResult:
+    """Результат обработки одного трека менеджером загрузок.
+
+    Attributes:
+        track (:obj:`yandex_music.Track`): Трек.
+        status (:obj:`yandex_music.utils.download_manager.DownloadStatus`): Результат обработки.
+        filename (:obj:`str`, optional): Путь до файла трека, если он загружен или уже существовал.
+        size (:obj:`int`): Количество загруженных байт.
+        error (:obj:`Exception`, optional): Исключение, из-за которого трек не удалось загрузить.
+    """
+
+    track: 'Track'
+    status: DownloadStatus
+    filename: Optional[str] = None
+    size: int = 0
+    error: Optional[Exception] = None
+
+
+@dataclass
+class DownloadSummary:
+    """Сводка работы менеджера загрузок.
+
+    Attributes:
+        downloaded (:obj:`int`): Количество загруженных треков.
+        skipped (:obj:`int`): Количество пропущенных треков, файлы которых уже существовали.
+        failed (:obj:`int`): Количество треков, которые не удалось загрузить.
+        size (:obj:`int`): Количество загруженных байт.
+        elapsed (:obj:`float`): Время работы в секундах.
+        failures (:obj:`list` из :obj:`yandex_music.utils.download_manager.DownloadResult`): Результаты треков,
+            которые не удалось загрузить.
+    """
+
+    downloaded: int = 0
+    skipped: int = 0
+    failed: int = 0
+    size: int = 0
+    elapsed: float = 0.0
+    failures: List[DownloadResult] = field(default_factory=list)
+
+    @property
+    def processed(self) -> int:
+        """:obj:`int`: Количество обработанных треков."""
+        return self.downloaded + self.skipped + self.failed
+
+    @property
+    def throughput(self) -> float:
+        """:obj:`float`: Средняя скорость загрузки в байтах в секунду."""
+        return self.size / self.elapsed if self.elapsed else 0.0
+
+    def add(self, result: DownloadResult) -> None:
+        """Учёт результата обработки трека.
+
+        Args:
+            result (:obj:`yandex_music.utils.download_manager.DownloadResult`): Результат обработки трека.
+        """
+        if result.status is DownloadStatus.DOWNLOADED:
+            self.downloaded += 1
+        elif result.status is DownloadStatus.SKIPPED:
+            self.skipped += 1
+        else:
+            self.failed += 1
+            self.failures.append(result)
+
+        self.size += result.size
+
+    def __str__(self) -> str:
+        return (
+            f'{self.downloaded} downloaded, {self.skipped} skipped, {self.failed} failed; '
+            f'{self.size / 2**20:.1f} MiB in {self.elapsed:.1f} s ({self.throughput / 2**20:.2f} MiB/s)'
+        )
+
+
+def default_filename(track: 'Track', codec: str) -> str:
+    """Имя файла трека по умолчанию: идентификатор трека и кодек в качестве расширения.
+
+    Args:
+        track (:obj:`yandex_music.Track`): Трек.
+        codec (:obj:`str`): Кодек загружаемого варианта.
+
+    Returns:
+        :obj:`str`: Имя файла.
+    """
+    return f'{track.id}.{codec}'
+
+
+def choose_download_info(
+    download_info: List['DownloadInfo'], quality: Sequence[Tuple[str, int]] = DEFAULT_QUALITY
+) -> 'DownloadInfo':
+    """Выбор варианта загрузки трека по приоритету качества.
+
+    Args:
+        download_info (:obj:`list` из :obj:`yandex_music.DownloadInfo`): Варианты загрузки трека.
+        quality (:obj:`list` из :obj:`tuple`, optional): Пары кодека и битрейта по убыванию приоритета.
+
+    Returns:
+        :obj:`yandex_music.DownloadInfo`: Первый доступный вариант из `quality`.
+
+    Raises:
+        :class:`yandex_music.exceptions.InvalidBitrateError`: Если ни один из вариантов `quality` не доступен.
+    """
+    for codec, bitrate_in_kbps in quality:
+        for info in download_info:
+            if info.codec == codec and info.bitrate_in_kbps == bitrate_in_kbps:
+                return info
+
+    raise InvalidBitrateError('Unavailable bitrate')
+
+
+def _map_bounded(executor: ThreadPoolExecutor, func: Callable[[T], R], items: Iterable[T], limit: int) -> Iterator[R]:
+    """Выполнение функции для элементов в пуле потоков, не более `limit` одновременно.
+
+    Note:
+        Следующий элемент берётся из `items` только после завершения одного из выполняемых, поэтому итератор
+        `items` может быть сколь угодно длинным. Результаты возвращаются в порядке завершения.
+
+    Args:
+        executor (:obj:`concurrent.futures.ThreadPoolExecutor`): Пул потоков.
+        func (:obj:`Callable`): Функция.
+        items (:obj:`Iterable`): Элементы.
+        limit (:obj:`int`): Максимальное количество одновременно выполняемых вызовов.
+
+    Yields:
+        :obj:`Any`: Результаты вызовов.
+    """
+    in_flight: Set[Future] = set()
+    for item in items:
+        if len(in_flight) >= limit:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            yield from (future.result() for future in done)
+
+        in_flight.add(executor.submit(func, item))
+
+    for future in as_completed(in_flight):
+        yield future.result()
+
+
+async def _iterate(items: Iterable[T]) -> AsyncIterator[T]:
+    for item in items:
+        yield item
+
+
+async def _map_bounded_async(
+    func: Callable[[T], Awaitable[R]], items: AsyncIterable[T], limit: int
+) -> AsyncIterator[R]:
+    """Выполнение функции для элементов в отдельных задачах, не более `limit` одновременно.
+
+    Note:
+        Асинхронная версия :func:`_map_bounded`. При прерывании незавершённые задачи отменяются.
+
+    Args:
+        func (:obj:`Callable`): Асинхронная функция.
+        items (:obj:`AsyncIterable`): Элементы.
+        limit (:obj:`int`): Максимальное количество одновременно выполняемых вызовов.
+
+    Yields:
+        :obj:`Any`: Результаты вызовов.
+    """
+    in_flight: Set[asyncio.Future] = set()
+    try:
+        async for item in items:
+            if len(in_flight) >= limit:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+
+            in_flight.add(asyncio.ensure_future(func(item)))
+
+        while in_flight:
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in in_flight:
+            task.cancel()
+
+
+class DownloadManager:
+    """Класс, представляющий загрузку большого количества треков с ограничением одновременных загрузок.
+
+    Note:
+        Загрузка идёт конвейером из двух этапов. На первом для трека получаются варианты загрузки и прямая ссылка на
+        выбранный вариант, на втором загружается файл. Каждый этап одновременно обрабатывает до `concurrency`
+        треков, поэтому варианты загрузки и ссылки следующих треков получаются во время загрузки файлов предыдущих.
+        Этап получения ссылок опережает загрузку не более чем на `concurrency` треков, потому что прямая ссылка
+        быстро устаревает. Треки берутся из `tracks` по мере освобождения мест, поэтому их может быть сколько
+        угодно. Для синхронного клиента используются пулы потоков (:func:`download`), для асинхронного - задачи
+        (:func:`download_async`).
+
+        API отдаёт варианты загрузки только по одному треку за запрос. Если у клиента задан `direct_link_cache`,
+        повторная загрузка тех же треков берёт варианты загрузки и ссылки из кэша без запросов.
+
+        Трек загружается во временный файл с суффиксом `.part`, который переименовывается только после успешной
+        загрузки, поэтому `skip_existing` не пропускает недокачанные треки.
+
+        Любая ошибка обработки одного трека не прерывает загрузку остальных, а попадает в сводку.
+
+    Args:
+        directory (:obj:`str`, optional): Папка для сохранения треков.
+        concurrency (:obj:`int`, optional): Количество одновременно обрабатываемых треков.
+        quality (:obj:`list` из :obj:`tuple`, optional): Пары кодека и битрейта по убыванию приоритета. Загружается
+            первый доступный для трека вариант.
+        attempts (:obj:`int`, optional): Количество попыток каждого запроса.
+        skip_existing (:obj:`bool`, optional): Пропускать треки, файлы которых уже существуют.
+        segments (:obj:`int`, optional): Количество параллельно загружаемых частей одного трека.
+        filename (:obj:`Callable`, optional): Функция получения имени файла по треку и кодеку.
+        on_progress (:obj:`Callable`, optional): Функция, вызываемая после обработки каждого трека с его результатом и
+            текущей сводкой.
+    """
+
+    def __init__(
+        self,
+        directory: str = '.',
+        concurrency: int = DEFAULT_CONCURRENCY,
+        quality: Sequence[Tuple[str, int]] = DEFAULT_QUALITY,
+        attempts: int = DOWNLOAD_ATTEMPTS,
+        skip_existing: bool = True,
+        segments: int = 1,
+        filename: Callable[['Track', str], str] = default_filename,
+        on_progress: Optional[Callable[[DownloadResult, DownloadSummary], None]] = None,
+    ) -> None:
+        self.directory = directory
+        self.concurrency = concurrency
+        self.quality = quality
+        self.attempts = attempts
+        self.skip_existing = skip_existing
+        self.segments = segments
+        self.filename = filename
+        self.on_progress = on_progress
+
+    def _filenames(self, track: 'Track') -> Dict[str, str]:
+        return {codec: os.path.join(self.directory, self.filename(track, codec)) for codec, _ in self.quality}
+
+    def _find_existing(self, track: 'Track') -> Optional[str]:
+        if not self.skip_existing:
+            return None
+
+        return next((filename for filename in self._filenames(track).values() if os.path.isfile(filename)), None)
+
+    def _report(self, summary: DownloadSummary, result: DownloadResult, started: float) -> None:
+        summary.add(result)
+        summary.elapsed = time.monotonic() - started
+
+        if self.on_progress:
+            self.on_progress(result, summary)
+
+    def _prepare(self, track: 'Track') -> PreparedTrack:
+        existing = self._find_existing(track)
+        if existing:
+            return track, DownloadResult(track, DownloadStatus.SKIPPED, existing)
+
+        try:
+            for attempt in range(1, self.attempts + 1):
+                try:
+                    info = choose_download_info(track.get_download_info(), self.quality)
+                    info.get_direct_link()
+                    break
+                except (NetworkError, UnauthorizedError):
+                    if attempt == self.attempts:
+                        raise
+        except Exception as e:  # noqa: BLE001
+            return track, DownloadResult(track, DownloadStatus.FAILED, error=e)
+
+        return track, info
+
+    async def _prepare_async(self, track: 'Track') -> PreparedTrack:
+        existing = self._find_existing(track)
+        if existing:
+            return track, DownloadResult(track, DownloadStatus.SKIPPED, existing)
+
+        try:
+            for attempt in range(1, self.attempts + 1):
+                try:
+                    info = choose_download_info(await track.get_download_info_async(), self.quality)
+                    await info.get_direct_link_async()
+                    break
+                except (NetworkError, UnauthorizedError):
+                    if attempt == self.attempts:
+                        raise
+        except Exception as e:  # noqa: BLE001
+            return track, DownloadResult(track, DownloadStatus.FAILED, error=e)
+
+        return track, info
+
+    def _transfer(self, prepared: PreparedTrack) -> DownloadResult:
+        track, info = prepared
+        if isinstance(info, DownloadResult):
+            return info
+
+        filename = self._filenames(track)[info.codec]
+        try:
+            info.download(filename + PART_SUFFIX, attempts=self.attempts, segments=self.segments)
+            os.replace(filename + PART_SUFFIX, filename)
+        except Exception as e:  # noqa: BLE001
+            return DownloadResult(track, DownloadStatus.FAILED, error=e)
+
+        return DownloadResult(track, DownloadStatus.DOWNLOADED, filename, os.path.getsize(filename))
+
+    async def _transfer_async(self, prepared: PreparedTrack) -> DownloadResult:
+        track, info = prepared
+        if isinstance(info, DownloadResult):
+            return info
+
+        filename = self._filenames(track)[info.codec]
+        try:
+            await info.download_async(filename + PART_SUFFIX, attempts=self.attempts, segments=self.segments)
+            os.replace(filename + PART_SUFFIX, filename)
+        except Exception as e:  # noqa: BLE001
+            return DownloadResult(track, DownloadStatus.FAILED, error=e)
+
+        return DownloadResult(track, DownloadStatus.DOWNLOADED, filename, os.path.getsize(filename))
+
+    def download(self, tracks: Iterable['Track']) -> DownloadSummary:
+        """Загрузка треков синхронным клиентом.
+
+        Args:
+            tracks (:obj:`list` из :obj:`yandex_music.Track`): Треки для загрузки.
+
+        Returns:
+            :obj:`yandex_music.utils.download_manager.DownloadSummary`: Сводка загрузки.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        summary = DownloadSummary()
+        started = time.monotonic()
+        with ThreadPoolExecutor(self.concurrency) as preparer, ThreadPoolExecutor(self.concurrency) as loader:
+            prepared = _map_bounded(preparer, self._prepare, tracks, self.concurrency)
+            for result in _map_bounded(loader, self._transfer, prepared, self.concurrency):
+                self._report(summary, result, started)
+
+        return summary
+
+    async def download_async(self, tracks: Iterable['Track']) -> DownloadSummary:
+        """Загрузка треков асинхронным клиентом.
+
+        Args:
+            tracks (:obj:`list` из :obj:`yandex_music.Track`): Треки для загрузки.
+
+        Returns:
+            :obj:`yandex_music.utils.download_manager.DownloadSummary`: Сводка загрузки.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        summary = DownloadSummary()
+        started = time.monotonic()
+        prepared = _map_bounded_async(self._prepare_async, _iterate(tracks), self.concurrency)
+        async for result in _map_bounded_async(self._transfer_async, prepared, self.concurrency):
+            self._report(summary, result, started)
+
+        return summary
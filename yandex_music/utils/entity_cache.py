@@ -0,0 +1,242 @@
+import json
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+from yandex_music.utils.direct_link_cache import _ExpiringStore
+
+if TYPE_CHECKING:
+    from yandex_music import JSONType
+
+#: Время жизни объекта в кэше в секундах по умолчанию.
+ENTITY_CACHE_TTL = 300
+
+#: Максимальное количество объектов в кэше по умолчанию.
+ENTITY_CACHE_SIZE = 10000
+
+IdsType = Union[List[Union[str, int]], int, str]
+
+
+def entity_key(object_type: str, entity_id: Union[str, int]) -> str:
+    """Получение ключа объекта в кэше по его идентификатору.
+
+    Note:
+        Трек с идентификатором альбома (`номер:альбом`) и без него - один и тот же объект.
+
+    Args:
+        object_type (:obj:`str`): Тип объекта.
+        entity_id (:obj:`str` | :obj:`int`): Уникальный идентификатор объекта.
+
+    Returns:
+        :obj:`str`: Ключ объекта.
+    """
+    entity_id = str(entity_id).strip()
+    if object_type == 'track':
+        return entity_id.split(':')[0]
+
+    return entity_id
+
+
+def get_entity_id(object_type: str, data: 'JSONType') -> Optional[str]:
+    """Получение уникального идентификатора объекта из ответа API.
+
+    Args:
+        object_type (:obj:`str`): Тип объекта.
+        data (:obj:`JSONType`): Поля и значения объекта.
+
+    Returns:
+        :obj:`str` | :obj:`None`: Идентификатор в том же виде, в котором объект запрашивается, или :obj:`None`, если
+        его не удалось определить.
+    """
+    if not isinstance(data, dict):
+        return None
+
+    if object_type == 'playlist':
+        owner, kind = data.get('owner'), data.get('kind')
+        if not isinstance(owner, dict) or owner.get('uid') is None or kind is None:
+            return None
+
+        return f'{owner["uid"]}:{kind}'
+
+    entity_id = data.get('id')
+    return None if entity_id is None else str(entity_id)
+
+
+class EntityCacheBackend:
+    """Базовый класс хранилища кэша объектов.
+
+    Note:
+        Хранятся поля и значения объектов из ответа API, а не модели, поэтому хранилище может сохранять их в
+        любом виде, в котором сохраняется JSON. Модели создаются заново при каждом обращении.
+
+        Модели могут ссылаться на переданные им словари, поэтому :func:`get_many` должен возвращать копии, а не
+        хранимые объекты, иначе изменение модели изменит кэш.
+
+        `namespace` - тип объекта вместе с параметрами запроса, от которых зависит ответ, например,
+        `track?with-positions=True`.
+
+        Для своего хранилища нужно унаследоваться от класса и переопределить все методы.
+    """
+
+    def get_many(self, namespace: str, keys: List[str]) -> Dict[str, 'JSONType']:
+        """Получение объектов из кэша.
+
+        Args:
+            namespace (:obj:`str`): Пространство имён объектов.
+            keys (:obj:`list` из :obj:`str`): Ключи объектов.
+
+        Returns:
+            :obj:`dict`: Копии найденных и ещё не устаревших объектов по ключам. Отсутствующих ключей в словаре нет.
+        """
+        raise NotImplementedError
+
+    def set_many(self, namespace: str, entities: Dict[str, 'JSONType']) -> None:
+        """Сохранение объектов в кэш.
+
+        Args:
+            namespace (:obj:`str`): Пространство имён объектов.
+            entities (:obj:`dict`): Объекты по ключам.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Очистка кэша."""
+        raise NotImplementedError
+
+
+class EntityCache(EntityCacheBackend):
+    """Класс, представляющий кэш объектов в памяти.
+
+    Note:
+        Объекты хранятся сериализованными в JSON, поэтому каждое обращение возвращает новые словари, изменение
+        которых не затрагивает кэш.
+
+        При превышении `max_size` вытесняются объекты, к которым дольше всего не обращались. Кэш можно использовать
+        из нескольких потоков и разделять между клиентами.
+
+    Args:
+        ttl (:obj:`float`, optional): Время жизни объекта в секундах.
+        max_size (:obj:`int`, optional): Максимальное количество объектов.
+    """
+
+    def __init__(self, ttl: float = ENTITY_CACHE_TTL, max_size: int = ENTITY_CACHE_SIZE) -> None:
+        self.ttl = ttl
+
+        self._entities: _ExpiringStore[Tuple[str, str], str] = _ExpiringStore(max_size)
+        self._lock = threading.Lock()
+
+    def get_many(self, namespace: str, keys: List[str]) -> Dict[str, 'JSONType']:
+        """Получение объектов из кэша.
+
+        Args:
+            namespace (:obj:`str`): Пространство имён объектов.
+            keys (:obj:`list` из :obj:`str`): Ключи объектов.
+
+        Returns:
+            :obj:`dict`: Копии найденных и ещё не устаревших объектов по ключам.
+        """
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entities.get((namespace, key), 0)
+                if entry is not None:
+                    found[key] = entry[0]
+
+        return {key: json.loads(data) for key, data in found.items()}
+
+    def set_many(self, namespace: str, entities: Dict[str, 'JSONType']) -> None:
+        """Сохранение объектов в кэш.
+
+        Args:
+            namespace (:obj:`str`): Пространство имён объектов.
+            entities (:obj:`dict`): Объекты по ключам.
+        """
+        serialized = {key: json.dumps(data, ensure_ascii=False) for key, data in entities.items()}
+        with self._lock:
+            for key, data in serialized.items():
+                self._entities.set((namespace, key), data, self.ttl)
+
+    def clear(self) -> None:
+        """Очистка кэша."""
+        with self._lock:
+            self._entities.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entities)
+
+
+class EntityBatch:
+    """Класс, представляющий запрос списка объектов, часть которых может быть в кэше.
+
+    Note:
+        Запросить нужно только `missing_ids`. Ответ передаётся в :func:`add`, после чего :func:`result` возвращает
+        объекты из кэша и из ответа в порядке запроса, по одному на каждый идентификатор.
+
+    Args:
+        cache (:obj:`yandex_music.utils.entity_cache.EntityCacheBackend`): Кэш объектов.
+        object_type (:obj:`str`): Тип объекта.
+        ids (:obj:`str` | :obj:`int` | :obj:`list` из :obj:`str` | :obj:`list` из :obj:`int`): Уникальный
+            идентификатор объекта или объектов. Строка может содержать несколько идентификаторов через запятую.
+        params (:obj:`dict`, optional): Остальные параметры запроса.
+    """
+
+    def __init__(
+        self,
+        cache: EntityCacheBackend,
+        object_type: str,
+        ids: IdsType,
+        params: Optional['JSONType'] = None,
+    ) -> None:
+        self.cache = cache
+        self.object_type = object_type
+        self.namespace = object_type
+        if params:
+            self.namespace += '?' + '&'.join(f'{name}={value}' for name, value in sorted(params.items()))
+
+        requested = ids if isinstance(ids, list) else str(ids).split(',')
+        # первый идентификатор с каждым ключом
+        self._ids: Dict[str, Union[str, int]] = {}
+        for entity_id in requested:
+            self._ids.setdefault(entity_key(object_type, entity_id), entity_id)
+
+        self._entities = cache.get_many(self.namespace, list(self._ids))
+        self._unknown: List[JSONType] = []
+
+    @property
+    def missing_ids(self) -> List[Union[str, int]]:
+        """:obj:`list` из :obj:`str` | :obj:`list` из :obj:`int`: Идентификаторы объектов, которых нет в кэше."""
+        return [entity_id for key, entity_id in self._ids.items() if key not in self._entities]
+
+    def add(self, data: 'JSONType') -> None:
+        """Добавление объектов из ответа API и сохранение их в кэш.
+
+        Note:
+            Объекты, идентификатор которых не удалось сопоставить с запрошенными, не кэшируются и возвращаются
+            в конце результата.
+
+        Args:
+            data (:obj:`list`): Список объектов из ответа API.
+        """
+        if not isinstance(data, list):
+            return
+
+        fetched = {}
+        for item in data:
+            entity_id = get_entity_id(self.object_type, item)
+            key = None if entity_id is None else entity_key(self.object_type, entity_id)
+
+            if key in self._ids:
+                fetched[key] = item
+            else:
+                self._unknown.append(item)
+
+        self.cache.set_many(self.namespace, fetched)
+        self._entities.update(fetched)
+
+    def result(self) -> List['JSONType']:
+        """Получение объектов в порядке запроса.
+
+        Returns:
+            :obj:`list`: Список объектов для десериализации.
+        """
+        return [self._entities[key] for key in self._ids if key in self._entities] + self._unknown
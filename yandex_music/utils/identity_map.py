@@ -0,0 +1,120 @@
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from yandex_music import ClientType, JSONType
+
+
+class IdentityMap:
+    """Реестр уже десериализованных объектов одного ответа API.
+
+    Note:
+        Объект переиспользуется, только если совпадают и класс, и ключ (значения полей из `_identity_fields` модели),
+        и все остальные сырые данные. Поэтому, например, альбомы трека с разными `track_position` останутся разными
+        объектами.
+
+        Переиспользованные объекты общие для всех мест ответа, где они встретились. Изменение одного из них видно
+        во всех этих местах.
+    """
+
+    __slots__ = ('_entries',)
+
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple[type, Tuple[Hashable, ...]], List[Tuple['JSONType', Any]]] = {}
+
+    @staticmethod
+    def _key(cls: type, data: Dict[str, 'JSONType']) -> Optional[Tuple[type, Tuple[Hashable, ...]]]:
+        values = tuple(data.get(name) for name in cls._identity_fields)  # type: ignore[attr-defined]
+        if all(value is None for value in values):
+            return None
+
+        return cls, values  # type: ignore[return-value]
+
+    def get(self, cls: type, data: Dict[str, 'JSONType']) -> Optional[Any]:  # noqa: ANN401
+        """Поиск объекта, десериализованного из таких же данных.
+
+        Args:
+            cls (:obj:`type`): Класс модели.
+            data (:obj:`dict`): Поля и значения десериализуемого объекта.
+
+        Returns:
+            :obj:`yandex_music.YandexMusicModel` | :obj:`None`: Ранее созданный объект или :obj:`None`.
+        """
+        key = self._key(cls, data)
+        if key is None:
+            return None
+
+        for known_data, instance in self._entries.get(key, ()):
+            if known_data == data:
+                return instance
+
+        return None
+
+    def add(self, cls: type, data: Dict[str, 'JSONType'], instance: Any) -> None:  # noqa: ANN401
+        """Сохранение десериализованного объекта.
+
+        Args:
+            cls (:obj:`type`): Класс модели.
+            data (:obj:`dict`): Поля и значения, из которых создан объект.
+            instance (:obj:`yandex_music.YandexMusicModel`): Созданный объект.
+        """
+        key = self._key(cls, data)
+        if key is not None and instance is not None:
+            self._entries.setdefault(key, []).append((data, instance))
+
+
+#: Реестр объектов для текущего вызова метода клиента. Устанавливается декоратором методов клиента.
+current_identity_map: ContextVar[Optional[IdentityMap]] = ContextVar('current_identity_map', default=None)
+
+
+@contextmanager
+def identity_map_scope(enabled: bool) -> Iterator[None]:
+    """Создание реестра объектов на время вызова метода клиента.
+
+    Note:
+        Вложенные вызовы используют реестр внешнего вызова.
+
+    Args:
+        enabled (:obj:`bool`): Включено ли переиспользование объектов у клиента.
+    """
+    if not enabled or current_identity_map.get() is not None:
+        yield
+        return
+
+    token = current_identity_map.set(IdentityMap())
+    try:
+        yield
+    finally:
+        current_identity_map.reset(token)
+
+
+def share_instances(de_json: Callable[..., Any]) -> Callable[..., Any]:
+    """Обёртка `de_json` модели, возвращающая уже созданный объект из реестра текущего вызова.
+
+    Note:
+        Устанавливается декоратором :func:`yandex_music.utils.model` для моделей с непустым `_identity_fields`.
+        Если реестр не создан (переиспользование выключено у клиента), то `de_json` вызывается как обычно.
+
+    Args:
+        de_json (:obj:`Callable`): Исходная функция десериализации.
+
+    Returns:
+        :obj:`Callable`: Функция десериализации с переиспользованием объектов.
+    """
+
+    @functools.wraps(de_json)
+    def wrapper(cls: type, data: 'JSONType', client: Optional['ClientType']) -> Any:  # noqa: ANN401
+        identity_map = current_identity_map.get()
+        if identity_map is None or not isinstance(data, dict):
+            return de_json(cls, data, client)
+
+        instance = identity_map.get(cls, data)
+        if instance is None:
+            instance = de_json(cls, data, client)
+            identity_map.add(cls, data, instance)
+
+        return instance
+
+    return wrapper
@@ -0,0 +1,68 @@
+import importlib
+import logging
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+JSONLoads = Callable[[str], Any]
+
+#: Стандартная библиотека. Разбор выполняется вместе с нормализацией ключей через `object_hook`.
+STDLIB_BACKEND = 'json'
+#: Автоматический выбор самой быстрой из установленных библиотек, результат которой совпадает со стандартной.
+AUTO_BACKEND = 'auto'
+
+#: Поддерживаемые сторонние библиотеки.
+BACKENDS = ('orjson', 'ujson', 'simdjson')
+#: Библиотеки, используемые при автоматическом выборе, в порядке приоритета.
+AUTO_BACKENDS = ('orjson',)
+
+
+def _import_loads(backend: str) -> Optional[JSONLoads]:
+    try:
+        module = importlib.import_module(backend)
+    except ImportError:
+        return None
+
+    return module.loads
+
+
+def get_loads(backend: str = AUTO_BACKEND) -> Optional[JSONLoads]:
+    """Получение функции разбора JSON выбранной библиотеки.
+
+    Note:
+        Доступные значения: `auto`, `json`, `orjson`, `ujson`, `simdjson`.
+
+        При автоматическом выборе используется `orjson`, если он установлен. Сторонние библиотеки не умеют
+        `object_hook`, поэтому нормализация ключей выполняется отдельным проходом по результату.
+
+        Если выбранная библиотека не установлена, используется стандартная библиотека.
+
+    Args:
+        backend (:obj:`str`, optional): Название библиотеки.
+
+    Returns:
+        :obj:`Callable` | :obj:`None`: Функция разбора JSON или :obj:`None`, если нужно использовать стандартную
+            библиотеку.
+
+    Raises:
+        :class:`ValueError`: При неизвестном названии библиотеки.
+    """
+    if backend == STDLIB_BACKEND:
+        return None
+
+    if backend == AUTO_BACKEND:
+        for auto_backend in AUTO_BACKENDS:
+            loads = _import_loads(auto_backend)
+            if loads:
+                return loads
+
+        return None
+
+    if backend not in BACKENDS:
+        raise ValueError(f'Unknown JSON backend: {backend}')
+
+    loads = _import_loads(backend)
+    if loads is None:
+        logger.warning(f'JSON backend {backend} is not installed. Falling back to {STDLIB_BACKEND}')
+
+    return loads
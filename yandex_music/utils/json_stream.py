@@ -0,0 +1,219 @@
+import codecs
+import json
+import re
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from yandex_music import JSONType
+
+#: Размер части тела ответа, читаемой за раз при потоковом разборе.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_structure_re = re.compile(r'["{}\[\]:,]')
+_whitespace_re = re.compile(r'[\s,]*')
+
+_OBJECT = 0
+_ARRAY = 1
+
+
+class JSONArrayStream:
+    """Потоковый разбор элементов массивов, находящихся по указанному пути в JSON документе.
+
+    Note:
+        Документ передаётся частями через :func:`feed`. Элементы целевых массивов разбираются по одному, как только
+        будут получены целиком, поэтому в памяти хранится только текущий элемент, а не весь документ.
+
+        Путь состоит из ключей объектов в том виде, в каком они приходят от API (camelCase). Массивы на пути
+        пропускаются: путь `('result', 'historyTabs', 'items', 'tracks')` указывает на треки всех элементов всех
+        вкладок.
+
+    Args:
+        path (:obj:`tuple` из :obj:`str`): Путь до массивов, элементы которых нужно получить.
+        object_hook (:obj:`Callable`, optional): Функция, применяемая к каждому разобранному словарю элемента.
+    """
+
+    def __init__(self, path: Tuple[str, ...], object_hook: Optional[Callable[[Any], 'JSONType']] = None) -> None:
+        self.path = path
+
+        self._decoder = json.JSONDecoder(object_hook=object_hook)
+        self._utf8_decoder = codecs.getincrementaldecoder('UTF-8')()
+
+        self._buffer = ''
+        self._pos = 0
+        # для каждого открытого объекта - его текущий ключ, для массива - None
+        self._stack: List[Tuple[int, Optional[str]]] = []
+        self._expect_key = False
+        self._in_items = False
+
+    def _keys(self) -> Tuple[Optional[str], ...]:
+        return tuple(key for kind, key in self._stack if kind == _OBJECT)
+
+    def _find_string_end(self, start: int) -> int:
+        buffer = self._buffer
+        pos = start
+        while True:
+            pos = buffer.find('"', pos)
+            if pos == -1:
+                return -1
+
+            backslashes = 0
+            while buffer[pos - 1 - backslashes] == '\\':
+                backslashes += 1
+
+            if backslashes % 2 == 0:
+                return pos
+
+            pos += 1
+
+    def _scan(self) -> bool:
+        """Поиск начала целевого массива.
+
+        Returns:
+            :obj:`bool`: Найден ли целевой массив. Если нет, то нужны следующие части документа.
+        """
+        while True:
+            match = _structure_re.search(self._buffer, self._pos)
+            if match is None:
+                self._pos = len(self._buffer)
+                return False
+
+            char, pos = match.group(), match.start()
+            if char == '"':
+                if not self._scan_string(pos):
+                    return False
+            elif self._scan_structure(char, pos):
+                return True
+
+    def _scan_string(self, pos: int) -> bool:
+        """Пропуск строки с запоминанием ключа текущего объекта.
+
+        Args:
+            pos (:obj:`int`): Позиция открывающей кавычки.
+
+        Returns:
+            :obj:`bool`: Закончилась ли строка. Если нет, то нужны следующие части документа.
+        """
+        end = self._find_string_end(pos + 1)
+        if end == -1:
+            self._pos = pos
+            return False
+
+        if self._expect_key:
+            self._stack[-1] = (_OBJECT, json.loads(self._buffer[pos : end + 1]))
+
+        self._pos = end + 1
+        return True
+
+    def _scan_structure(self, char: str, pos: int) -> bool:
+        """Обработка структурного символа JSON.
+
+        Args:
+            char (:obj:`str`): Символ.
+            pos (:obj:`int`): Позиция символа.
+
+        Returns:
+            :obj:`bool`: Начинается ли с этого символа целевой массив.
+        """
+        stack = self._stack
+        self._pos = pos + 1
+        if char == '{':
+            stack.append((_OBJECT, None))
+            self._expect_key = True
+        elif char == '[':
+            is_target = bool(stack) and stack[-1][0] == _OBJECT and self._keys() == self.path
+            stack.append((_ARRAY, None))
+            self._expect_key = False
+            if is_target:
+                self._in_items = True
+                return True
+        elif char in '}]':
+            stack.pop()
+            self._expect_key = False
+        elif char == ':':
+            self._expect_key = False
+        elif char == ',':
+            self._expect_key = bool(stack) and stack[-1][0] == _OBJECT
+
+        return False
+
+    def _parse_items(self, items: List['JSONType'], final: bool) -> bool:
+        """Разбор элементов целевого массива.
+
+        Args:
+            items (:obj:`list`): Список, в который добавляются разобранные элементы.
+            final (:obj:`bool`): Получена ли последняя часть документа.
+
+        Returns:
+            :obj:`bool`: Закончился ли целевой массив. Если нет, то нужны следующие части документа.
+        """
+        buffer = self._buffer
+        while True:
+            pos = _whitespace_re.match(buffer, self._pos).end()  # type: ignore[union-attr]
+            self._pos = pos
+            if pos >= len(buffer):
+                return False
+
+            if buffer[pos] == ']':
+                self._stack.pop()
+                self._in_items = False
+                self._pos = pos + 1
+                return True
+
+            try:
+                item, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                return False
+
+            # число в конце буфера может быть неполным
+            if end >= len(buffer) and not final:
+                return False
+
+            items.append(item)
+            self._pos = end
+
+    def _process(self, final: bool = False) -> List['JSONType']:
+        items: List['JSONType'] = []
+        while True:
+            done = self._parse_items(items, final) if self._in_items else self._scan()
+            if not done:
+                break
+
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+
+        return items
+
+    def feed(self, chunk: bytes) -> List['JSONType']:
+        """Передача очередной части документа.
+
+        Args:
+            chunk (:obj:`bytes`): Часть документа.
+
+        Returns:
+            :obj:`list` из :obj:`JSONType`: Элементы целевых массивов, полностью содержащиеся в полученных частях.
+
+        Raises:
+            :class:`UnicodeDecodeError`: Если документ не в кодировке UTF-8.
+            :class:`json.JSONDecodeError`: Если элемент целевого массива не является корректным JSON.
+        """
+        self._buffer += self._utf8_decoder.decode(chunk)
+        return self._process()
+
+    def close(self) -> List['JSONType']:
+        """Завершение разбора после получения последней части документа.
+
+        Returns:
+            :obj:`list` из :obj:`JSONType`: Оставшиеся элементы целевых массивов.
+
+        Raises:
+            :class:`ValueError`: Если документ оборван.
+        """
+        self._buffer += self._utf8_decoder.decode(b'', final=True)
+        items = self._process(final=True)
+
+        if self._stack or self._buffer.strip():
+            raise ValueError('Unexpected end of JSON document')
+
+        return items
@@ -0,0 +1,102 @@
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    from yandex_music import ClientType, JSONType
+
+
+class LazyValue:
+    """Отложенное значение вложенного поля модели.
+
+    Note:
+        Хранит сырые данные и функцию десериализации. Десериализация выполняется один раз, при первом обращении к
+        полю через :class:`LazyField`.
+
+    Args:
+        de_json (:obj:`Callable`): Функция десериализации (`de_json` или `de_list` модели).
+        data (:obj:`JSONType`): Сырые данные поля.
+        client (:obj:`yandex_music.Client`, optional): Клиент Yandex Music.
+    """
+
+    __slots__ = ('de_json', 'data', 'client')
+
+    def __init__(
+        self, de_json: Callable[['JSONType', Optional['ClientType']], Any], data: 'JSONType', client: 'ClientType'
+    ) -> None:
+        self.de_json = de_json
+        self.data = data
+        self.client = client
+
+    def materialize(self) -> Any:  # noqa: ANN401
+        """Десериализация сохранённых данных.
+
+        Returns:
+            :obj:`Any`: Значение поля.
+        """
+        return self.de_json(self.data, self.client)
+
+
+class LazyField:
+    """Дескриптор поля модели, которое может быть десериализовано отложенно.
+
+    Note:
+        Устанавливается декоратором :func:`yandex_music.utils.model` для полей, перечисленных в `_lazy_fields`
+        модели. Значение хранится в `__dict__` экземпляра, как и у обычного поля, или в слоте, если модели созданы
+        со `__slots__`. Если там лежит :class:`LazyValue`, то при первом обращении оно заменяется
+        десериализованным значением.
+
+    Args:
+        name (:obj:`str`): Название поля.
+        default (:obj:`Any`, optional): Значение по умолчанию, возвращаемое при обращении через класс.
+        slot (:obj:`Any`, optional): Дескриптор слота, в котором хранится значение.
+    """
+
+    def __init__(self, name: str, default: Any = None, slot: Any = None) -> None:  # noqa: ANN401
+        self.name = name
+        self.default = default
+        self.slot = slot
+
+    def __get__(self, instance: Any, owner: type) -> Any:  # noqa: ANN401
+        if instance is None:
+            return self.default
+
+        value = self.get_raw(instance)
+        if isinstance(value, LazyValue):
+            value = value.materialize()
+            self.__set__(instance, value)
+
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:  # noqa: ANN401
+        if self.slot is not None:
+            self.slot.__set__(instance, value)
+        else:
+            instance.__dict__[self.name] = value
+
+    def __delete__(self, instance: Any) -> None:  # noqa: ANN401
+        if self.slot is not None:
+            self.slot.__delete__(instance)
+        else:
+            try:
+                del instance.__dict__[self.name]
+            except KeyError:
+                raise AttributeError(self.name) from None
+
+    def get_raw(self, instance: Any) -> Any:  # noqa: ANN401
+        """Получение хранимого значения без десериализации.
+
+        Args:
+            instance (:obj:`Any`): Экземпляр модели.
+
+        Returns:
+            :obj:`Any`: Значение поля или :class:`LazyValue`.
+
+        Raises:
+            :class:`AttributeError`: Если значение не установлено.
+        """
+        if self.slot is not None:
+            return self.slot.__get__(instance, type(instance))
+
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
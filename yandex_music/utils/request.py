@@ -1,23 +1,34 @@
-# Не используется ujson из-за отсутствия в нём object_hook'a
+# Для разбора ответов можно выбрать стороннюю библиотеку JSON (см. yandex_music.utils.json_backend).
 # Отправка вообще application/x-www-form-urlencoded, а не JSON'a
 # https://github.com/psf/requests/blob/master/requests/models.py#L508
+import copy
+import functools
 import json
 import keyword
 import logging
+import os
 import re
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from yandex_music.exceptions import (
     BadRequestError,
+    IncompleteDownloadError,
     NetworkError,
     NotFoundError,
     TimedOutError,
     UnauthorizedError,
     YandexMusicError,
 )
+from yandex_music.utils.json_backend import AUTO_BACKEND, JSONLoads, get_loads
+from yandex_music.utils.json_stream import STREAM_CHUNK_SIZE, JSONArrayStream
 from yandex_music.utils.response import Response
+from yandex_music.utils.response_cache import ResponseCache
+from yandex_music.utils.response_format import BYTES_FORMAT, JSON_FORMAT, current_response_format, raise_if_raw
 
 if TYPE_CHECKING:
     from yandex_music import ClientType, JSONType
@@ -29,7 +40,19 @@ HEADERS = {
 }
 DEFAULT_TIMEOUT = 5
 
-reserved_names = list(keyword.kwlist) + ['ClientType']
+DEFAULT_POOL_LIMIT = 100
+DEFAULT_POOL_LIMIT_PER_HOST = 30
+DEFAULT_KEEPALIVE_TIMEOUT = 15
+DEFAULT_DNS_CACHE_TTL = 10
+
+reserved_names = {*keyword.kwlist, 'ClientType'}
+
+# размер кэша нормализованных имён полей; различных ключей в ответах API несколько сотен
+NORMALIZED_KEYS_CACHE_SIZE = 4096
+
+_first_cap_re = re.compile('(.)([A-Z][a-z]+)')
+_all_cap_re = re.compile('([a-z0-9])([A-Z])')
+_content_range_re = re.compile(r'bytes (\d+)-(\d+)/(\d+|\*)')
 
 logging.getLogger('urllib3').setLevel(logging.WARNING)
 
@@ -40,6 +63,8 @@ class DefaultTimeout:
 
 default_timeout = DefaultTimeout()
 TimeoutType = Union[int, float, DefaultTimeout]
+ResponseCallback = Callable[[int, Mapping[str, str]], None]
+ContentRangeCallback = Callable[[int, Optional[int], Optional[int]], None]
 
 
 class Request:
@@ -47,10 +72,28 @@ class Request:
 
     Предоставляет методы для выполнения POST и GET запросов, скачивания файлов.
 
+    Note:
+        Все запросы выполняются через одну долгоживущую сессию с пулом соединений, которая создаётся при первом
+        запросе. Для освобождения соединений используйте метод :func:`close`.
+
+        В синхронной версии параметр `pool_limit` задаёт количество кэшируемых пулов (по одному на хост), а любое
+        ненулевое значение `keepalive_timeout` просто оставляет соединения открытыми. Параметр `dns_cache_ttl`
+        используется только в асинхронной версии.
+
     Args:
         client (:obj:`yandex_music.Client`, optional): Клиент Yandex Music.
         headers (:obj:`dict`, optional): Заголовки передаваемые с каждым запросом.
         proxy_url (:obj:`str`, optional): Прокси.
+        timeout (:obj:`int` | :obj:`float`, optional): Время ожидания ответа от сервера.
+        pool_limit (:obj:`int`, optional): Общее ограничение количества соединений в пуле.
+        pool_limit_per_host (:obj:`int`, optional): Ограничение количества соединений к одному хосту.
+        keepalive_timeout (:obj:`int` | :obj:`float`, optional): Время жизни неиспользуемого соединения в секундах.
+            При :obj:`None` или `0` соединения закрываются после каждого запроса.
+        dns_cache_ttl (:obj:`int`, optional): Время жизни кэша DNS в секундах. При :obj:`None` кэш бессрочный.
+        json_backend (:obj:`str`, optional): Библиотека для разбора JSON ответов. Подробнее в
+            :func:`yandex_music.utils.json_backend.get_loads`.
+        response_cache (:obj:`yandex_music.utils.response_cache.ResponseCache`, optional): Кэш ответов на GET
+            запросы к редко меняющимся разделам API.
     """
 
     def __init__(
@@ -59,12 +102,29 @@ class Request:
         headers: Optional[Dict[str, str]] = None,
         proxy_url: Optional[str] = None,
         timeout: 'TimeoutType' = default_timeout,
+        pool_limit: int = DEFAULT_POOL_LIMIT,
+        pool_limit_per_host: int = DEFAULT_POOL_LIMIT_PER_HOST,
+        keepalive_timeout: Optional[float] = DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: Optional[int] = DEFAULT_DNS_CACHE_TTL,
+        json_backend: str = AUTO_BACKEND,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
         self.headers = headers or HEADERS.copy()
+        self.response_cache = response_cache
+
+        self.pool_limit = pool_limit
+        self.pool_limit_per_host = pool_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+
+        self._session: Optional[requests.Session] = None
 
         self._timeout = DEFAULT_TIMEOUT
         self.set_timeout(timeout)
 
+        self._json_loads: Optional[JSONLoads] = None
+        self.set_json_backend(json_backend)
+
         if client:
             self.client = self.set_and_return_client(client)
 
@@ -95,6 +155,18 @@ class Request:
         if timeout is default_timeout:
             self._timeout = DEFAULT_TIMEOUT
 
+    def set_json_backend(self, backend: str = AUTO_BACKEND) -> None:
+        """Устанавливает библиотеку для разбора JSON ответов.
+
+        Note:
+            Возможные значения `backend`: auto/json/orjson/ujson/simdjson. Результат разбора не зависит от выбранной
+            библиотеки.
+
+        Args:
+            backend (:obj:`str`): Название библиотеки.
+        """
+        self._json_loads = get_loads(backend)
+
     def set_authorization(self, token: str) -> None:
         """Добавляет заголовок авторизации для каждого запроса.
 
@@ -122,6 +194,45 @@ class Request:
 
         return self.client
 
+    @property
+    def session(self) -> requests.Session:
+        """:obj:`requests.Session`: Сессия с пулом соединений, создаётся при первом обращении."""
+        if self._session is None:
+            self._session = self._create_session()
+
+        return self._session
+
+    def _create_session(self) -> requests.Session:
+        """Создание сессии с пулом соединений согласно настройкам.
+
+        Note:
+            Cookie между запросами не сохраняются, как и при выполнении каждого запроса в отдельной сессии.
+
+        Returns:
+            :obj:`requests.Session`: Новая сессия.
+        """
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        adapter = HTTPAdapter(pool_connections=self.pool_limit, pool_maxsize=self.pool_limit_per_host)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        if not self.keepalive_timeout:
+            session.headers['Connection'] = 'close'
+
+        return session
+
+    def close(self) -> None:
+        """Закрытие сессии и всех открытых соединений пула.
+
+        Note:
+            После закрытия экземпляр можно продолжать использовать, новая сессия будет создана при следующем запросе.
+        """
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     @staticmethod
     def _convert_camel_to_snake(text: str) -> str:
         """Конвертация CamelCase в SnakeCase.
@@ -132,18 +243,45 @@ class Request:
         Returns:
             :obj:`str`: Название переменной в SnakeCase.
         """
-        s = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', text)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s).lower()
+        s = _first_cap_re.sub(r'\1_\2', text)
+        return _all_cap_re.sub(r'\1_\2', s).lower()
 
     @staticmethod
-    def _object_hook(obj: 'JSONType') -> 'JSONType':
-        """Нормализация имён переменных пришедших с API.
+    @functools.lru_cache(maxsize=NORMALIZED_KEYS_CACHE_SIZE)
+    def _normalize_key(key: str) -> str:
+        """Нормализация имени переменной пришедшей с API.
 
         Note:
             В названии переменной заменяет "-" на "_", конвертирует в SnakeCase, если название является
             зарезервированным словом или "client" - добавляет "_" в конец. Если название переменной начинается с цифры -
             добавляет в начало "_".
 
+            Результат кэшируется, так как одни и те же имена повторяются в ответах тысячи раз.
+
+        Args:
+            key (:obj:`str`): Название переменной.
+
+        Returns:
+            :obj:`str`: Нормализованное название переменной.
+        """
+        key = Request._convert_camel_to_snake(key.replace('-', '_'))
+        key = key.lower()
+
+        if key in reserved_names:
+            key += '_'
+
+        if len(key) and key[0].isdigit():
+            key = '_' + key
+
+        return key
+
+    @staticmethod
+    def _object_hook(obj: 'JSONType') -> 'JSONType':
+        """Нормализация имён переменных пришедших с API.
+
+        Note:
+            Правила нормализации описаны в :func:`_normalize_key`.
+
         Args:
             obj (:obj:`dict`): Словарь, где ключ название переменной, а значение - содержимое.
 
@@ -153,20 +291,53 @@ class Request:
         if not isinstance(obj, dict):
             return obj
 
-        cleaned_object: Dict[str, JSONType] = {}
-        for key, value in obj.items():
-            key = Request._convert_camel_to_snake(key.replace('-', '_'))
-            key = key.lower()
+        normalize_key = Request._normalize_key
+        return {normalize_key(key): value for key, value in obj.items()}
+
+    @staticmethod
+    def _normalize_keys(obj: 'JSONType') -> 'JSONType':
+        """Рекурсивная нормализация имён переменных в уже разобранном ответе.
+
+        Note:
+            Используется со сторонними библиотеками JSON, в которых нет `object_hook`. Результат совпадает с
+            :func:`_object_hook`, применённым к каждому словарю.
 
-            if key in reserved_names:
-                key += '_'
+        Args:
+            obj (:obj:`JSONType`): Разобранный ответ.
 
-            if len(key) and key[0].isdigit():
-                key = '_' + key
+        Returns:
+            :obj:`JSONType`: Ответ с нормализованными ключами.
+        """
+        if isinstance(obj, dict):
+            normalize_key = Request._normalize_key
+            normalize_keys = Request._normalize_keys
+            return {normalize_key(key): normalize_keys(value) for key, value in obj.items()}
+        if isinstance(obj, list):
+            normalize_keys = Request._normalize_keys
+            return [normalize_keys(value) for value in obj]
 
-            cleaned_object.update({key: value})
+        return obj
 
-        return cleaned_object
+    def _loads(self, text: str) -> 'JSONType':
+        """Разбор JSON выбранной библиотекой с нормализацией имён переменных.
+
+        Note:
+            Если сторонняя библиотека не смогла разобрать ответ (например, `orjson` не поддерживает целые числа больше
+            64 бит), разбор повторяется стандартной библиотекой.
+
+        Args:
+            text (:obj:`str`): Ответ от API.
+
+        Returns:
+            :obj:`JSONType`: Разобранный ответ с нормализованными ключами.
+        """
+        if self._json_loads is not None:
+            try:
+                return Request._normalize_keys(self._json_loads(text))
+            except ValueError:
+                logging.getLogger(__name__).debug('JSON backend failed to parse response, using json module')
+
+        return json.loads(text, object_hook=Request._object_hook)
 
     def _parse(self, json_data: bytes) -> Optional[Response]:
         """Разбор ответа от API.
@@ -185,7 +356,7 @@ class Request:
         """
         try:
             decoded_s = json_data.decode('UTF-8')
-            data = json.loads(decoded_s, object_hook=Request._object_hook)
+            data = self._loads(decoded_s)
 
         except UnicodeDecodeError as e:
             logging.getLogger(__name__).debug('Logging raw invalid UTF-8 response:\n%r', json_data)
@@ -198,15 +369,21 @@ class Request:
 
         return Response.de_json(data, self.client)
 
-    def _request_wrapper(self, *args: Any, **kwargs: Any) -> bytes:  # noqa: C901
+    def _request_wrapper(  # noqa: C901
+        self, *args: Any, on_response: Optional[ResponseCallback] = None, **kwargs: Any
+    ) -> bytes:
         """Обёртка над запросом библиотеки `requests`.
 
         Note:
             Добавляет необходимые заголовки для запроса, обрабатывает статус коды, следит за таймаутом, кидает
             необходимые исключения, возвращает ответ. Передаёт пользовательские аргументы в запрос.
 
+            Ответ `304 Not Modified` на условный запрос считается успешным и возвращается с пустым телом.
+
         Args:
             *args: Произвольные аргументы для `requests.request`.
+            on_response (:obj:`Callable`, optional): Функция, вызываемая со статус кодом и заголовками успешного
+                ответа.
             **kwargs: Произвольные ключевые аргументы для `requests.request`.
 
         Returns:
@@ -228,36 +405,149 @@ class Request:
             kwargs['timeout'] = self._timeout
 
         try:
-            resp = requests.request(*args, **kwargs)
+            resp = self.session.request(*args, **kwargs)
         except requests.Timeout as e:
             raise TimedOutError from e
         except requests.RequestException as e:
             raise NetworkError(e) from e
 
-        if 200 <= resp.status_code <= 299:
+        if 200 <= resp.status_code <= 299 or resp.status_code == 304:
+            if on_response is not None:
+                on_response(resp.status_code, resp.headers)
+
             return resp.content
 
+        raise self._status_error(resp.status_code, resp.content)
+
+    def _stream_wrapper(
+        self,
+        *args: Any,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        on_response: Optional[ResponseCallback] = None,
+        **kwargs: Any,
+    ) -> Iterator[bytes]:
+        """Обёртка над запросом библиотеки `requests` с чтением тела ответа по частям.
+
+        Note:
+            Заголовки, таймаут и исключения такие же, как в :func:`_request_wrapper`. Таймаут ограничивает ожидание
+            каждой части ответа, а не всего ответа.
+
+        Args:
+            *args: Произвольные аргументы для `requests.request`.
+            chunk_size (:obj:`int`, optional): Размер читаемой за раз части тела ответа в байтах.
+            on_response (:obj:`Callable`, optional): Функция, вызываемая со статус кодом и заголовками успешного
+                ответа до чтения его тела.
+            **kwargs: Произвольные ключевые аргументы для `requests.request`.
+
+        Yields:
+            :obj:`bytes`: Очередная часть тела ответа.
+
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        if 'headers' not in kwargs:
+            kwargs['headers'] = {}
+
+        kwargs['headers']['User-Agent'] = USER_AGENT
+
+        if kwargs['timeout'] is default_timeout:
+            kwargs['timeout'] = self._timeout
+
+        try:
+            with self.session.request(*args, stream=True, **kwargs) as resp:
+                if not 200 <= resp.status_code <= 299:
+                    raise self._status_error(resp.status_code, resp.content)
+
+                if on_response is not None:
+                    on_response(resp.status_code, resp.headers)
+
+                yield from resp.iter_content(chunk_size)
+        except requests.Timeout as e:
+            raise TimedOutError from e
+        except requests.RequestException as e:
+            raise NetworkError(e) from e
+
+    def _status_error(self, status_code: int, content: bytes) -> YandexMusicError:
+        """Получение исключения, соответствующего статус коду неуспешного ответа.
+
+        Args:
+            status_code (:obj:`int`): Статус код ответа.
+            content (:obj:`bytes`): Тело ответа.
+
+        Returns:
+            :class:`yandex_music.exceptions.YandexMusicError`: :class:`yandex_music.exceptions.UnauthorizedError`
+            при невалидном токене или долгом ожидании прямой ссылки на файл,
+            :class:`yandex_music.exceptions.BadRequestError` при неправильном запросе,
+            :class:`yandex_music.exceptions.NotFoundError`, если ресурс не найден, и
+            :class:`yandex_music.exceptions.NetworkError` при остальных ошибках.
+        """
         message = 'Unknown error'
         try:
-            parse = self._parse(resp.content)
+            parse = self._parse(content)
             if parse:
                 message = parse.get_error()
         except YandexMusicError:
             message = 'Unknown HTTPError'
 
-        if resp.status_code in (401, 403):
-            raise UnauthorizedError(message)
-        if resp.status_code == 400:
-            raise BadRequestError(message)
-        if resp.status_code == 404:
-            raise NotFoundError(message)
-        if resp.status_code in (409, 413):
-            raise NetworkError(message)
+        if status_code in (401, 403):
+            return UnauthorizedError(message)
+        if status_code == 400:
+            return BadRequestError(message)
+        if status_code == 404:
+            return NotFoundError(message)
+        if status_code in (409, 413):
+            return NetworkError(message)
 
-        if resp.status_code == 502:
-            raise NetworkError('Bad Gateway')
+        if status_code == 502:
+            return NetworkError('Bad Gateway')
 
-        raise NetworkError(f'{message} ({resp.status_code}): {resp.content}')
+        return NetworkError(f'{message} ({status_code}): {content}')
+
+    @staticmethod
+    def _parse_content_range(status_code: int, headers: Mapping[str, str]) -> Tuple[int, Optional[int], Optional[int]]:
+        """Определение расположения тела успешного ответа в запрошенном файле.
+
+        Args:
+            status_code (:obj:`int`): Статус код ответа.
+            headers (:obj:`Mapping`): Заголовки ответа.
+
+        Returns:
+            :obj:`tuple` из :obj:`int`, :obj:`int` | :obj:`None` и :obj:`int` | :obj:`None`: Позиция первого байта
+                тела ответа в файле, позиция после последнего байта тела ответа и полный размер файла, если они
+                известны.
+
+        Raises:
+            :class:`yandex_music.exceptions.NetworkError`: При некорректном заголовке `Content-Range`.
+        """
+        if status_code == 206:
+            match = _content_range_re.fullmatch(headers.get('Content-Range', ''))
+            if match is None:
+                raise NetworkError(f'Invalid Content-Range: {headers.get("Content-Range")}')
+
+            start, last, total = match.groups()
+            return int(start), int(last) + 1, None if total == '*' else int(total)
+
+        # при сжатии Content-Length - размер сжатого тела, а получаем мы распакованное
+        length = headers.get('Content-Length', '')
+        if headers.get('Content-Encoding', 'identity') != 'identity' or not length.isdigit():
+            return 0, None, None
+
+        return 0, int(length), int(length)
+
+    @staticmethod
+    def _split_range(start: int, stop: int, segments: int) -> List[Tuple[int, int]]:
+        """Разбиение диапазона байт на части примерно одинакового размера.
+
+        Args:
+            start (:obj:`int`): Позиция первого байта диапазона.
+            stop (:obj:`int`): Позиция после последнего байта диапазона.
+            segments (:obj:`int`): Количество частей.
+
+        Returns:
+            :obj:`list` из :obj:`tuple`: Позиции начала и конца (не включая) каждой части.
+        """
+        segment_size = max(-(-(stop - start) // segments), 1)
+        return [(position, min(position + segment_size, stop)) for position in range(start, stop, segment_size)]
 
     def get(
         self, url: str, params: 'JSONType' = None, timeout: 'TimeoutType' = default_timeout, **kwargs: Any
@@ -271,20 +561,91 @@ class Request:
                 при создании пула.
             **kwargs: Произвольные ключевые аргументы для `requests.request`.
 
+        Note:
+            Если для текущего вызова метода клиента запрошен ответ без моделей, он возвращается досрочно через
+            :class:`yandex_music.utils.response_format.RawResponse`.
+
+            Если задан `response_cache` и ответ на запрос кэшируется, он берётся из кэша (см.
+            :class:`yandex_music.utils.response_cache.ResponseCache`). Ответ в виде байтов всегда запрашивается.
+
         Returns:
             :obj:`JSONType`: Обработанное тело ответа.
 
         Raises:
             :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
         """
+        ttl = None
+        if self.response_cache is not None and current_response_format.get() != BYTES_FORMAT:
+            ttl = self.response_cache.get_ttl(url)
+        if ttl is not None:
+            return self._get_cached(url, params, ttl, timeout, **kwargs)
+
         result = self._request_wrapper(
             'GET', url, params=params, headers=self.headers, proxies=self.proxies, timeout=timeout, **kwargs
         )
+        raise_if_raw(BYTES_FORMAT, result)
+
         response = self._parse(result)
-        if response:
-            return response.get_result()
+        parsed_result = response.get_result() if response else None
+        raise_if_raw(JSON_FORMAT, parsed_result)
+
+        return parsed_result
+
+    def _get_cached(
+        self, url: str, params: 'JSONType', ttl: float, timeout: 'TimeoutType' = default_timeout, **kwargs: Any
+    ) -> 'JSONType':
+        """Отправка GET запроса с использованием кэша ответов.
+
+        Args:
+            url (:obj:`str`): Адрес для запроса.
+            params (:obj:`str`): GET параметры для запроса.
+            ttl (:obj:`float`): Время жизни ответа в секундах.
+            timeout (:obj:`int` | :obj:`float`): Используется как время ожидания ответа от сервера вместо указанного
+                при создании пула.
+            **kwargs: Произвольные ключевые аргументы для `requests.request`.
+
+        Returns:
+            :obj:`JSONType`: Обработанное тело ответа.
 
-        return None
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        assert self.response_cache is not None
+
+        key = self.response_cache.make_key(url, params, self.headers)
+        entry = self.response_cache.get(key)
+
+        if entry is None or not entry.is_fresh():
+            responses: List[Tuple[int, Mapping[str, str]]] = []
+
+            def on_response(status_code: int, headers: Mapping[str, str]) -> None:
+                responses.append((status_code, headers))
+
+            headers = {**self.headers, **entry.validators} if entry is not None else {**self.headers}
+            result = self._request_wrapper(
+                'GET',
+                url,
+                params=params,
+                headers=headers,
+                proxies=self.proxies,
+                timeout=timeout,
+                on_response=on_response,
+                **kwargs,
+            )
+
+            status_code, response_headers = responses[0]
+            if status_code == 304 and entry is not None:
+                entry = self.response_cache.revalidate(entry, ttl, response_headers)
+            else:
+                response = self._parse(result)
+                parsed_result = response.get_result() if response else None
+                entry = self.response_cache.set(key, parsed_result, len(result), ttl, response_headers)
+
+        # вызывающий код может изменить результат, поэтому каждому достаётся своя копия
+        result = copy.deepcopy(entry.result)
+        raise_if_raw(JSON_FORMAT, result)
+
+        return result
 
     def post(self, url: str, data: 'JSONType', timeout: 'TimeoutType' = default_timeout, **kwargs: Any) -> 'JSONType':
         """Отправка POST запроса.
@@ -296,6 +657,10 @@ class Request:
                 при создании пула.
             **kwargs: Произвольные ключевые аргументы для `requests.request`.
 
+        Note:
+            Если для текущего вызова метода клиента запрошен ответ без моделей, он возвращается досрочно через
+            :class:`yandex_music.utils.response_format.RawResponse`.
+
         Returns:
             :obj:`JSONType`: Обработанное тело ответа.
 
@@ -305,11 +670,66 @@ class Request:
         result = self._request_wrapper(
             'POST', url, headers=self.headers, proxies=self.proxies, data=data, timeout=timeout, **kwargs
         )
+        raise_if_raw(BYTES_FORMAT, result)
+
         response = self._parse(result)
-        if response:
-            return response.get_result()
+        parsed_result = response.get_result() if response else None
+        raise_if_raw(JSON_FORMAT, parsed_result)
+
+        return parsed_result
+
+    def stream(
+        self,
+        url: str,
+        path: Tuple[str, ...],
+        params: 'JSONType' = None,
+        timeout: 'TimeoutType' = default_timeout,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> Iterator['JSONType']:
+        """Отправка GET запроса с потоковым разбором элементов массивов из ответа.
+
+        Note:
+            Ответ разбирается по мере получения (см. :class:`yandex_music.utils.json_stream.JSONArrayStream`), поэтому
+            потребление памяти не зависит от размера ответа. Разбор всегда выполняется стандартной библиотекой,
+            а формат ответа, указанный для метода клиента, не учитывается.
+
+        Args:
+            url (:obj:`str`): Адрес для запроса.
+            path (:obj:`tuple` из :obj:`str`): Путь до массивов в ответе, ключи в виде camelCase.
+            params (:obj:`str`): GET параметры для запроса.
+            timeout (:obj:`int` | :obj:`float`): Используется как время ожидания каждой части ответа от сервера
+                вместо указанного при создании пула.
+            chunk_size (:obj:`int`, optional): Размер читаемой за раз части тела ответа в байтах.
+            **kwargs: Произвольные ключевые аргументы для `requests.request`.
 
-        return None
+        Yields:
+            :obj:`JSONType`: Очередной элемент массива с нормализованными ключами.
+
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        parser = JSONArrayStream(path, Request._object_hook)
+        chunks = self._stream_wrapper(
+            'GET',
+            url,
+            params=params,
+            headers=self.headers,
+            proxies=self.proxies,
+            timeout=timeout,
+            chunk_size=chunk_size,
+            **kwargs,
+        )
+
+        try:
+            for chunk in chunks:
+                for item in parser.feed(chunk):
+                    yield item
+
+            for item in parser.close():
+                yield item
+        except ValueError as e:
+            raise YandexMusicError('Invalid server response') from e
 
     def retrieve(self, url: str, timeout: 'TimeoutType' = default_timeout, **kwargs: Any) -> bytes:
         """Отправка GET запроса и получение содержимого без обработки (парсинга).
@@ -328,19 +748,235 @@ class Request:
         """
         return self._request_wrapper('GET', url, proxies=self.proxies, timeout=timeout, **kwargs)
 
-    def download(self, url: str, filename: str, timeout: 'TimeoutType' = default_timeout, **kwargs: Any) -> None:
-        """Отправка запроса на получение содержимого и его запись в файл.
+    def retrieve_stream(
+        self,
+        url: str,
+        timeout: 'TimeoutType' = default_timeout,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        offset: int = 0,
+        end: Optional[int] = None,
+        on_content_range: Optional[ContentRangeCallback] = None,
+        **kwargs: Any,
+    ) -> Iterator[bytes]:
+        """Отправка GET запроса и получение содержимого по частям без обработки (парсинга).
+
+        Note:
+            В памяти одновременно находится только одна часть ответа, а первые части доступны до окончания загрузки.
+
+            При ненулевом `offset` или указанном `end` запрашивается только часть содержимого (заголовок `Range`).
+            Если сервер не поддерживает запрос части содержимого и отдаёт его целиком, то байты до `offset`
+            пропускаются, а после `end` не читаются.
+
+            После получения последней части размер содержимого сверяется с заявленным сервером.
+
+        Args:
+            url (:obj:`str`): Адрес для запроса.
+            timeout (:obj:`int` | :obj:`float`): Используется как время ожидания каждой части ответа от сервера
+                вместо указанного при создании пула.
+            chunk_size (:obj:`int`, optional): Размер читаемой за раз части тела ответа в байтах.
+            offset (:obj:`int`, optional): Позиция в байтах, начиная с которой нужно получить содержимое.
+            end (:obj:`int`, optional): Позиция в байтах, до которой (не включая) нужно получить содержимое.
+            on_content_range (:obj:`Callable`, optional): Функция, вызываемая до получения первой части с позицией
+                первого байта, позицией после последнего байта отдаваемого содержимого и полным размером файла.
+                Неизвестные серверу позиция конца и размер передаются как :obj:`None`.
+            **kwargs: Произвольные ключевые аргументы для `requests.request`.
+
+        Yields:
+            :obj:`bytes`: Очередная часть тела ответа.
+
+        Raises:
+            :class:`yandex_music.exceptions.IncompleteDownloadError`: Если размер содержимого не совпал с заявленным.
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        if offset or end is not None:
+            last = '' if end is None else end - 1
+            kwargs['headers'] = {**kwargs.get('headers', {}), 'Range': f'bytes={offset}-{last}'}
+
+        content_ranges: List[Tuple[int, Optional[int]]] = []
+
+        def on_response(status_code: int, headers: Mapping[str, str]) -> None:
+            start, stop, total = self._parse_content_range(status_code, headers)
+            if start > offset:
+                raise NetworkError(f'Requested content from {offset} byte, but got from {start} byte')
+
+            content_ranges.append((start, stop))
+            if on_content_range is not None:
+                on_content_range(offset, stop if end is None else end if stop is None else min(end, stop), total)
+
+        chunks = self._stream_wrapper(
+            'GET', url, proxies=self.proxies, timeout=timeout, chunk_size=chunk_size, on_response=on_response, **kwargs
+        )
+
+        received = 0
+        for chunk in chunks:
+            position = content_ranges[0][0] + received
+            received += len(chunk)
+            if end is not None and position + len(chunk) >= end:
+                yield chunk[max(offset - position, 0) : end - position]
+                return
+
+            if position + len(chunk) > offset:
+                yield chunk[offset - position :] if position < offset else chunk
+
+        start, stop = content_ranges[0]
+        expected = stop if end is None else end
+        if expected is not None and start + received != expected:
+            raise IncompleteDownloadError(f'Received {start + received} of {expected} bytes')
+
+    def _probe_range(self, url: str, timeout: 'TimeoutType' = default_timeout, **kwargs: Any) -> Optional[int]:
+        """Проверка поддержки сервером запроса части содержимого.
 
         Args:
             url (:obj:`str`): Адрес для запроса.
-            filename (:obj:`str`): Путь и(или) название файла вместе с расширением.
             timeout (:obj:`int` | :obj:`float`): Используется как время ожидания ответа от сервера вместо указанного
                 при создании пула.
             **kwargs: Произвольные ключевые аргументы для `requests.request`.
 
+        Returns:
+            :obj:`int` | :obj:`None`: Полный размер содержимого или :obj:`None`, если запрос части не поддерживается.
+
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        headers = {**kwargs.pop('headers', {}), 'Range': 'bytes=0-0'}
+
+        responses: List[Tuple[int, Mapping[str, str]]] = []
+        chunks = self._stream_wrapper(
+            'GET',
+            url,
+            proxies=self.proxies,
+            timeout=timeout,
+            headers=headers,
+            on_response=lambda *response: responses.append(response),
+            **kwargs,
+        )
+
+        # без поддержки запроса части в ответе весь файл, поэтому дальше первой части не читаем
+        for _chunk in chunks:
+            break
+        chunks.close()
+
+        status_code, response_headers = responses[0]
+        if status_code != 206:
+            return None
+
+        return self._parse_content_range(status_code, response_headers)[2]
+
+    def _download_segment(
+        self, url: str, filename: str, start: int, end: int, timeout: 'TimeoutType' = default_timeout, **kwargs: Any
+    ) -> None:
+        """Загрузка части содержимого и её запись на своё место в файле.
+
+        Args:
+            url (:obj:`str`): Адрес для запроса.
+            filename (:obj:`str`): Путь до файла, уже имеющего полный размер.
+            start (:obj:`int`): Позиция первого байта части.
+            end (:obj:`int`): Позиция после последнего байта части.
+            timeout (:obj:`int` | :obj:`float`): Используется как время ожидания каждой части ответа от сервера
+                вместо указанного при создании пула.
+            **kwargs: Произвольные ключевые аргументы для `requests.request`.
+
         Raises:
             :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
         """
-        result = self.retrieve(url, timeout=timeout, **kwargs)
-        with open(filename, 'wb') as f:
-            f.write(result)
+        chunks = self.retrieve_stream(url, timeout=timeout, offset=start, end=end, **kwargs)
+
+        with open(filename, 'r+b') as f:
+            f.seek(start)
+            for chunk in chunks:
+                f.write(chunk)
+
+    def _download_segments(
+        self,
+        url: str,
+        filename: str,
+        offset: int,
+        size: int,
+        segments: int,
+        timeout: 'TimeoutType' = default_timeout,
+        **kwargs: Any,
+    ) -> None:
+        """Параллельная загрузка частей содержимого в отдельных потоках.
+
+        Note:
+            Файл заранее расширяется до полного размера, а каждая часть записывается на своё место. При ошибке файл
+            обрезается до начала первой незагруженной части, чтобы загрузку можно было продолжить.
+
+        Args:
+            url (:obj:`str`): Адрес для запроса.
+            filename (:obj:`str`): Путь и(или) название файла вместе с расширением.
+            offset (:obj:`int`): Размер уже загруженного начала файла.
+            size (:obj:`int`): Полный размер содержимого.
+            segments (:obj:`int`): Количество частей.
+            timeout (:obj:`int` | :obj:`float`): Используется как время ожидания каждой части ответа от сервера
+                вместо указанного при создании пула.
+            **kwargs: Произвольные ключевые аргументы для `requests.request`.
+
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        if offset > size:
+            offset = 0
+
+        with open(filename, 'r+b' if offset else 'wb') as f:
+            f.truncate(size)
+
+        bounds = self._split_range(offset, size, segments)
+        with ThreadPoolExecutor(max_workers=segments) as executor:
+            futures = [
+                executor.submit(self._download_segment, url, filename, start, end, timeout=timeout, **kwargs)
+                for start, end in bounds
+            ]
+
+        for (start, _), future in zip(bounds, futures):
+            error = future.exception()
+            if error is not None:
+                # в файле остаётся только непрерывно загруженное начало
+                os.truncate(filename, start)
+                raise error
+
+    def download(
+        self,
+        url: str,
+        filename: str,
+        timeout: 'TimeoutType' = default_timeout,
+        resume: bool = False,
+        segments: int = 1,
+        **kwargs: Any,
+    ) -> None:
+        """Отправка запроса на получение содержимого и его запись в файл.
+
+        Note:
+            Содержимое записывается по мере получения (см. :func:`retrieve_stream`), поэтому потребление памяти не
+            зависит от размера файла. При ошибке во время загрузки в файле остаётся полученная часть.
+
+            С `resume` загрузка продолжается с конца уже существующего файла, например, оставшегося после ошибки.
+
+            С `segments` больше 1 содержимое делится на части, которые загружаются параллельно по отдельным
+            соединениям из пула. Если сервер не поддерживает запрос части содержимого, то загрузка идёт одним потоком.
+
+        Args:
+            url (:obj:`str`): Адрес для запроса.
+            filename (:obj:`str`): Путь и(или) название файла вместе с расширением.
+            timeout (:obj:`int` | :obj:`float`): Используется как время ожидания каждой части ответа от сервера
+                вместо указанного при создании пула.
+            resume (:obj:`bool`, optional): Дописать недостающую часть в существующий файл вместо перезаписи.
+            segments (:obj:`int`, optional): Количество параллельно загружаемых частей.
+            **kwargs: Произвольные ключевые аргументы для `requests.request`.
+
+        Raises:
+            :class:`yandex_music.exceptions.IncompleteDownloadError`: Если размер содержимого не совпал с заявленным.
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        offset = os.path.getsize(filename) if resume and os.path.isfile(filename) else 0
+
+        size = self._probe_range(url, timeout=timeout, **kwargs) if segments > 1 else None
+        if size:
+            self._download_segments(url, filename, offset, size, segments, timeout=timeout, **kwargs)
+            return
+
+        chunks = self.retrieve_stream(url, timeout=timeout, offset=offset, **kwargs)
+
+        with open(filename, 'ab' if offset else 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
@@ -2,28 +2,36 @@
 # THIS IS AUTO GENERATED COPY OF client.py. DON'T EDIT IN BY HANDS #
 ####################################################################
 
-# Не используется ujson из-за отсутствия в нём object_hook'a
+# Для разбора ответов можно выбрать стороннюю библиотеку JSON (см. yandex_music.utils.json_backend).
 # Отправка вообще application/x-www-form-urlencoded, а не JSON'a
 # https://github.com/psf/requests/blob/master/requests/models.py#L508
 import asyncio
+import copy
+import functools
 import json
 import keyword
 import logging
+import os
 import re
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 import aiofiles
 import aiohttp
 
 from yandex_music.exceptions import (
     BadRequestError,
+    IncompleteDownloadError,
     NetworkError,
     NotFoundError,
     TimedOutError,
     UnauthorizedError,
     YandexMusicError,
 )
+from yandex_music.utils.json_backend import AUTO_BACKEND, JSONLoads, get_loads
+from yandex_music.utils.json_stream import STREAM_CHUNK_SIZE, JSONArrayStream
 from yandex_music.utils.response import Response
+from yandex_music.utils.response_cache import ResponseCache
+from yandex_music.utils.response_format import BYTES_FORMAT, JSON_FORMAT, current_response_format, raise_if_raw
 
 if TYPE_CHECKING:
     from yandex_music import ClientType, JSONType
@@ -35,7 +43,19 @@ HEADERS = {
 }
 DEFAULT_TIMEOUT = 5
 
-reserved_names = list(keyword.kwlist) + ['ClientType']
+DEFAULT_POOL_LIMIT = 100
+DEFAULT_POOL_LIMIT_PER_HOST = 30
+DEFAULT_KEEPALIVE_TIMEOUT = 15
+DEFAULT_DNS_CACHE_TTL = 10
+
+reserved_names = {*keyword.kwlist, 'ClientType'}
+
+# размер кэша нормализованных имён полей; различных ключей в ответах API несколько сотен
+NORMALIZED_KEYS_CACHE_SIZE = 4096
+
+_first_cap_re = re.compile('(.)([A-Z][a-z]+)')
+_all_cap_re = re.compile('([a-z0-9])([A-Z])')
+_content_range_re = re.compile(r'bytes (\d+)-(\d+)/(\d+|\*)')
 
 logging.getLogger('urllib3').setLevel(logging.WARNING)
 
@@ -46,6 +66,8 @@ class DefaultTimeout:
 
 default_timeout = DefaultTimeout()
 TimeoutType = Union[int, float, DefaultTimeout]
+ResponseCallback = Callable[[int, Mapping[str, str]], None]
+ContentRangeCallback = Callable[[int, Optional[int], Optional[int]], None]
 
 
 class Request:
@@ -53,10 +75,28 @@ class Request:
 
     Предоставляет методы для выполнения POST и GET запросов, скачивания файлов.
 
+    Note:
+        Все запросы выполняются через одну долгоживущую сессию с пулом соединений, которая создаётся при первом
+        запросе. Для освобождения соединений используйте метод :func:`close`.
+
+        В синхронной версии параметр `pool_limit` задаёт количество кэшируемых пулов (по одному на хост), а любое
+        ненулевое значение `keepalive_timeout` просто оставляет соединения открытыми. Параметр `dns_cache_ttl`
+        используется только в асинхронной версии.
+
     Args:
         client (:obj:`yandex_music.Client`, optional): Клиент Yandex Music.
         headers (:obj:`dict`, optional): Заголовки передаваемые с каждым запросом.
         proxy_url (:obj:`str`, optional): Прокси.
+        timeout (:obj:`int` | :obj:`float`, optional): Время ожидания ответа от сервера.
+        pool_limit (:obj:`int`, optional): Общее ограничение количества соединений в пуле.
+        pool_limit_per_host (:obj:`int`, optional): Ограничение количества соединений к одному хосту.
+        keepalive_timeout (:obj:`int` | :obj:`float`, optional): Время жизни неиспользуемого соединения в секундах.
+            При :obj:`None` или `0` соединения закрываются после каждого запроса.
+        dns_cache_ttl (:obj:`int`, optional): Время жизни кэша DNS в секундах. При :obj:`None` кэш бессрочный.
+        json_backend (:obj:`str`, optional): Библиотека для разбора JSON ответов. Подробнее в
+            :func:`yandex_music.utils.json_backend.get_loads`.
+        response_cache (:obj:`yandex_music.utils.response_cache.ResponseCache`, optional): Кэш ответов на GET
+            запросы к редко меняющимся разделам API.
     """
 
     def __init__(
@@ -65,12 +105,30 @@ class Request:
         headers: Optional[Dict[str, str]] = None,
         proxy_url: Optional[str] = None,
         timeout: 'TimeoutType' = default_timeout,
+        pool_limit: int = DEFAULT_POOL_LIMIT,
+        pool_limit_per_host: int = DEFAULT_POOL_LIMIT_PER_HOST,
+        keepalive_timeout: Optional[float] = DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: Optional[int] = DEFAULT_DNS_CACHE_TTL,
+        json_backend: str = AUTO_BACKEND,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
         self.headers = headers or HEADERS.copy()
+        self.response_cache = response_cache
+
+        self.pool_limit = pool_limit
+        self.pool_limit_per_host = pool_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
 
         self._timeout = DEFAULT_TIMEOUT
         self.set_timeout(timeout)
 
+        self._json_loads: Optional[JSONLoads] = None
+        self.set_json_backend(json_backend)
+
         if client:
             self.client = self.set_and_return_client(client)
 
@@ -101,6 +159,18 @@ class Request:
         if timeout is default_timeout:
             self._timeout = DEFAULT_TIMEOUT
 
+    def set_json_backend(self, backend: str = AUTO_BACKEND) -> None:
+        """Устанавливает библиотеку для разбора JSON ответов.
+
+        Note:
+            Возможные значения `backend`: auto/json/orjson/ujson/simdjson. Результат разбора не зависит от выбранной
+            библиотеки.
+
+        Args:
+            backend (:obj:`str`): Название библиотеки.
+        """
+        self._json_loads = get_loads(backend)
+
     def set_authorization(self, token: str) -> None:
         """Добавляет заголовок авторизации для каждого запроса.
 
@@ -128,6 +198,77 @@ class Request:
 
         return self.client
 
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """:obj:`aiohttp.ClientSession`: Сессия с пулом соединений, создаётся при первом обращении.
+
+        Note:
+            Сессия привязана к циклу событий, в котором была создана. При смене цикла прежняя сессия закрывается
+            и создаётся новая.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._close_stale_session()
+            self._session = self._create_session()
+            self._session_loop = loop
+
+        return self._session
+
+    def _close_stale_session(self) -> None:
+        """Закрытие сессии, созданной в другом цикле событий.
+
+        Note:
+            Если цикл сессии ещё работает в другом потоке, сессия закрывается в нём. Иначе дождаться закрытия
+            соединений нельзя: сессия отсоединяется от пула, а пул закрывается сразу. Соединения пула закрытого
+            цикла только отбрасываются.
+        """
+        session, loop = self._session, self._session_loop
+        self._session = self._session_loop = None
+        if session is None or session.closed or loop is None:
+            return
+
+        if loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+
+        connector = session.connector
+        session.detach()
+        if connector is not None:
+            # публичный close() возвращает объект для ожидания, а в чужом цикле его не дождаться
+            connector._close()
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Создание сессии с пулом соединений согласно настройкам.
+
+        Note:
+            Cookie между запросами не сохраняются, как и при выполнении каждого запроса в отдельной сессии.
+
+        Returns:
+            :obj:`aiohttp.ClientSession`: Новая сессия.
+        """
+        keepalive: Dict[str, Any] = {'force_close': True}
+        if self.keepalive_timeout:
+            keepalive = {'keepalive_timeout': self.keepalive_timeout}
+
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_limit,
+            limit_per_host=self.pool_limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            **keepalive,
+        )
+
+        return aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+
+    async def close(self) -> None:
+        """Закрытие сессии и всех открытых соединений пула.
+
+        Note:
+            После закрытия экземпляр можно продолжать использовать, новая сессия будет создана при следующем запросе.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
     @staticmethod
     def _convert_camel_to_snake(text: str) -> str:
         """Конвертация CamelCase в SnakeCase.
@@ -138,18 +279,45 @@ class Request:
         Returns:
             :obj:`str`: Название переменной в SnakeCase.
         """
-        s = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', text)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s).lower()
+        s = _first_cap_re.sub(r'\1_\2', text)
+        return _all_cap_re.sub(r'\1_\2', s).lower()
 
     @staticmethod
-    def _object_hook(obj: 'JSONType') -> 'JSONType':
-        """Нормализация имён переменных пришедших с API.
+    @functools.lru_cache(maxsize=NORMALIZED_KEYS_CACHE_SIZE)
+    def _normalize_key(key: str) -> str:
+        """Нормализация имени переменной пришедшей с API.
 
         Note:
             В названии переменной заменяет "-" на "_", конвертирует в SnakeCase, если название является
             зарезервированным словом или "client" - добавляет "_" в конец. Если название переменной начинается с цифры -
             добавляет в начало "_".
 
+            Результат кэшируется, так как одни и те же имена повторяются в ответах тысячи раз.
+
+        Args:
+            key (:obj:`str`): Название переменной.
+
+        Returns:
+            :obj:`str`: Нормализованное название переменной.
+        """
+        key = Request._convert_camel_to_snake(key.replace('-', '_'))
+        key = key.lower()
+
+        if key in reserved_names:
+            key += '_'
+
+        if len(key) and key[0].isdigit():
+            key = '_' + key
+
+        return key
+
+    @staticmethod
+    def _object_hook(obj: 'JSONType') -> 'JSONType':
+        """Нормализация имён переменных пришедших с API.
+
+        Note:
+            Правила нормализации описаны в :func:`_normalize_key`.
+
         Args:
             obj (:obj:`dict`): Словарь, где ключ название переменной, а значение - содержимое.
 
@@ -159,20 +327,53 @@ class Request:
         if not isinstance(obj, dict):
             return obj
 
-        cleaned_object: Dict[str, JSONType] = {}
-        for key, value in obj.items():
-            key = Request._convert_camel_to_snake(key.replace('-', '_'))
-            key = key.lower()
+        normalize_key = Request._normalize_key
+        return {normalize_key(key): value for key, value in obj.items()}
 
-            if key in reserved_names:
-                key += '_'
+    @staticmethod
+    def _normalize_keys(obj: 'JSONType') -> 'JSONType':
+        """Рекурсивная нормализация имён переменных в уже разобранном ответе.
 
-            if len(key) and key[0].isdigit():
-                key = '_' + key
+        Note:
+            Используется со сторонними библиотеками JSON, в которых нет `object_hook`. Результат совпадает с
+            :func:`_object_hook`, применённым к каждому словарю.
 
-            cleaned_object.update({key: value})
+        Args:
+            obj (:obj:`JSONType`): Разобранный ответ.
+
+        Returns:
+            :obj:`JSONType`: Ответ с нормализованными ключами.
+        """
+        if isinstance(obj, dict):
+            normalize_key = Request._normalize_key
+            normalize_keys = Request._normalize_keys
+            return {normalize_key(key): normalize_keys(value) for key, value in obj.items()}
+        if isinstance(obj, list):
+            normalize_keys = Request._normalize_keys
+            return [normalize_keys(value) for value in obj]
 
-        return cleaned_object
+        return obj
+
+    def _loads(self, text: str) -> 'JSONType':
+        """Разбор JSON выбранной библиотекой с нормализацией имён переменных.
+
+        Note:
+            Если сторонняя библиотека не смогла разобрать ответ (например, `orjson` не поддерживает целые числа больше
+            64 бит), разбор повторяется стандартной библиотекой.
+
+        Args:
+            text (:obj:`str`): Ответ от API.
+
+        Returns:
+            :obj:`JSONType`: Разобранный ответ с нормализованными ключами.
+        """
+        if self._json_loads is not None:
+            try:
+                return Request._normalize_keys(self._json_loads(text))
+            except ValueError:
+                logging.getLogger(__name__).debug('JSON backend failed to parse response, using json module')
+
+        return json.loads(text, object_hook=Request._object_hook)
 
     def _parse(self, json_data: bytes) -> Optional[Response]:
         """Разбор ответа от API.
@@ -191,7 +392,7 @@ class Request:
         """
         try:
             decoded_s = json_data.decode('UTF-8')
-            data = json.loads(decoded_s, object_hook=Request._object_hook)
+            data = self._loads(decoded_s)
 
         except UnicodeDecodeError as e:
             logging.getLogger(__name__).debug('Logging raw invalid UTF-8 response:\n%r', json_data)
@@ -204,15 +405,21 @@ class Request:
 
         return Response.de_json(data, self.client)
 
-    async def _request_wrapper(self, *args: Any, **kwargs: Any) -> bytes:  # noqa: C901
+    async def _request_wrapper(  # noqa: C901
+        self, *args: Any, on_response: Optional[ResponseCallback] = None, **kwargs: Any
+    ) -> bytes:
         """Обёртка над запросом библиотеки `aiohttp`.
 
         Note:
             Добавляет необходимые заголовки для запроса, обрабатывает статус коды, следит за таймаутом, кидает
             необходимые исключения, возвращает ответ. Передаёт пользовательские аргументы в запрос.
 
+            Ответ `304 Not Modified` на условный запрос считается успешным и возвращается с пустым телом.
+
         Args:
             *args: Произвольные аргументы для `aiohttp.request`.
+            on_response (:obj:`Callable`, optional): Функция, вызываемая со статус кодом и заголовками успешного
+                ответа.
             **kwargs: Произвольные ключевые аргументы для `aiohttp.request`.
 
         Returns:
@@ -236,7 +443,7 @@ class Request:
             kwargs['timeout'] = aiohttp.ClientTimeout(total=kwargs['timeout'])
 
         try:
-            async with aiohttp.request(*args, **kwargs) as _resp:
+            async with self.session.request(*args, **kwargs) as _resp:
                 resp = _resp
                 content = await resp.content.read()
         except asyncio.TimeoutError as e:
@@ -244,9 +451,79 @@ class Request:
         except aiohttp.ClientError as e:
             raise NetworkError(e) from e
 
-        if 200 <= resp.status <= 299:
+        if 200 <= resp.status <= 299 or resp.status == 304:
+            if on_response is not None:
+                on_response(resp.status, resp.headers)
+
             return content
 
+        raise self._status_error(resp.status, content)
+
+    async def _stream_wrapper(
+        self,
+        *args: Any,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        on_response: Optional[ResponseCallback] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[bytes]:
+        """Обёртка над запросом библиотеки `aiohttp` с чтением тела ответа по частям.
+
+        Note:
+            Заголовки, таймаут и исключения такие же, как в :func:`_request_wrapper`. Таймаут ограничивает ожидание
+            каждой части ответа, а не всего ответа.
+
+        Args:
+            *args: Произвольные аргументы для `aiohttp.request`.
+            chunk_size (:obj:`int`, optional): Размер читаемой за раз части тела ответа в байтах.
+            on_response (:obj:`Callable`, optional): Функция, вызываемая со статус кодом и заголовками успешного
+                ответа до чтения его тела.
+            **kwargs: Произвольные ключевые аргументы для `aiohttp.request`.
+
+        Yields:
+            :obj:`bytes`: Очередная часть тела ответа.
+
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        if 'headers' not in kwargs:
+            kwargs['headers'] = {}
+
+        kwargs['headers']['User-Agent'] = USER_AGENT
+
+        if kwargs['timeout'] is default_timeout:
+            kwargs['timeout'] = self._timeout
+
+        kwargs['timeout'] = aiohttp.ClientTimeout(sock_connect=kwargs['timeout'], sock_read=kwargs['timeout'])
+
+        try:
+            async with self.session.request(*args, **kwargs) as resp:
+                if not 200 <= resp.status <= 299:
+                    raise self._status_error(resp.status, await resp.content.read())
+
+                if on_response is not None:
+                    on_response(resp.status, resp.headers)
+
+                async for chunk in resp.content.iter_chunked(chunk_size):
+                    yield chunk
+        except asyncio.TimeoutError as e:
+            raise TimedOutError from e
+        except aiohttp.ClientError as e:
+            raise NetworkError(e) from e
+
+    def _status_error(self, status_code: int, content: bytes) -> YandexMusicError:
+        """Получение исключения, соответствующего статус коду неуспешного ответа.
+
+        Args:
+            status_code (:obj:`int`): Статус код ответа.
+            content (:obj:`bytes`): Тело ответа.
+
+        Returns:
+            :class:`yandex_music.exceptions.YandexMusicError`: :class:`yandex_music.exceptions.UnauthorizedError`
+            при невалидном токене или долгом ожидании прямой ссылки на файл,
+            :class:`yandex_music.exceptions.BadRequestError` при неправильном запросе,
+            :class:`yandex_music.exceptions.NotFoundError`, если ресурс не найден, и
+            :class:`yandex_music.exceptions.NetworkError` при остальных ошибках.
+        """
         message = 'Unknown error'
         try:
             parse = self._parse(content)
@@ -255,19 +532,65 @@ class Request:
         except YandexMusicError:
             message = 'Unknown HTTPError'
 
-        if resp.status in (401, 403):
-            raise UnauthorizedError(message)
-        if resp.status == 400:
-            raise BadRequestError(message)
-        if resp.status == 404:
-            raise NotFoundError(message)
-        if resp.status in (409, 413):
-            raise NetworkError(message)
+        if status_code in (401, 403):
+            return UnauthorizedError(message)
+        if status_code == 400:
+            return BadRequestError(message)
+        if status_code == 404:
+            return NotFoundError(message)
+        if status_code in (409, 413):
+            return NetworkError(message)
+
+        if status_code == 502:
+            return NetworkError('Bad Gateway')
 
-        if resp.status == 502:
-            raise NetworkError('Bad Gateway')
+        return NetworkError(f'{message} ({status_code}): {content}')
 
-        raise NetworkError(f'{message} ({resp.status}): {content}')
+    @staticmethod
+    def _parse_content_range(status_code: int, headers: Mapping[str, str]) -> Tuple[int, Optional[int], Optional[int]]:
+        """Определение расположения тела успешного ответа в запрошенном файле.
+
+        Args:
+            status_code (:obj:`int`): Статус код ответа.
+            headers (:obj:`Mapping`): Заголовки ответа.
+
+        Returns:
+            :obj:`tuple` из :obj:`int`, :obj:`int` | :obj:`None` и :obj:`int` | :obj:`None`: Позиция первого байта
+                тела ответа в файле, позиция после последнего байта тела ответа и полный размер файла, если они
+                известны.
+
+        Raises:
+            :class:`yandex_music.exceptions.NetworkError`: При некорректном заголовке `Content-Range`.
+        """
+        if status_code == 206:
+            match = _content_range_re.fullmatch(headers.get('Content-Range', ''))
+            if match is None:
+                raise NetworkError(f'Invalid Content-Range: {headers.get("Content-Range")}')
+
+            start, last, total = match.groups()
+            return int(start), int(last) + 1, None if total == '*' else int(total)
+
+        # при сжатии Content-Length - размер сжатого тела, а получаем мы распакованное
+        length = headers.get('Content-Length', '')
+        if headers.get('Content-Encoding', 'identity') != 'identity' or not length.isdigit():
+            return 0, None, None
+
+        return 0, int(length), int(length)
+
+    @staticmethod
+    def _split_range(start: int, stop: int, segments: int) -> List[Tuple[int, int]]:
+        """Разбиение диапазона байт на части примерно одинакового размера.
+
+        Args:
+            start (:obj:`int`): Позиция первого байта диапазона.
+            stop (:obj:`int`): Позиция после последнего байта диапазона.
+            segments (:obj:`int`): Количество частей.
+
+        Returns:
+            :obj:`list` из :obj:`tuple`: Позиции начала и конца (не включая) каждой части.
+        """
+        segment_size = max(-(-(stop - start) // segments), 1)
+        return [(position, min(position + segment_size, stop)) for position in range(start, stop, segment_size)]
 
     async def get(
         self, url: str, params: 'JSONType' = None, timeout: 'TimeoutType' = default_timeout, **kwargs: Any
@@ -281,20 +604,91 @@ class Request:
                 при создании пула.
             **kwargs: Произвольные ключевые аргументы для `aiohttp.request`.
 
+        Note:
+            Если для текущего вызова метода клиента запрошен ответ без моделей, он возвращается досрочно через
+            :class:`yandex_music.utils.response_format.RawResponse`.
+
+            Если задан `response_cache` и ответ на запрос кэшируется, он берётся из кэша (см.
+            :class:`yandex_music.utils.response_cache.ResponseCache`). Ответ в виде байтов всегда запрашивается.
+
         Returns:
             :obj:`JSONType`: Обработанное тело ответа.
 
         Raises:
             :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
         """
+        ttl = None
+        if self.response_cache is not None and current_response_format.get() != BYTES_FORMAT:
+            ttl = self.response_cache.get_ttl(url)
+        if ttl is not None:
+            return await self._get_cached(url, params, ttl, timeout, **kwargs)
+
         result = await self._request_wrapper(
             'GET', url, params=params, headers=self.headers, proxy=self.proxy_url, timeout=timeout, **kwargs
         )
+        raise_if_raw(BYTES_FORMAT, result)
+
         response = self._parse(result)
-        if response:
-            return response.get_result()
+        parsed_result = response.get_result() if response else None
+        raise_if_raw(JSON_FORMAT, parsed_result)
+
+        return parsed_result
+
+    async def _get_cached(
+        self, url: str, params: 'JSONType', ttl: float, timeout: 'TimeoutType' = default_timeout, **kwargs: Any
+    ) -> 'JSONType':
+        """Отправка GET запроса с использованием кэша ответов.
+
+        Args:
+            url (:obj:`str`): Адрес для запроса.
+            params (:obj:`str`): GET параметры для запроса.
+            ttl (:obj:`float`): Время жизни ответа в секундах.
+            timeout (:obj:`int` | :obj:`float`): Используется как время ожидания ответа от сервера вместо указанного
+                при создании пула.
+            **kwargs: Произвольные ключевые аргументы для `aiohttp.request`.
+
+        Returns:
+            :obj:`JSONType`: Обработанное тело ответа.
 
-        return None
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        assert self.response_cache is not None
+
+        key = self.response_cache.make_key(url, params, self.headers)
+        entry = self.response_cache.get(key)
+
+        if entry is None or not entry.is_fresh():
+            responses: List[Tuple[int, Mapping[str, str]]] = []
+
+            def on_response(status_code: int, headers: Mapping[str, str]) -> None:
+                responses.append((status_code, headers))
+
+            headers = {**self.headers, **entry.validators} if entry is not None else {**self.headers}
+            result = await self._request_wrapper(
+                'GET',
+                url,
+                params=params,
+                headers=headers,
+                proxy=self.proxy_url,
+                timeout=timeout,
+                on_response=on_response,
+                **kwargs,
+            )
+
+            status_code, response_headers = responses[0]
+            if status_code == 304 and entry is not None:
+                entry = self.response_cache.revalidate(entry, ttl, response_headers)
+            else:
+                response = self._parse(result)
+                parsed_result = response.get_result() if response else None
+                entry = self.response_cache.set(key, parsed_result, len(result), ttl, response_headers)
+
+        # вызывающий код может изменить результат, поэтому каждому достаётся своя копия
+        result = copy.deepcopy(entry.result)
+        raise_if_raw(JSON_FORMAT, result)
+
+        return result
 
     async def post(
         self, url: str, data: 'JSONType', timeout: 'TimeoutType' = default_timeout, **kwargs: Any
@@ -308,6 +702,10 @@ class Request:
                 при создании пула.
             **kwargs: Произвольные ключевые аргументы для `aiohttp.request`.
 
+        Note:
+            Если для текущего вызова метода клиента запрошен ответ без моделей, он возвращается досрочно через
+            :class:`yandex_music.utils.response_format.RawResponse`.
+
         Returns:
             :obj:`JSONType`: Обработанное тело ответа.
 
@@ -317,11 +715,66 @@ class Request:
         result = await self._request_wrapper(
             'POST', url, headers=self.headers, proxy=self.proxy_url, data=data, timeout=timeout, **kwargs
         )
+        raise_if_raw(BYTES_FORMAT, result)
+
         response = self._parse(result)
-        if response:
-            return response.get_result()
+        parsed_result = response.get_result() if response else None
+        raise_if_raw(JSON_FORMAT, parsed_result)
+
+        return parsed_result
 
-        return None
+    async def stream(
+        self,
+        url: str,
+        path: Tuple[str, ...],
+        params: 'JSONType' = None,
+        timeout: 'TimeoutType' = default_timeout,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> AsyncIterator['JSONType']:
+        """Отправка GET запроса с потоковым разбором элементов массивов из ответа.
+
+        Note:
+            Ответ разбирается по мере получения (см. :class:`yandex_music.utils.json_stream.JSONArrayStream`), поэтому
+            потребление памяти не зависит от размера ответа. Разбор всегда выполняется стандартной библиотекой,
+            а формат ответа, указанный для метода клиента, не учитывается.
+
+        Args:
+            url (:obj:`str`): Адрес для запроса.
+            path (:obj:`tuple` из :obj:`str`): Путь до массивов в ответе, ключи в виде camelCase.
+            params (:obj:`str`): GET параметры для запроса.
+            timeout (:obj:`int` | :obj:`float`): Используется как время ожидания каждой части ответа от сервера
+                вместо указанного при создании пула.
+            chunk_size (:obj:`int`, optional): Размер читаемой за раз части тела ответа в байтах.
+            **kwargs: Произвольные ключевые аргументы для `aiohttp.request`.
+
+        Yields:
+            :obj:`JSONType`: Очередной элемент массива с нормализованными ключами.
+
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        parser = JSONArrayStream(path, Request._object_hook)
+        chunks = self._stream_wrapper(
+            'GET',
+            url,
+            params=params,
+            headers=self.headers,
+            proxy=self.proxy_url,
+            timeout=timeout,
+            chunk_size=chunk_size,
+            **kwargs,
+        )
+
+        try:
+            async for chunk in chunks:
+                for item in parser.feed(chunk):
+                    yield item
+
+            for item in parser.close():
+                yield item
+        except ValueError as e:
+            raise YandexMusicError('Invalid server response') from e
 
     async def retrieve(self, url: str, timeout: 'TimeoutType' = default_timeout, **kwargs: Any) -> bytes:
         """Отправка GET запроса и получение содержимого без обработки (парсинга).
@@ -340,19 +793,248 @@ class Request:
         """
         return await self._request_wrapper('GET', url, proxy=self.proxy_url, timeout=timeout, **kwargs)
 
-    async def download(self, url: str, filename: str, timeout: 'TimeoutType' = default_timeout, **kwargs: Any) -> None:
-        """Отправка запроса на получение содержимого и его запись в файл.
+    async def retrieve_stream(
+        self,
+        url: str,
+        timeout: 'TimeoutType' = default_timeout,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        offset: int = 0,
+        end: Optional[int] = None,
+        on_content_range: Optional[ContentRangeCallback] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[bytes]:
+        """Отправка GET запроса и получение содержимого по частям без обработки (парсинга).
+
+        Note:
+            В памяти одновременно находится только одна часть ответа, а первые части доступны до окончания загрузки.
+
+            При ненулевом `offset` или указанном `end` запрашивается только часть содержимого (заголовок `Range`).
+            Если сервер не поддерживает запрос части содержимого и отдаёт его целиком, то байты до `offset`
+            пропускаются, а после `end` не читаются.
+
+            После получения последней части размер содержимого сверяется с заявленным сервером.
+
+        Args:
+            url (:obj:`str`): Адрес для запроса.
+            timeout (:obj:`int` | :obj:`float`): Используется как время ожидания каждой части ответа от сервера
+                вместо указанного при создании пула.
+            chunk_size (:obj:`int`, optional): Размер читаемой за раз части тела ответа в байтах.
+            offset (:obj:`int`, optional): Позиция в байтах, начиная с которой нужно получить содержимое.
+            end (:obj:`int`, optional): Позиция в байтах, до которой (не включая) нужно получить содержимое.
+            on_content_range (:obj:`Callable`, optional): Функция, вызываемая до получения первой части с позицией
+                первого байта, позицией после последнего байта отдаваемого содержимого и полным размером файла.
+                Неизвестные серверу позиция конца и размер передаются как :obj:`None`.
+            **kwargs: Произвольные ключевые аргументы для `aiohttp.request`.
+
+        Yields:
+            :obj:`bytes`: Очередная часть тела ответа.
+
+        Raises:
+            :class:`yandex_music.exceptions.IncompleteDownloadError`: Если размер содержимого не совпал с заявленным.
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        if offset or end is not None:
+            last = '' if end is None else end - 1
+            kwargs['headers'] = {**kwargs.get('headers', {}), 'Range': f'bytes={offset}-{last}'}
+
+        content_ranges: List[Tuple[int, Optional[int]]] = []
+
+        def on_response(status_code: int, headers: Mapping[str, str]) -> None:
+            start, stop, total = self._parse_content_range(status_code, headers)
+            if start > offset:
+                raise NetworkError(f'Requested content from {offset} byte, but got from {start} byte')
+
+            content_ranges.append((start, stop))
+            if on_content_range is not None:
+                on_content_range(offset, stop if end is None else end if stop is None else min(end, stop), total)
+
+        chunks = self._stream_wrapper(
+            'GET', url, proxy=self.proxy_url, timeout=timeout, chunk_size=chunk_size, on_response=on_response, **kwargs
+        )
+
+        received = 0
+        async for chunk in chunks:
+            position = content_ranges[0][0] + received
+            received += len(chunk)
+            if end is not None and position + len(chunk) >= end:
+                yield chunk[max(offset - position, 0) : end - position]
+                return
+
+            if position + len(chunk) > offset:
+                yield chunk[offset - position :] if position < offset else chunk
+
+        start, stop = content_ranges[0]
+        expected = stop if end is None else end
+        if expected is not None and start + received != expected:
+            raise IncompleteDownloadError(f'Received {start + received} of {expected} bytes')
+
+    async def _probe_range(self, url: str, timeout: 'TimeoutType' = default_timeout, **kwargs: Any) -> Optional[int]:
+        """Проверка поддержки сервером запроса части содержимого.
 
         Args:
             url (:obj:`str`): Адрес для запроса.
-            filename (:obj:`str`): Путь и(или) название файла вместе с расширением.
             timeout (:obj:`int` | :obj:`float`): Используется как время ожидания ответа от сервера вместо указанного
                 при создании пула.
             **kwargs: Произвольные ключевые аргументы для `aiohttp.request`.
 
+        Returns:
+            :obj:`int` | :obj:`None`: Полный размер содержимого или :obj:`None`, если запрос части не поддерживается.
+
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        headers = {**kwargs.pop('headers', {}), 'Range': 'bytes=0-0'}
+
+        responses: List[Tuple[int, Mapping[str, str]]] = []
+        chunks = self._stream_wrapper(
+            'GET',
+            url,
+            proxy=self.proxy_url,
+            timeout=timeout,
+            headers=headers,
+            on_response=lambda *response: responses.append(response),
+            **kwargs,
+        )
+
+        # без поддержки запроса части в ответе весь файл, поэтому дальше первой части не читаем
+        async for _chunk in chunks:
+            break
+        await chunks.aclose()
+
+        status_code, response_headers = responses[0]
+        if status_code != 206:
+            return None
+
+        return self._parse_content_range(status_code, response_headers)[2]
+
+    async def _download_segment(
+        self, url: str, filename: str, start: int, end: int, timeout: 'TimeoutType' = default_timeout, **kwargs: Any
+    ) -> None:
+        """Загрузка части содержимого и её запись на своё место в файле.
+
+        Args:
+            url (:obj:`str`): Адрес для запроса.
+            filename (:obj:`str`): Путь до файла, уже имеющего полный размер.
+            start (:obj:`int`): Позиция первого байта части.
+            end (:obj:`int`): Позиция после последнего байта части.
+            timeout (:obj:`int` | :obj:`float`): Используется как время ожидания каждой части ответа от сервера
+                вместо указанного при создании пула.
+            **kwargs: Произвольные ключевые аргументы для `aiohttp.request`.
+
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        chunks = self.retrieve_stream(url, timeout=timeout, offset=start, end=end, **kwargs)
+
+        async with aiofiles.open(filename, 'r+b') as f:
+            await f.seek(start)
+            async for chunk in chunks:
+                await f.write(chunk)
+
+    async def _download_segments(
+        self,
+        url: str,
+        filename: str,
+        offset: int,
+        size: int,
+        segments: int,
+        timeout: 'TimeoutType' = default_timeout,
+        **kwargs: Any,
+    ) -> None:
+        """Параллельная загрузка частей содержимого в отдельных задачах.
+
+        Note:
+            Файл заранее расширяется до полного размера, а каждая часть записывается на своё место. Ошибка одной части
+            не прерывает загрузку остальных. После их завершения файл обрезается до начала первой незагруженной части,
+            чтобы загрузку можно было продолжить. При отмене загрузки незавершённые части отменяются.
+
+        Args:
+            url (:obj:`str`): Адрес для запроса.
+            filename (:obj:`str`): Путь и(или) название файла вместе с расширением.
+            offset (:obj:`int`): Размер уже загруженного начала файла.
+            size (:obj:`int`): Полный размер содержимого.
+            segments (:obj:`int`): Количество частей.
+            timeout (:obj:`int` | :obj:`float`): Используется как время ожидания каждой части ответа от сервера
+                вместо указанного при создании пула.
+            **kwargs: Произвольные ключевые аргументы для `aiohttp.request`.
+
         Raises:
             :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
         """
-        result = await self.retrieve(url, timeout=timeout, **kwargs)
-        async with aiofiles.open(filename, 'wb') as f:
-            await f.write(result)
+        if offset > size:
+            offset = 0
+
+        async with aiofiles.open(filename, 'r+b' if offset else 'wb') as f:
+            await f.truncate(size)
+
+        bounds = self._split_range(offset, size, segments)
+        tasks = [
+            asyncio.ensure_future(self._download_segment(url, filename, start, end, timeout=timeout, **kwargs))
+            for start, end in bounds
+        ]
+
+        try:
+            # как и в синхронной версии, ошибка одной части не прерывает загрузку остальных
+            await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            # незавершённые части остаются, только если загрузку отменили снаружи
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            failed = [(start, task) for (start, _), task in zip(bounds, tasks) if task.cancelled() or task.exception()]
+            if failed:
+                # в файле остаётся только непрерывно загруженное начало
+                async with aiofiles.open(filename, 'r+b') as f:
+                    await f.truncate(failed[0][0])
+
+        if failed:
+            # у отменённой части exception() сам вызывает asyncio.CancelledError
+            exception = failed[0][1].exception()
+            raise exception
+
+    async def download(
+        self,
+        url: str,
+        filename: str,
+        timeout: 'TimeoutType' = default_timeout,
+        resume: bool = False,
+        segments: int = 1,
+        **kwargs: Any,
+    ) -> None:
+        """Отправка запроса на получение содержимого и его запись в файл.
+
+        Note:
+            Содержимое записывается по мере получения (см. :func:`retrieve_stream`), поэтому потребление памяти не
+            зависит от размера файла. При ошибке во время загрузки в файле остаётся полученная часть.
+
+            С `resume` загрузка продолжается с конца уже существующего файла, например, оставшегося после ошибки.
+
+            С `segments` больше 1 содержимое делится на части, которые загружаются параллельно по отдельным
+            соединениям из пула. Если сервер не поддерживает запрос части содержимого, то загрузка идёт одним потоком.
+
+        Args:
+            url (:obj:`str`): Адрес для запроса.
+            filename (:obj:`str`): Путь и(или) название файла вместе с расширением.
+            timeout (:obj:`int` | :obj:`float`): Используется как время ожидания каждой части ответа от сервера
+                вместо указанного при создании пула.
+            resume (:obj:`bool`, optional): Дописать недостающую часть в существующий файл вместо перезаписи.
+            segments (:obj:`int`, optional): Количество параллельно загружаемых частей.
+            **kwargs: Произвольные ключевые аргументы для `aiohttp.request`.
+
+        Raises:
+            :class:`yandex_music.exceptions.IncompleteDownloadError`: Если размер содержимого не совпал с заявленным.
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        offset = os.path.getsize(filename) if resume and os.path.isfile(filename) else 0
+
+        size = await self._probe_range(url, timeout=timeout, **kwargs) if segments > 1 else None
+        if size:
+            await self._download_segments(url, filename, offset, size, segments, timeout=timeout, **kwargs)
+            return
+
+        chunks = self.retrieve_stream(url, timeout=timeout, offset=offset, **kwargs)
+
+        async with aiofiles.open(filename, 'ab' if offset else 'wb') as f:
+            async for chunk in chunks:
+                await f.write(chunk)
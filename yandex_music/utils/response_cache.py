@@ -0,0 +1,229 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Hashable, Mapping, Optional, Pattern, Tuple
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from yandex_music import JSONType
+
+#: Время жизни ответов в секундах по регулярным выражениям пути запроса. Ответы остальных запросов не кэшируются.
+DEFAULT_RESPONSE_TTLS: Dict[str, float] = {
+    r'/genres': 3600,
+    r'/tags/[^/]+/playlist-ids': 3600,
+    r'/rotor/stations/list': 3600,
+    r'/rotor/stations/dashboard': 300,
+    r'/landing3': 300,
+    r'/landing3/(chart(/[^/]+)?|new-releases|new-playlists|podcasts)': 600,
+    r'/artists/[^/]+/brief-info': 600,
+}
+
+#: Максимальный суммарный размер тел кэшируемых ответов в байтах по умолчанию.
+RESPONSE_CACHE_SIZE = 32 * 2**20
+
+# заголовки запроса, от которых зависит ответ
+_VARY_HEADERS = ('Authorization', 'Accept-Language')
+
+
+class CachedResponse:
+    """Класс, представляющий закэшированный ответ API.
+
+    Attributes:
+        result (:obj:`JSONType`): Разобранный результат ответа.
+        size (:obj:`int`): Размер тела ответа в байтах.
+        expires_at (:obj:`float`): Момент истечения срока по часам :func:`time.monotonic`.
+        etag (:obj:`str`): Значение заголовка `ETag` ответа.
+        last_modified (:obj:`str`): Значение заголовка `Last-Modified` ответа.
+    """
+
+    __slots__ = ('etag', 'expires_at', 'last_modified', 'result', 'size')
+
+    def __init__(
+        self,
+        result: 'JSONType',
+        size: int,
+        expires_at: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        self.result = result
+        self.size = size
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def is_fresh(self) -> bool:
+        """Проверка, что срок жизни ответа не истёк.
+
+        Returns:
+            :obj:`bool`: Можно ли использовать ответ без запроса.
+        """
+        return self.expires_at > time.monotonic()
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """:obj:`dict`: Заголовки условного запроса для проверки, изменился ли ответ."""
+        headers = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+
+        return headers
+
+
+class ResponseCache:
+    """Класс, представляющий кэш ответов на GET запросы к API в памяти.
+
+    Note:
+        Кэшируются только ответы запросов, путь которых полностью совпадает с одним из регулярных выражений в
+        `ttls`. Ответы хранятся уже разобранными, поэтому при попадании в кэш не выполняется ни запрос, ни разбор
+        JSON. Запрос возвращает копию закэшированного результата, поэтому её изменение не затрагивает кэш.
+
+        Ответ определяется адресом, параметрами запроса, токеном и языком. После истечения срока ответ с
+        заголовками `ETag` или `Last-Modified` проверяется условным запросом, и при ответе `304 Not Modified`
+        срок продлевается без загрузки и разбора тела.
+
+        При превышении `max_size` вытесняются ответы, к которым дольше всего не обращались. Кэш можно
+        использовать из нескольких потоков.
+
+    Args:
+        ttls (:obj:`dict`, optional): Время жизни ответов в секундах по регулярным выражениям пути запроса.
+        max_size (:obj:`int`, optional): Максимальный суммарный размер тел ответов в байтах.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_size: int = RESPONSE_CACHE_SIZE) -> None:
+        if ttls is None:
+            ttls = DEFAULT_RESPONSE_TTLS
+
+        self.max_size = max_size
+
+        self._ttls: Tuple[Tuple[Pattern[str], float], ...] = tuple(
+            (re.compile(pattern), ttl) for pattern, ttl in ttls.items()
+        )
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """:obj:`int`: Суммарный размер тел ответов в байтах."""
+        return self._size
+
+    def get_ttl(self, url: str) -> Optional[float]:
+        """Получение времени жизни ответа на запрос.
+
+        Args:
+            url (:obj:`str`): Адрес запроса.
+
+        Returns:
+            :obj:`float` | :obj:`None`: Время жизни в секундах или :obj:`None`, если ответ не кэшируется.
+        """
+        path = urlsplit(url).path
+        for pattern, ttl in self._ttls:
+            if pattern.fullmatch(path):
+                return ttl
+
+        return None
+
+    @staticmethod
+    def make_key(url: str, params: 'JSONType', headers: Mapping[str, str]) -> Hashable:
+        """Получение ключа ответа в кэше.
+
+        Args:
+            url (:obj:`str`): Адрес запроса.
+            params (:obj:`dict`, optional): GET параметры запроса.
+            headers (:obj:`dict`): Заголовки запроса.
+
+        Returns:
+            :obj:`Hashable`: Ключ ответа.
+        """
+        if isinstance(params, dict):
+            params = tuple(sorted((str(name), str(value)) for name, value in params.items()))
+
+        return (url, params, *(headers.get(name) for name in _VARY_HEADERS))
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        """Получение ответа из кэша.
+
+        Note:
+            Возвращается и ответ с истёкшим сроком, чтобы его можно было проверить условным запросом.
+
+        Args:
+            key (:obj:`Hashable`): Ключ ответа.
+
+        Returns:
+            :obj:`yandex_music.utils.response_cache.CachedResponse` | :obj:`None`: Ответ или :obj:`None`, если его
+            нет в кэше.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        return entry
+
+    def set(
+        self, key: Hashable, result: 'JSONType', size: int, ttl: float, headers: Mapping[str, str]
+    ) -> CachedResponse:
+        """Сохранение ответа в кэш.
+
+        Note:
+            Ответ больше `max_size` не сохраняется.
+
+        Args:
+            key (:obj:`Hashable`): Ключ ответа.
+            result (:obj:`JSONType`): Разобранный результат ответа.
+            size (:obj:`int`): Размер тела ответа в байтах.
+            ttl (:obj:`float`): Время жизни ответа в секундах.
+            headers (:obj:`Mapping`): Заголовки ответа.
+
+        Returns:
+            :obj:`yandex_music.utils.response_cache.CachedResponse`: Сохранённый ответ.
+        """
+        entry = CachedResponse(result, size, time.monotonic() + ttl, headers.get('ETag'), headers.get('Last-Modified'))
+        if size > self.max_size:
+            return entry
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+
+            self._entries[key] = entry
+            self._size += size
+
+            while self._size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+
+        return entry
+
+    def revalidate(self, entry: CachedResponse, ttl: float, headers: Mapping[str, str]) -> CachedResponse:
+        """Продление срока ответа после ответа `304 Not Modified` на условный запрос.
+
+        Args:
+            entry (:obj:`yandex_music.utils.response_cache.CachedResponse`): Закэшированный ответ.
+            ttl (:obj:`float`): Время жизни ответа в секундах.
+            headers (:obj:`Mapping`): Заголовки ответа `304 Not Modified`.
+
+        Returns:
+            :obj:`yandex_music.utils.response_cache.CachedResponse`: Тот же ответ с продлённым сроком.
+        """
+        with self._lock:
+            entry.expires_at = time.monotonic() + ttl
+            entry.etag = headers.get('ETag', entry.etag)
+            entry.last_modified = headers.get('Last-Modified', entry.last_modified)
+
+        return entry
+
+    def clear(self) -> None:
+        """Очистка кэша."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
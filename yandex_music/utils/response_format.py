@@ -0,0 +1,45 @@
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Optional, Union
+
+if TYPE_CHECKING:
+    from yandex_music import JSONType
+
+#: Ответ API преобразуется в модели библиотеки.
+MODEL_FORMAT = 'model'
+#: Возвращается секция `result` ответа API с нормализованными ключами, без создания моделей.
+JSON_FORMAT = 'json'
+#: Возвращается тело ответа API без разбора.
+BYTES_FORMAT = 'bytes'
+
+#: Формат ответа для текущего вызова метода клиента. Устанавливается декоратором методов клиента.
+current_response_format: ContextVar[Optional[str]] = ContextVar('current_response_format', default=None)
+
+
+class RawResponse(Exception):
+    """Исключение для досрочного возврата ответа API без создания моделей.
+
+    Note:
+        Выбрасывается в :class:`yandex_music.utils.request.Request` и перехватывается декоратором методов клиента,
+        поэтому никогда не доходит до пользовательского кода.
+
+    Args:
+        data (:obj:`JSONType` | :obj:`bytes`): Ответ API в запрошенном формате.
+    """
+
+    def __init__(self, data: Union['JSONType', bytes]) -> None:
+        super().__init__()
+        self.data = data
+
+
+def raise_if_raw(response_format: str, data: Union['JSONType', bytes]) -> None:
+    """Досрочный возврат ответа, если для текущего вызова запрошен указанный формат.
+
+    Args:
+        response_format (:obj:`str`): Формат, в котором представлены `data`.
+        data (:obj:`JSONType` | :obj:`bytes`): Ответ API.
+
+    Raises:
+        :class:`yandex_music.utils.response_format.RawResponse`: Если запрошен формат `response_format`.
+    """
+    if current_response_format.get() == response_format:
+        raise RawResponse(data)
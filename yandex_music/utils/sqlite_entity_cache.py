@@ -0,0 +1,211 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from yandex_music.utils.entity_cache import EntityCacheBackend
+
+if TYPE_CHECKING:
+    from yandex_music import JSONType
+
+#: Связь объекта с исполнителем.
+ARTIST_RELATION = 'artist'
+#: Связь объекта с альбомом.
+ALBUM_RELATION = 'album'
+
+#: Сколько секунд ждать снятия блокировки базы другим процессом.
+BUSY_TIMEOUT = 30
+
+# ограничение на количество параметров запроса в старых версиях SQLite - 999
+_MAX_VARIABLES = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    object_type TEXT NOT NULL,
+    revision INTEGER,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS entities_object_key ON entities (object_type, key);
+
+CREATE TABLE IF NOT EXISTS relations (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    relation TEXT NOT NULL,
+    related_id TEXT NOT NULL,
+    PRIMARY KEY (namespace, key, relation, related_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS relations_related ON relations (relation, related_id);
+"""
+
+# в запрос подставляются только плейсхолдеры ключей
+_SELECT_ENTITIES = 'SELECT key, data FROM entities WHERE namespace = ? AND updated_at > ? AND key IN ({})'
+
+
+def _chunks(keys: List[str]) -> Iterator[List[str]]:
+    for position in range(0, len(keys), _MAX_VARIABLES):
+        yield keys[position : position + _MAX_VARIABLES]
+
+
+def _get_relations(data: 'JSONType') -> List[Tuple[str, str]]:
+    relations = []
+    if isinstance(data, dict):
+        for relation, field in ((ARTIST_RELATION, 'artists'), (ALBUM_RELATION, 'albums')):
+            items = data.get(field)
+            if not isinstance(items, list):
+                continue
+
+            relations.extend(
+                (relation, str(item['id'])) for item in items if isinstance(item, dict) and item.get('id') is not None
+            )
+
+    return relations
+
+
+class SQLiteEntityCache(EntityCacheBackend):
+    """Класс, представляющий постоянный кэш объектов в базе SQLite.
+
+    Note:
+        Объекты хранятся в виде JSON вместе с ревизией (если она есть в ответе API) и временем сохранения. Связи
+        треков и альбомов с исполнителями и треков с альбомами хранятся в отдельной таблице с индексом, поэтому
+        ранее полученные объекты можно найти по исполнителю или альбому без запросов к API
+        (см. :func:`get_related`).
+
+        База работает в режиме WAL: чтение не блокирует запись, а одну базу могут одновременно использовать
+        несколько процессов. После `fork` процесс открывает собственное соединение.
+
+        Без `ttl` объекты не устаревают, и ранее полученные объекты доступны без сети.
+
+        Операции с базой синхронные и в асинхронном клиенте выполняются в цикле событий.
+
+    Args:
+        path (:obj:`str`): Путь до файла базы.
+        ttl (:obj:`float`, optional): Время жизни объекта в секундах.
+    """
+
+    def __init__(self, path: str, ttl: Optional[float] = None) -> None:
+        self.path = path
+        self.ttl = ttl
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        # соединение нельзя использовать в дочернем процессе после fork
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.executescript(_SCHEMA)
+
+            self._connection, self._pid = connection, os.getpid()
+
+        return self._connection
+
+    def get_many(self, namespace: str, keys: List[str]) -> Dict[str, 'JSONType']:
+        """Получение объектов из базы.
+
+        Args:
+            namespace (:obj:`str`): Пространство имён объектов.
+            keys (:obj:`list` из :obj:`str`): Ключи объектов.
+
+        Returns:
+            :obj:`dict`: Найденные и ещё не устаревшие объекты по ключам.
+        """
+        min_updated_at = time.time() - self.ttl if self.ttl is not None else float('-inf')
+
+        entities = {}
+        with self._lock:
+            connection = self._connect()
+            for chunk in _chunks(keys):
+                placeholders = ', '.join('?' * len(chunk))
+                rows = connection.execute(_SELECT_ENTITIES.format(placeholders), (namespace, min_updated_at, *chunk))
+                entities.update((key, json.loads(data)) for key, data in rows)
+
+        return entities
+
+    def set_many(self, namespace: str, entities: Dict[str, 'JSONType']) -> None:
+        """Сохранение объектов в базу.
+
+        Args:
+            namespace (:obj:`str`): Пространство имён объектов.
+            entities (:obj:`dict`): Объекты по ключам.
+        """
+        if not entities:
+            return
+
+        object_type = namespace.split('?')[0]
+        updated_at = time.time()
+
+        rows, relations = [], []
+        for key, data in entities.items():
+            revision = data.get('revision') if isinstance(data, dict) else None
+            revision = revision if isinstance(revision, int) else None
+            rows.append((namespace, key, object_type, revision, json.dumps(data, ensure_ascii=False), updated_at))
+            relations.extend((namespace, key, relation, related_id) for relation, related_id in _get_relations(data))
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany('INSERT OR REPLACE INTO entities VALUES (?, ?, ?, ?, ?, ?)', rows)
+                connection.executemany(
+                    'DELETE FROM relations WHERE namespace = ? AND key = ?', [row[:2] for row in rows]
+                )
+                connection.executemany('INSERT OR IGNORE INTO relations VALUES (?, ?, ?, ?)', relations)
+
+    def get_related(self, object_type: str, relation: str, related_id: str) -> List['JSONType']:
+        """Получение сохранённых объектов, связанных с исполнителем или альбомом.
+
+        Note:
+            Время жизни объектов не учитывается.
+
+        Args:
+            object_type (:obj:`str`): Тип объекта: `track`, `album`.
+            relation (:obj:`str`): Тип связи: `artist` или `album`.
+            related_id (:obj:`str`): Уникальный идентификатор исполнителя или альбома.
+
+        Returns:
+            :obj:`list`: Поля и значения найденных объектов, по одному на каждый ключ.
+        """
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    'SELECT entities.key, entities.data FROM relations '
+                    'JOIN entities ON entities.namespace = relations.namespace AND entities.key = relations.key '
+                    'WHERE relations.relation = ? AND relations.related_id = ? AND entities.object_type = ? '
+                    'ORDER BY entities.key, entities.updated_at DESC',
+                    (relation, str(related_id), object_type),
+                )
+                .fetchall()
+            )
+
+        entities = {}
+        for key, data in rows:
+            entities.setdefault(key, data)
+
+        return [json.loads(data) for data in entities.values()]
+
+    def clear(self) -> None:
+        """Удаление всех объектов из базы."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute('DELETE FROM entities')
+                connection.execute('DELETE FROM relations')
+
+    def close(self) -> None:
+        """Закрытие соединения с базой. При следующем обращении соединение откроется заново."""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+
+            self._connection = self._pid = None
@@ -0,0 +1,237 @@
+import contextlib
+from typing import TYPE_CHECKING, AsyncIterator, BinaryIO, ContextManager, List, Optional, Sequence, Tuple
+
+from aiohttp import web
+
+from yandex_music.exceptions import InvalidBitrateError, NotFoundError, YandexMusicError
+from yandex_music.utils.download_manager import DEFAULT_QUALITY, choose_download_info
+from yandex_music.utils.json_stream import STREAM_CHUNK_SIZE
+
+if TYPE_CHECKING:
+    from yandex_music import ClientAsync, DownloadInfo
+
+#: MIME типы аудиофайлов по кодеку.
+CONTENT_TYPES = {'mp3': 'audio/mpeg', 'aac': 'audio/aac', 'he-aac': 'audio/aac', 'flac': 'audio/flac'}
+
+#: MIME тип файла с неизвестным кодеком.
+DEFAULT_CONTENT_TYPE = 'application/octet-stream'
+
+#: Адрес, на котором сервер принимает соединения по умолчанию.
+DEFAULT_HOST = '127.0.0.1'
+
+#: Статус ответа на запрос, клиент которого закрыл соединение до начала ответа (как у nginx).
+CLIENT_CLOSED_REQUEST = 499
+
+ContentRange = Tuple[int, Optional[int], Optional[int]]
+
+
+class TrackStreamServer:
+    """Класс, представляющий локальный HTTP сервер, который отдаёт треки по адресу `/track/{track_id}`.
+
+    Note:
+        Трек передаётся по мере получения из хранилища без накопления в памяти. Запросы к API и хранилищу идут через
+        асинхронный клиент и используют его пул соединений.
+
+        Поддерживается запрос части трека (заголовок `Range`) с одним диапазоном. Диапазон передаётся хранилищу, а если
+        хранилище его не поддерживает, лишние байты отбрасываются сервером. Диапазон от конца файла (`bytes=-N`)
+        игнорируется, и трек отдаётся целиком, что допускается стандартом HTTP.
+
+        Если у клиента включён кэш аудиофайлов (`audio_cache`), трек, запрошенный с начала и до конца, сохраняется
+        в него по мере передачи. Треки из кэша отдаются из файла с помощью `sendfile` без обращения к API.
+
+    Args:
+        client (:obj:`yandex_music.ClientAsync`): Асинхронный клиент Yandex Music.
+        quality (:obj:`list` из :obj:`tuple`, optional): Пары кодека и битрейта по убыванию приоритета. Отдаётся
+            первый доступный для трека вариант.
+        chunk_size (:obj:`int`, optional): Размер читаемой из хранилища за раз части трека в байтах.
+    """
+
+    def __init__(
+        self,
+        client: 'ClientAsync',
+        quality: Sequence[Tuple[str, int]] = DEFAULT_QUALITY,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> None:
+        self.client = client
+        self.quality = quality
+        self.chunk_size = chunk_size
+        self.url: Optional[str] = None
+
+        self.app = web.Application()
+        self.app.router.add_get(r'/track/{track_id:[\w:-]+}', self.handle_track)
+
+        self._runner: Optional[web.AppRunner] = None
+
+    def _find_cached(self, track_id: str) -> Optional[Tuple[str, str]]:
+        audio_cache = getattr(self.client, 'audio_cache', None)
+        if audio_cache is None:
+            return None
+
+        for codec, bitrate_in_kbps in self.quality:
+            filename = audio_cache.get(track_id, codec, bitrate_in_kbps)
+            if filename is not None:
+                return filename, codec
+
+        return None
+
+    @staticmethod
+    async def _prepare_response(
+        request: web.Request, codec: str, content_range: ContentRange, partial: bool
+    ) -> web.StreamResponse:
+        start, stop, total = content_range
+
+        response = web.StreamResponse(status=206 if partial else 200)
+        response.content_type = CONTENT_TYPES.get(codec, DEFAULT_CONTENT_TYPE)
+        response.headers['Accept-Ranges'] = 'bytes'
+
+        if partial:
+            stop = total if stop is None else stop
+            if stop is None:
+                raise web.HTTPBadGateway(text='Unknown content length')
+
+            response.headers['Content-Range'] = f'bytes {start}-{stop - 1}/{"*" if total is None else total}'
+
+        if stop is not None:
+            response.content_length = stop - start
+
+        await response.prepare(request)
+        return response
+
+    @staticmethod
+    def _parse_range(request: web.Request) -> Tuple[int, Optional[int], bool]:
+        try:
+            http_range = request.http_range
+        except ValueError:
+            raise web.HTTPRequestRangeNotSatisfiable from None
+
+        # диапазон от конца файла игнорируется
+        if http_range.start is None or http_range.start < 0:
+            return 0, None, False
+
+        return http_range.start, http_range.stop, True
+
+    async def _get_direct_link(self, track_id: str) -> Tuple['DownloadInfo', str]:
+        try:
+            info = choose_download_info(await self.client.tracks_download_info(track_id), self.quality)
+            return info, await info.get_direct_link_async()
+        except (NotFoundError, InvalidBitrateError):
+            raise web.HTTPNotFound from None
+        except YandexMusicError as e:
+            raise web.HTTPBadGateway(text=str(e)) from e
+
+    async def _send(
+        self,
+        request: web.Request,
+        codec: str,
+        chunks: AsyncIterator[bytes],
+        content_ranges: List[ContentRange],
+        partial: bool,
+        writer: ContextManager[Optional[BinaryIO]],
+    ) -> web.StreamResponse:
+        response: Optional[web.StreamResponse] = None
+        try:
+            # при исключении, в том числе при обрыве соединения, недописанный файл кэша удаляется
+            with writer as part:
+                async for chunk in chunks:
+                    if response is None:
+                        response = await self._prepare_response(request, codec, content_ranges[0], partial)
+                        if request.method == 'HEAD':
+                            break
+
+                    await response.write(chunk)
+                    if part is not None:
+                        part.write(chunk)
+
+                if response is None:
+                    response = await self._prepare_response(request, codec, content_ranges[0], partial)
+
+                await response.write_eof()
+        except YandexMusicError as e:
+            # после начала ответа статус уже не изменить, остаётся только оборвать соединение
+            if response is None:
+                raise web.HTTPBadGateway(text=str(e)) from e
+            raise
+        except ConnectionResetError:
+            # клиент закрыл соединение, например, при перемотке. Отправить ответ уже нельзя, но обработчик должен
+            # его вернуть, даже если соединение закрылось до отправки заголовков
+            if response is None:
+                response = web.Response(status=CLIENT_CLOSED_REQUEST, reason='Client Closed Request')
+
+        return response
+
+    async def handle_track(self, request: web.Request) -> web.StreamResponse:
+        """Обработчик запроса трека.
+
+        Args:
+            request (:obj:`aiohttp.web.Request`): Запрос.
+
+        Returns:
+            :obj:`aiohttp.web.StreamResponse`: Ответ с треком или его частью.
+
+        Raises:
+            :class:`aiohttp.web.HTTPNotFound`: Если трек не найден или для него нет вариантов из `quality`.
+            :class:`aiohttp.web.HTTPRequestRangeNotSatisfiable`: При некорректном заголовке `Range`.
+            :class:`aiohttp.web.HTTPBadGateway`: Если не удалось получить трек до начала ответа.
+        """
+        track_id = request.match_info['track_id']
+
+        cached = self._find_cached(track_id)
+        if cached is not None:
+            filename, codec = cached
+            return web.FileResponse(filename, headers={'Content-Type': CONTENT_TYPES.get(codec, DEFAULT_CONTENT_TYPE)})
+
+        offset, end, partial = self._parse_range(request)
+        info, direct_link = await self._get_direct_link(track_id)
+
+        content_ranges: List[ContentRange] = []
+
+        def on_content_range(start: int, stop: Optional[int], total: Optional[int]) -> None:
+            content_ranges.append((start, stop, total))
+
+        chunks = self.client.request.retrieve_stream(
+            direct_link, chunk_size=self.chunk_size, offset=offset, end=end, on_content_range=on_content_range
+        )
+
+        # в кэш попадает только трек, запрошенный и переданный целиком
+        audio_cache = getattr(self.client, 'audio_cache', None)
+        writer: ContextManager[Optional[BinaryIO]] = contextlib.nullcontext()
+        if audio_cache is not None and offset == 0 and end is None and request.method != 'HEAD':
+            writer = audio_cache.writer(track_id, info.codec, info.bitrate_in_kbps)
+
+        try:
+            return await self._send(request, info.codec, chunks, content_ranges, partial, writer)
+        finally:
+            await chunks.aclose()
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = 0) -> str:
+        """Запуск сервера.
+
+        Args:
+            host (:obj:`str`, optional): Адрес, на котором принимаются соединения.
+            port (:obj:`int`, optional): Порт. По умолчанию выбирается любой свободный.
+
+        Returns:
+            :obj:`str`: Адрес сервера, к которому нужно добавить `/track/{track_id}`.
+        """
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+
+        host, port = self._runner.addresses[0][:2]
+        self.url = f'http://{host}:{port}'
+
+        return self.url
+
+    async def stop(self) -> None:
+        """Остановка сервера."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            self.url = None
+
+    async def __aenter__(self) -> 'TrackStreamServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.stop()
@@ -0,0 +1,140 @@
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple, Union
+
+from yandex_music.utils.entity_cache import entity_key
+from yandex_music.utils.response_format import MODEL_FORMAT, current_response_format
+
+if TYPE_CHECKING:
+    from yandex_music import ClientAsync, Track, TrackShort
+
+#: Максимальное количество треков в одном объединённом запросе по умолчанию.
+TRACK_BATCH_SIZE = 1000
+
+
+def fill_tracks(tracks_short: List['TrackShort'], tracks: List['Track']) -> List['TrackShort']:
+    """Заполнение полных версий треков у укороченных.
+
+    Note:
+        Треки сопоставляются по номеру без учёта альбома. Укороченные треки, полной версии которых нет в `tracks`,
+        не изменяются.
+
+    Args:
+        tracks_short (:obj:`list` из :obj:`yandex_music.TrackShort`): Треки в укороченной версии.
+        tracks (:obj:`list` из :obj:`yandex_music.Track`): Полные версии треков.
+
+    Returns:
+        :obj:`list` из :obj:`yandex_music.TrackShort`: Те же треки в укороченной версии.
+    """
+    by_key = {entity_key('track', track.id): track for track in tracks}
+    for track_short in tracks_short:
+        track = by_key.get(entity_key('track', track_short.id))
+        if track is not None:
+            track_short.track = track
+
+    return tracks_short
+
+
+class _Batch:
+    __slots__ = ('client', 'handle', 'items')
+
+    def __init__(self, client: 'ClientAsync', handle: asyncio.TimerHandle) -> None:
+        self.client = client
+        self.handle = handle
+        self.items: List[Tuple[str, asyncio.Future]] = []
+
+
+class TrackLoader:
+    """Класс, представляющий загрузчик треков, объединяющий одновременные запросы отдельных треков.
+
+    Note:
+        Идентификаторы треков, запрошенные через :func:`load` в одной итерации цикла событий (или в течение `delay`
+        секунд после первого из них), запрашиваются одним вызовом :func:`yandex_music.ClientAsync.tracks`.
+        Повторяющиеся идентификаторы запрашиваются один раз. Ошибка запроса передаётся всем ожидающим его вызовам,
+        а для трека, которого нет в ответе, вызывается :class:`IndexError`, как и без объединения.
+
+        Загрузчик используется асинхронным клиентом в `fetch_track_async` треков без дополнительных аргументов.
+        Если формат ответов клиента не `model`, каждый трек запрашивается отдельно.
+
+    Args:
+        delay (:obj:`float`, optional): Сколько секунд собирать идентификаторы перед отправкой запроса.
+        max_batch_size (:obj:`int`, optional): Максимальное количество треков в одном запросе. Запрос отправляется
+            сразу после того, как набралось столько треков.
+    """
+
+    def __init__(self, delay: float = 0, max_batch_size: int = TRACK_BATCH_SIZE) -> None:
+        self.delay = delay
+        self.max_batch_size = max_batch_size
+
+        self._batches: Dict[Tuple[int, int], _Batch] = {}
+        self._tasks: Set[asyncio.Future] = set()
+
+    async def load(self, client: 'ClientAsync', track_id: Union[str, int]) -> 'Track':
+        """Получение полной версии трека вместе с другими запрошенными треками.
+
+        Args:
+            client (:obj:`yandex_music.ClientAsync`): Клиент Yandex Music.
+            track_id (:obj:`str` | :obj:`int`): Уникальный идентификатор трека.
+
+        Returns:
+            :obj:`yandex_music.Track`: Полная версия трека.
+
+        Raises:
+            :class:`yandex_music.exceptions.YandexMusicError`: Базовое исключение библиотеки.
+        """
+        # объединяются только запросы моделей
+        if (current_response_format.get() or client.response_format) != MODEL_FORMAT:
+            return (await client.tracks(track_id))[0]
+
+        loop = asyncio.get_running_loop()
+        key = (id(client), id(loop))
+
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _Batch(client, loop.call_later(self.delay, self._dispatch, key))
+
+        future = loop.create_future()
+        batch.items.append((str(track_id), future))
+        if len(batch.items) >= self.max_batch_size:
+            batch.handle.cancel()
+            self._dispatch(key)
+
+        return await future
+
+    def _dispatch(self, key: Tuple[int, int]) -> None:
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+
+        task = asyncio.ensure_future(self._fetch(batch))
+        # цикл событий хранит только слабые ссылки на задачи
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _fetch(batch: _Batch) -> None:
+        futures = [future for _, future in batch.items]
+        # задача наследует контекст первого вызова, а объединять можно только модели
+        current_response_format.set(MODEL_FORMAT)
+
+        try:
+            tracks = await batch.client.tracks(list(dict.fromkeys(track_id for track_id, _ in batch.items)))
+        except asyncio.CancelledError:
+            for future in futures:
+                future.cancel()
+            raise
+        except Exception as e:  # noqa: BLE001
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_key = {entity_key('track', track.id): track for track in tracks}
+        for track_id, future in batch.items:
+            if future.done():
+                continue
+
+            track = by_key.get(entity_key('track', track_id))
+            if track is None:
+                future.set_exception(IndexError(f'Track {track_id} not found'))
+            else:
+                future.set_result(track)